@@ -0,0 +1,5 @@
+-- Partial covering index for the alert monitor's approved high-confidence scan
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_detections_recent_approved
+  ON detections (detected_at DESC)
+  INCLUDE (confidence, platform, url, title, decision)
+  WHERE decision = 'approve';
@@ -0,0 +1,27 @@
+-- One detection per (platform, url), matching uq_detections_platform_url in the ORM
+-- model; bulk inserts rely on it to skip URLs that are already stored
+BEGIN;
+
+-- Keep writers out while duplicates are removed and the constraint is added
+LOCK TABLE detections IN SHARE ROW EXCLUSIVE MODE;
+
+-- Keep the oldest row of each duplicate group
+DELETE FROM detections d
+USING detections older
+WHERE d.platform = older.platform
+  AND d.url = older.url
+  AND d.id > older.id;
+
+DO $$
+BEGIN
+  IF NOT EXISTS (
+    SELECT 1 FROM pg_constraint
+    WHERE conname = 'uq_detections_platform_url'
+      AND conrelid = 'detections'::regclass
+  ) THEN
+    ALTER TABLE detections
+      ADD CONSTRAINT uq_detections_platform_url UNIQUE (platform, url);
+  END IF;
+END $$;
+
+COMMIT;
@@ -16,6 +16,8 @@ done
 
 echo "Applying migrations..."
 psql -h "$PGHOST" -p "$PGPORT" -U "$PGUSER" -d "$PGDATABASE" -f migrations/001_init.sql
+psql -h "$PGHOST" -p "$PGPORT" -U "$PGUSER" -d "$PGDATABASE" -f migrations/002_detections_recent_approved_idx.sql
+psql -h "$PGHOST" -p "$PGPORT" -U "$PGUSER" -d "$PGDATABASE" -f migrations/003_detections_platform_url_unique.sql
 echo "Migrations applied."
 
 
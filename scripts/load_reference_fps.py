@@ -4,12 +4,30 @@ import json
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import psycopg
 
+# Allow running as `python scripts/load_reference_fps.py` from the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from src.shared.redis_client import bump_reference_version  # noqa: E402
+
+try:
+    import acoustid
+except ImportError:  # pyacoustid is optional; fall back to the fpcalc binary
+    acoustid = None
+
+# Rows staged per COPY round-trip; keeps the temp table and client buffer bounded.
+BATCH_SIZE = 10_000
+
 
 def compute_audio_fp(path: Path) -> str:
+    if acoustid is not None:
+        # Uses libchromaprint in-process when available, avoiding a fork/exec per file.
+        _duration, fingerprint = acoustid.fingerprint_file(str(path))
+        return fingerprint.decode() if isinstance(fingerprint, bytes) else fingerprint
+
     result = subprocess.run(["fpcalc", "-json", str(path)], capture_output=True, text=True)
     if result.returncode != 0:
         raise RuntimeError(f"fpcalc failed: {result.stderr}")
@@ -17,10 +35,36 @@ def compute_audio_fp(path: Path) -> str:
     return data.get("fingerprint", "")
 
 
+def insert_fingerprints(cur: psycopg.Cursor, rows: list[tuple[str, str, str]]) -> None:
+    cur.execute(
+        """
+        CREATE TEMP TABLE IF NOT EXISTS staging_reference_fingerprints
+            (content_id TEXT, kind TEXT, hash TEXT)
+        ON COMMIT DELETE ROWS
+        """
+    )
+    with cur.copy(
+        "COPY staging_reference_fingerprints (content_id, kind, hash) FROM STDIN"
+    ) as copy:
+        for row in rows:
+            copy.write_row(row)
+    cur.execute(
+        """
+        INSERT INTO reference_fingerprints(content_id, kind, hash)
+        SELECT content_id, kind, hash FROM staging_reference_fingerprints
+        ON CONFLICT DO NOTHING
+        """
+    )
+    cur.execute("TRUNCATE staging_reference_fingerprints")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--path", required=True, help="Directory with official clips")
     parser.add_argument("--content-id", help="Override content id for all")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="Concurrent fingerprint jobs"
+    )
     args = parser.parse_args()
 
     pg_host = os.getenv("PGHOST", "postgres")
@@ -38,25 +82,28 @@ def main() -> None:
         host=pg_host, port=pg_port, dbname=pg_db, user=pg_user, password=pg_pass
     ) as conn:
         with conn.cursor() as cur:
-            for file in source_dir.iterdir():
-                if not file.is_file():
-                    continue
-                cid = args.content_id or file.stem
-                try:
-                    audio_fp = compute_audio_fp(file)
-                except Exception as e:  # noqa: BLE001
-                    print(f"Skipping {file}: {e}", file=sys.stderr)
-                    continue
-
-                cur.execute(
-                    """
-                    INSERT INTO reference_fingerprints(content_id, kind, hash)
-                    VALUES (%s, 'audio', %s)
-                    ON CONFLICT DO NOTHING
-                    """,
-                    (cid, audio_fp),
-                )
+            rows: list[tuple[str, str, str]] = []
+            files = [file for file in source_dir.iterdir() if file.is_file()]
+            with ThreadPoolExecutor(max_workers=args.workers) as pool:
+                futures = {pool.submit(compute_audio_fp, file): file for file in files}
+                for future in as_completed(futures):
+                    file = futures[future]
+                    cid = args.content_id or file.stem
+                    try:
+                        audio_fp = future.result()
+                    except Exception as e:  # noqa: BLE001
+                        print(f"Skipping {file}: {e}", file=sys.stderr)
+                        continue
+
+                    rows.append((cid, "audio", audio_fp))
+                    if len(rows) >= BATCH_SIZE:
+                        insert_fingerprints(cur, rows)
+                        rows.clear()
+            if rows:
+                insert_fingerprints(cur, rows)
             conn.commit()
+    # Cached match analyses were computed against the old reference set
+    bump_reference_version()
     print("Loaded reference audio fingerprints.")
 
 
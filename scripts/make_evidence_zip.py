@@ -1,16 +1,59 @@
 #!/usr/bin/env python3
 import argparse
 import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from zipfile import ZipFile, ZIP_DEFLATED
+from typing import IO, Any, Iterator
+from zipfile import ZipFile, ZipInfo, ZIP_DEFLATED, ZIP_STORED
 
 import boto3
 
+# Copy buffer for streaming object bodies into the archive.
+CHUNK_SIZE = 1 << 20
+# Memory shared by all queued downloads: each body stays in memory up to
+# SPOOL_BUDGET / in-flight downloads, then spills to a temp file. Peak memory for
+# object bodies is about SPOOL_BUDGET plus one CHUNK_SIZE copy buffer per worker.
+SPOOL_BUDGET = 32 << 20
+# Media and archives are already compressed; deflating them burns CPU for nothing.
+STORED_PREFIXES = ("video/", "image/", "audio/")
+STORED_TYPES = {"application/zip", "application/gzip", "application/x-7z-compressed"}
+COMPRESSIBLE_TYPES = {"image/svg+xml", "image/bmp"}
+
+
+def compression_for(content_type: str) -> int:
+    content_type = content_type.split(";", 1)[0].strip().lower()
+    if content_type in COMPRESSIBLE_TYPES:
+        return ZIP_DEFLATED
+    if content_type.startswith(STORED_PREFIXES) or content_type in STORED_TYPES:
+        return ZIP_STORED
+    return ZIP_DEFLATED
+
+
+def fetch_object(s3: Any, bucket: str, key: str, spool_size: int) -> tuple[IO[bytes], str]:
+    buf = tempfile.SpooledTemporaryFile(max_size=spool_size)
+    obj = s3.get_object(Bucket=bucket, Key=key)
+    shutil.copyfileobj(obj["Body"], buf, length=CHUNK_SIZE)
+    buf.seek(0)
+    return buf, obj.get("ContentType", "")
+
+
+def iter_keys(s3: Any, bucket: str, prefix: str) -> Iterator[str]:
+    paginator = s3.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        for obj in page.get("Contents", []):
+            yield obj["Key"]
+
 
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--key", required=True, help="Evidence key/prefix in S3 bucket")
     parser.add_argument("--output", required=True, help="Path to output zip")
+    parser.add_argument("--workers", type=int, default=32, help="Concurrent S3 downloads")
     args = parser.parse_args()
 
     s3_endpoint = os.getenv("S3_ENDPOINT", "http://minio:9000")
@@ -27,19 +70,42 @@ def main() -> None:
     )
 
     prefix = args.key.rstrip("/") + "/"
-    paginator = s3.get_paginator("list_objects_v2")
-    to_download: list[str] = []
-    for page in paginator.paginate(Bucket=s3_bucket, Prefix=prefix):
-        for obj in page.get("Contents", []):
-            to_download.append(obj["Key"])
-
     out_path = Path(args.output)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with ZipFile(out_path, "w", ZIP_DEFLATED) as zf:
-        for key in to_download:
-            body = s3.get_object(Bucket=s3_bucket, Key=key)["Body"].read()
+    with (
+        ZipFile(out_path, "w", ZIP_DEFLATED, compresslevel=1) as zf,
+        ThreadPoolExecutor(max_workers=args.workers) as pool,
+    ):
+        # Downloads start while later pages are still being listed; ZipFile is
+        # not thread-safe, so only this thread writes, consuming results in
+        # submission order. In-flight downloads share SPOOL_BUDGET, so the
+        # memory bound does not grow with --workers.
+        max_in_flight = args.workers * 2
+        spool_size = SPOOL_BUDGET // max_in_flight
+        pending: deque = deque()
+
+        def write_next() -> None:
+            key, future = pending.popleft()
             arcname = key[len(prefix) :]
-            zf.writestr(arcname, body)
+            src, content_type = future.result()
+            info = ZipInfo(arcname, date_time=time.localtime()[:6])
+            info.compress_type = compression_for(content_type)
+            # Keep the archive's level 1. writestr() would take the level, but it
+            # needs the whole body in memory, and spooled bodies may be on disk.
+            if sys.version_info >= (3, 13):
+                info.compress_level = zf.compresslevel
+            else:
+                # The only way to set the level before 3.13; fixed for those releases
+                info._compresslevel = zf.compresslevel
+            with src, zf.open(info, "w", force_zip64=True) as dst:
+                shutil.copyfileobj(src, dst, length=CHUNK_SIZE)
+
+        for key in iter_keys(s3, s3_bucket, prefix):
+            pending.append((key, pool.submit(fetch_object, s3, s3_bucket, key, spool_size)))
+            if len(pending) >= max_in_flight:
+                write_next()
+        while pending:
+            write_next()
     print(f"Wrote {out_path}")
 
 
@@ -4,15 +4,21 @@ Script to set up realistic reference content for the Tapmad Anti-Piracy system.
 This adds sample reference fingerprints to enable proper content matching.
 """
 
-import psycopg2
+import psycopg
 import os
+import sys
 from datetime import datetime
+from pathlib import Path
+
+# Allow running as `python scripts/setup_reference_content.py` from the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from src.shared.redis_client import bump_reference_version
 
 # Database connection
 DB_CONFIG = {
     'host': os.getenv('PGHOST', 'localhost'),
     'port': os.getenv('PGPORT', '5432'),
-    'database': os.getenv('PGDATABASE', 'antipiracy'),
+    'dbname': os.getenv('PGDATABASE', 'antipiracy'),
     'user': os.getenv('PGUSER', 'postgres'),
     'password': os.getenv('PGPASSWORD', 'postgres')
 }
@@ -70,33 +76,33 @@ REFERENCE_CONTENT = [
 def setup_reference_content():
     """Add reference content to the database."""
     try:
-        conn = psycopg2.connect(**DB_CONFIG)
+        conn = psycopg.connect(**DB_CONFIG)
         cur = conn.cursor()
         
-        print(f"Connected to database: {DB_CONFIG['database']}")
+        print(f"Connected to database: {DB_CONFIG['dbname']}")
+        
+        rows = [(c['content_id'], 'video', c['video_hash']) for c in REFERENCE_CONTENT]
+        rows += [(c['content_id'], 'audio', c['audio_hash']) for c in REFERENCE_CONTENT]
         
-        # Clear existing reference content
-        cur.execute("DELETE FROM reference_fingerprints")
+        # Pipeline mode sends the DELETE and all INSERTs without waiting for
+        # each response, so the whole seed costs roughly one round trip
+        with conn.pipeline():
+            # Clear existing reference content
+            cur.execute("DELETE FROM reference_fingerprints")
+            
+            # Add new reference content
+            cur.executemany(
+                "INSERT INTO reference_fingerprints (content_id, kind, hash) VALUES (%s, %s, %s)",
+                rows
+            )
         print("Cleared existing reference fingerprints")
         
-        # Add new reference content
         for content in REFERENCE_CONTENT:
-            # Add video fingerprint
-            cur.execute("""
-                INSERT INTO reference_fingerprints (content_id, kind, hash) 
-                VALUES (%s, %s, %s)
-            """, (content['content_id'], 'video', content['video_hash']))
-            
-            # Add audio fingerprint
-            cur.execute("""
-                INSERT INTO reference_fingerprints (content_id, kind, hash) 
-                VALUES (%s, %s, %s)
-            """, (content['content_id'], 'audio', content['audio_hash']))
-            
             print(f"Added: {content['description']}")
         
         # Commit changes
         conn.commit()
+        bump_reference_version()
         print(f"\nSuccessfully added {len(REFERENCE_CONTENT)} reference content items")
         
         # Verify
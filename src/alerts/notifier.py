@@ -4,17 +4,65 @@ import json
 import time
 from typing import Dict, Any, List
 import logging
-from datetime import datetime, timedelta
 
-from ..shared.redis_client import get_redis
-from ..shared.db import db_cursor
+from sqlalchemy import text
+
+from ..shared.redis_client import get_redis, get_redis_bytes, DETECTION_EVENTS_CHANNEL
+from ..shared.database import get_db_session
 from ..shared.config import settings
 
+try:
+    import orjson
+    _dumps, _loads = orjson.dumps, orjson.loads
+except ImportError:
+    _dumps, _loads = json.dumps, json.loads
+
+# Alert payloads are written once and read back many times; msgpack is
+# smaller and faster to decode than JSON
+try:
+    import msgpack
+
+    def _pack(obj: Dict[str, Any]) -> bytes:
+        return msgpack.packb(obj, use_bin_type=True)
+
+    def _unpack(raw: bytes) -> Dict[str, Any]:
+        return msgpack.unpackb(raw, raw=False)
+except ImportError:
+    _pack, _unpack = _dumps, _loads
+
 logger = logging.getLogger(__name__)
 
+# Highest detection id already alerted on, so each tick only scans newer rows
+LAST_DETECTION_ID_KEY = "ap:alerts:last_detection_id"
+
+# Alert ids scored by timestamp; a new key since the old list type would clash
+ALERT_INDEX_KEY = "ap:alerts:by_time"
+ALERT_RETENTION_SECONDS = 86400
+MAX_ALERTS = 1000
+
+# Alert ids awaiting delivery to external notification services
+OUTBOUND_ALERTS_KEY = "ap:alerts:outbound"
+
+# Allocates the alert id, stores the payload, indexes it by timestamp, drops
+# entries older than the retention window and queues it for delivery, all in
+# one round trip
+_STORE_ALERT_LUA = """
+local alert_id = redis.call('INCR', KEYS[1])
+local now = tonumber(ARGV[3])
+local retention = tonumber(ARGV[4])
+redis.call('SET', ARGV[1] .. alert_id, ARGV[2], 'EX', retention)
+redis.call('ZADD', KEYS[2], now, alert_id)
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now - retention)
+redis.call('ZREMRANGEBYRANK', KEYS[2], 0, -(tonumber(ARGV[5]) + 1))
+redis.call('LPUSH', KEYS[3], alert_id)
+return alert_id
+"""
+
 class AlertNotifier:
     def __init__(self):
         self.redis = get_redis()
+        self.redis_bytes = get_redis_bytes()
+        self._store_alert = self.redis.register_script(_STORE_ALERT_LUA)
         self.alert_channels = {
             "high_confidence": 0.9,
             "medium_confidence": 0.7,
@@ -32,16 +80,20 @@ class AlertNotifier:
         }
         
         # Store alert in Redis
-        alert_id = self.redis.incr("ap:alerts:id_seq")
-        self.redis.set(f"ap:alert:{alert_id}", json.dumps(alert), ex=86400)  # 24 hours
-        self.redis.lpush("ap:alerts", alert_id)
-        self.redis.ltrim("ap:alerts", 0, 999)  # Keep last 1000 alerts
+        self._store_alert(
+            keys=["ap:alerts:id_seq", ALERT_INDEX_KEY, OUTBOUND_ALERTS_KEY],
+            args=["ap:alert:", _pack(alert), alert["timestamp"],
+                  ALERT_RETENTION_SECONDS, MAX_ALERTS],
+        )
         
-        # Log alert
+        # Log alert; external delivery happens off the outbound queue
         logger.warning(f"ALERT [{alert_type}]: {message}")
-        
-        # TODO: Send to external notification services (Slack, Email, etc.)
-        self._send_external_notification(alert)
+    
+    def deliver_alert(self, alert_id: str):
+        """Deliver a queued alert to external notification services"""
+        payload = self.redis_bytes.get(f"ap:alert:{alert_id}")
+        if payload:
+            self._send_external_notification(_unpack(payload))
     
     def _send_external_notification(self, alert: Dict[str, Any]):
         """Send alert to external notification services"""
@@ -49,48 +101,41 @@ class AlertNotifier:
         # For now, just log the alert
         logger.info(f"External notification: {alert['type']} - {alert['message']}")
     
-    def check_high_confidence_detections(self):
+    def check_high_confidence_detections(self, detections: List[tuple] = None):
         """Check for high-confidence piracy detections"""
         try:
-            with db_cursor() as cur:
-                # Check for recent high-confidence detections
-                cur.execute("""
-                    SELECT id, platform, url, title, confidence, decision 
-                    FROM detections 
-                    WHERE confidence >= %s 
-                    AND detected_at > %s
-                    ORDER BY detected_at DESC
-                """, (self.alert_channels["high_confidence"], 
-                      datetime.now() - timedelta(hours=1)))
-                
-                high_conf_detections = cur.fetchall()
+            if detections is None:
+                detections, _ = self._fetch_recent_activity(self.redis.get(LAST_DETECTION_ID_KEY))
+            
+            for detection in detections:
+                det_id, platform, url, title, confidence, decision = detection
                 
-                for detection in high_conf_detections:
-                    det_id, platform, url, title, confidence, decision = detection
-                    
-                    if decision == "approve":
-                        self.send_alert(
-                            "high_confidence_piracy",
-                            f"High-confidence piracy detected on {platform}",
-                            {
-                                "detection_id": det_id,
-                                "platform": platform,
-                                "url": url,
-                                "title": title,
-                                "confidence": confidence,
-                                "decision": decision
-                            }
-                        )
+                self.send_alert(
+                    "high_confidence_piracy",
+                    f"High-confidence piracy detected on {platform}",
+                    {
+                        "detection_id": det_id,
+                        "platform": platform,
+                        "url": url,
+                        "title": title,
+                        "confidence": confidence,
+                        "decision": decision
+                    }
+                )
+            
+            if detections:
+                self.redis.set(LAST_DETECTION_ID_KEY, max(detection[0] for detection in detections))
         
         except Exception as e:
             logger.error(f"Failed to check high-confidence detections: {e}")
     
-    def check_system_health_alerts(self):
+    def check_system_health_alerts(self, health_data: str = None):
         """Check system health and send alerts if needed"""
         try:
-            health_data = self.redis.get("ap:health")
+            if health_data is None:
+                health_data = self.redis.get("ap:health")
             if health_data:
-                health = json.loads(health_data)
+                health = _loads(health_data)
                 
                 if health.get("status") == "degraded":
                     self.send_alert(
@@ -112,10 +157,11 @@ class AlertNotifier:
         except Exception as e:
             logger.error(f"Failed to check system health: {e}")
     
-    def check_processing_backlog(self):
+    def check_processing_backlog(self, queued_count: int = None):
         """Check if there's a backlog in candidate processing"""
         try:
-            queued_count = self.redis.llen("ap:candidates")
+            if queued_count is None:
+                queued_count = self.redis.llen("ap:candidates")
             
             if queued_count > 100:
                 self.send_alert(
@@ -127,44 +173,61 @@ class AlertNotifier:
         except Exception as e:
             logger.error(f"Failed to check processing backlog: {e}")
     
-    def check_new_platform_activity(self):
+    def check_new_platform_activity(self, platform_activity: List[tuple] = None):
         """Check for activity on new platforms"""
         try:
-            with db_cursor() as cur:
-                # Check for detections from new platforms in the last hour
-                cur.execute("""
-                    SELECT platform, COUNT(*) as count
-                    FROM detections 
-                    WHERE detected_at > %s
-                    GROUP BY platform
-                    ORDER BY count DESC
-                """, (datetime.now() - timedelta(hours=1),))
-                
-                platform_activity = cur.fetchall()
-                
-                for platform, count in platform_activity:
-                    if count > 10:  # High activity threshold
-                        self.send_alert(
-                            "high_platform_activity",
-                            f"High activity detected on {platform}: {count} detections",
-                            {"platform": platform, "count": count}
-                        )
+            if platform_activity is None:
+                _, platform_activity = self._fetch_recent_activity()
+            
+            for platform, count in platform_activity:
+                if count > 10:  # High activity threshold
+                    self.send_alert(
+                        "high_platform_activity",
+                        f"High activity detected on {platform}: {count} detections",
+                        {"platform": platform, "count": count}
+                    )
         
         except Exception as e:
             logger.error(f"Failed to check platform activity: {e}")
     
+    def _fetch_recent_activity(self, last_seen_id: int = None) -> tuple[List[tuple], List[tuple]]:
+        """Fetch new approved high-confidence detections and last hour's per-platform counts"""
+        with get_db_session() as session:
+            rows = session.execute(text("""
+                SELECT 'detection', id, platform, url, title, confidence, decision, detected_at
+                FROM detections
+                WHERE decision = 'approve'
+                AND id > :last_seen_id
+                AND detected_at > NOW() - INTERVAL '1 hour'
+                AND confidence >= :min_confidence
+                UNION ALL
+                SELECT 'platform', COUNT(*), platform, NULL, NULL, NULL, NULL, MAX(detected_at)
+                FROM detections
+                WHERE detected_at > NOW() - INTERVAL '1 hour'
+                GROUP BY platform
+                ORDER BY 8 DESC
+            """), {
+                "last_seen_id": int(last_seen_id or 0),
+                "min_confidence": self.alert_channels["high_confidence"],
+            }).all()
+        
+        detections = [row[1:7] for row in rows if row[0] == "detection"]
+        platform_activity = sorted(
+            ((row[2], row[1]) for row in rows if row[0] == "platform"),
+            key=lambda item: item[1],
+            reverse=True
+        )
+        return detections, platform_activity
+    
     def get_recent_alerts(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent alerts"""
         try:
-            alert_ids = self.redis.lrange("ap:alerts", 0, limit - 1)
-            alerts = []
+            alert_ids = self.redis.zrevrange(ALERT_INDEX_KEY, 0, limit - 1)
+            if not alert_ids:
+                return []
             
-            for alert_id in alert_ids:
-                alert_data = self.redis.get(f"ap:alert:{alert_id}")
-                if alert_data:
-                    alerts.append(json.loads(alert_data))
-            
-            return alerts
+            payloads = self.redis_bytes.mget([f"ap:alert:{alert_id}" for alert_id in alert_ids])
+            return [_unpack(payload) for payload in payloads if payload]
         
         except Exception as e:
             logger.error(f"Failed to get recent alerts: {e}")
@@ -174,10 +237,28 @@ class AlertNotifier:
         """Run all alert checks"""
         logger.info("Running alert checks")
         
-        self.check_high_confidence_detections()
-        self.check_system_health_alerts()
-        self.check_processing_backlog()
-        self.check_new_platform_activity()
+        try:
+            health_data, queued_count, last_seen_id = (
+                self.redis.pipeline(transaction=False)
+                .get("ap:health")
+                .llen("ap:candidates")
+                .get(LAST_DETECTION_ID_KEY)
+                .execute()
+            )
+        except Exception as e:
+            logger.error(f"Failed to read Redis health snapshot: {e}")
+            health_data, queued_count, last_seen_id = None, 0, None
+        
+        try:
+            detections, platform_activity = self._fetch_recent_activity(last_seen_id)
+        except Exception as e:
+            logger.error(f"Failed to fetch recent detections: {e}")
+            detections, platform_activity = [], []
+        
+        self.check_high_confidence_detections(detections)
+        self.check_system_health_alerts(health_data)
+        self.check_processing_backlog(queued_count)
+        self.check_new_platform_activity(platform_activity)
         
         logger.info("Alert checks complete")
 
@@ -190,17 +271,65 @@ class AlertManager:
         self.check_interval = 300  # 5 minutes
     
     def start_monitoring(self):
-        """Start the alert monitoring loop"""
+        """Run alert checks on detection events and deliver queued alerts"""
         import asyncio
+        from redis.asyncio import Redis as AsyncRedis
         
-        async def monitor_loop():
+        async def delivery_loop(client):
+            # Drain queued alerts so slow notification services never block checks
             while True:
+                alert_id = None
                 try:
-                    self.notifier.run_alert_checks()
-                    await asyncio.sleep(self.check_interval)
+                    _, alert_id = await client.brpop(OUTBOUND_ALERTS_KEY, timeout=0)
+                    await asyncio.to_thread(self.notifier.deliver_alert, alert_id)
                 except Exception as e:
-                    logger.error(f"Alert monitoring error: {e}")
-                    await asyncio.sleep(60)
+                    logger.error(f"Alert delivery error: {e}")
+                    await asyncio.sleep(5)
+                    if alert_id is not None:
+                        # Requeue at the consumer end so it is retried next
+                        try:
+                            await client.rpush(OUTBOUND_ALERTS_KEY, alert_id)
+                        except Exception as e:
+                            logger.error(f"Failed to requeue alert {alert_id}: {e}")
+        
+        async def monitor_loop():
+            client = AsyncRedis.from_url(settings.redis_url, decode_responses=True)
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            await pubsub.subscribe(DETECTION_EVENTS_CHANNEL)
+            delivery = asyncio.create_task(delivery_loop(client))
+            loop = asyncio.get_running_loop()
+            next_sweep = loop.time()
+            try:
+                while True:
+                    try:
+                        # Health, backlog and platform-activity alerts have no dedupe of
+                        # their own, so they only run on the check_interval timer
+                        if loop.time() >= next_sweep:
+                            await asyncio.to_thread(self.notifier.run_alert_checks)
+                            next_sweep = loop.time() + self.check_interval
+                            continue
+                        
+                        # Wake on the next detection event until the sweep is due
+                        message = await pubsub.get_message(
+                            timeout=max(next_sweep - loop.time(), 0)
+                        )
+                        if message is None:
+                            continue
+                        
+                        # Collapse a burst of events into a single check run
+                        while message is not None:
+                            message = await pubsub.get_message(timeout=0)
+                        
+                        # Only new high-confidence detections react to events; the
+                        # last-seen watermark keeps each from alerting twice
+                        await asyncio.to_thread(self.notifier.check_high_confidence_detections)
+                    except Exception as e:
+                        logger.error(f"Alert monitoring error: {e}")
+                        await asyncio.sleep(60)
+            finally:
+                delivery.cancel()
+                await pubsub.aclose()
+                await client.aclose()
         
         asyncio.run(monitor_loop())
 
@@ -1,39 +1,108 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import inspect
 import json
+import logging
 import time
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
 from typing import Annotated
 
-from fastapi import FastAPI, HTTPException, Request, Header
+import anyio
+import orjson
+from fastapi import FastAPI, Header, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from fastapi.routing import APIRoute
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
+from .cache import redis_cached
 from ..shared.config import settings
-from ..shared.database import insert_detection, get_detections, get_detection_by_id, get_database_info, get_db_session
-from ..db.models import Detection, Evidence
+from ..shared.metrics import setup_logging
+from ..shared.redis_client import get_async_redis, close_async_redis
+from ..shared.database import (
+    insert_detection, get_detections, get_detection_by_id, get_database_info, get_db_session,
+    get_detection_aggregates, iter_detections,
+)
+from ..db.models import Detection
 from ..llm.llm_client import LLMClient
-from ..capture.grab import capture_detection
+from ..capture.grab import capture_detection, capture_detection_async
 from ..match.engine import MatchingEngine
 from ..enforce.emailer import DMCAEnforcer
 from ..crawler.platforms.youtube import crawl_youtube_content
-from ..models.schemas import CrawlRequest, APIResponse, FingerprintRequest
+from ..models.schemas import (
+    CrawlRequest, APIResponse, FingerprintRequest, MatchAnalyzeRequest, MatchDecideRequest,
+    LLMChatRequest, DMCARequest, PipelineRequest, ChatRequest,
+)
+
+logger = logging.getLogger(__name__)
+
+API_VERSION = "1.0.0"
+
+# Threads available for blocking DB, crawler, LLM and SMTP calls
+THREADPOOL_SIZE = 64
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Configure logging, size thread pools and warm services before accepting traffic"""
+    setup_logging(settings.log_level, settings.log_format)
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=THREADPOOL_SIZE)
+    )
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
+    results = await asyncio.gather(
+        asyncio.to_thread(llm_client.warmup),
+        asyncio.to_thread(matching_engine.warmup),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning(f"Service warmup failed: {result}")
+
+    yield
+
+    await close_async_redis()
+
+class ORJSONRequest(Request):
+    """Request whose JSON body is parsed once with orjson"""
+    
+    async def json(self):
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+class ORJSONRoute(APIRoute):
+    """Route that hands handlers an ORJSONRequest for body parsing"""
+    
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+        
+        async def route_handler(request: Request):
+            return await handler(ORJSONRequest(request.scope, request.receive))
+        
+        return route_handler
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Tapmad Anti-Piracy API",
     description="Secure API for content protection and anti-piracy operations",
-    version="1.0.0",
+    version=API_VERSION,
     docs_url="/docs" if settings.env != "production" else None,
     redoc_url="/redoc" if settings.env != "production" else None,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
+app.router.route_class = ORJSONRoute
 
-# Security middleware
-if settings.env == "production":
-    app.add_middleware(
-        TrustedHostMiddleware,
-        allowed_hosts=["*"]  # Configure specific hosts in production
-    )
+# Security middleware - only when real hosts are configured; a "*" list is pure overhead
+if settings.env == "production" and settings.allowed_hosts:
+    app.add_middleware(TrustedHostMiddleware, allowed_hosts=settings.allowed_hosts)
 
 # CORS configuration - SECURE by default
 app.add_middleware(
@@ -47,79 +116,134 @@ app.add_middleware(
 )
 
 # Compression middleware
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Small JSON isn't worth the compression framing cost
+app.add_middleware(GZipMiddleware, minimum_size=4096)
 
 # Input validation middleware
-@app.middleware("http")
-async def validate_input_middleware(request: Request, call_next):
-    """Validate and sanitize input requests"""
-    try:
+# Header names arrive lowercased as bytes (ASGI spec), so compare them raw
+JSON_CONTENT_TYPE = b"application/json"
+
+class InputValidationMiddleware:
+    """Reject oversized or non-JSON POST requests before they reach the app"""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        content_length = None
+        content_type = b""
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                content_length = value
+            elif name == b"content-type":
+                content_type = value
+        
         # Check request size
-        if request.headers.get("content-length"):
-            content_length = int(request.headers.get("content-length", 0))
-            if content_length > settings.max_request_size:
-                raise HTTPException(
-                    status_code=413, 
-                    detail=f"Request too large. Maximum size: {settings.max_request_size} bytes"
+        if content_length is not None:
+            try:
+                too_large = int(content_length) > settings.max_request_size
+            except ValueError:
+                await self._reject(send, 400, "Invalid request: malformed Content-Length")
+                return
+            if too_large:
+                await self._reject(
+                    send, 413,
+                    f"Request too large. Maximum size: {settings.max_request_size} bytes"
                 )
+                return
         
         # Validate content type for POST requests
-        if request.method == "POST":
-            content_type = request.headers.get("content-type", "")
-            if not content_type.startswith("application/json"):
-                raise HTTPException(
-                    status_code=400, 
-                    detail="Content-Type must be application/json"
-                )
-        
-        response = await call_next(request)
-        return response
+        if scope["method"] == "POST" and not content_type.startswith(JSON_CONTENT_TYPE):
+            await self._reject(send, 400, "Content-Type must be application/json")
+            return
         
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Invalid request: {str(e)}")
+        await self.app(scope, receive, send)
+    
+    @staticmethod
+    async def _reject(send, status_code: int, detail: str):
+        body = json.dumps({"detail": detail}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+app.add_middleware(InputValidationMiddleware)
 
 # Remove authentication requirement - make all endpoints public
 def verify_api_key(x_api_key: Annotated[str | None, Header()] = None) -> None:
     # No authentication required for development
     pass
 
+def safe_endpoint(code: str, message: str):
+    """Log unexpected handler errors and answer with a static failure APIResponse"""
+    def decorator(handler):
+        log_message = f"{handler.__name__} failed ({code})"
+        
+        if inspect.iscoroutinefunction(handler):
+            @functools.wraps(handler)
+            async def wrapper(*args, **kwargs):
+                try:
+                    return await handler(*args, **kwargs)
+                except HTTPException:
+                    raise
+                except Exception:
+                    logger.exception(log_message)
+                    return APIResponse(success=False, message=message, code=code)
+        else:
+            # Stays sync so FastAPI keeps running it in the threadpool
+            @functools.wraps(handler)
+            def wrapper(*args, **kwargs):
+                try:
+                    return handler(*args, **kwargs)
+                except HTTPException:
+                    raise
+                except Exception:
+                    logger.exception(log_message)
+                    return APIResponse(success=False, message=message, code=code)
+        return wrapper
+    return decorator
+
 # Initialize services
 llm_client = LLMClient()
 matching_engine = MatchingEngine()
 dmca_enforcer = DMCAEnforcer()
 
+# Prebuilt bodies for the probe endpoints; only the timestamp changes per request
+_ROOT_TEMPLATE = (
+    b'{"message":"Tapmad Anti-Piracy API","version":"' + API_VERSION.encode()
+    + b'","status":"running","timestamp":%d}'
+)
+_HEALTH_TEMPLATE = b'{"status":"healthy","timestamp":%d,"version":"' + API_VERSION.encode() + b'"}'
+
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "Tapmad Anti-Piracy API",
-        "version": "1.0.0",
-        "status": "running",
-        "timestamp": int(time.time())
-    }
+    return Response(content=_ROOT_TEMPLATE % int(time.time()), media_type="application/json")
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "timestamp": int(time.time()),
-        "version": "1.0.0"
-    }
+    return Response(content=_HEALTH_TEMPLATE % int(time.time()), media_type="application/json")
 
 @app.get("/stats")
+@redis_cached("stats", ttl=5)
 async def get_stats():
     """Get system statistics"""
     try:
-        db_info = get_database_info()
+        db_info = await asyncio.to_thread(get_database_info)
         
         # Get Redis info
         try:
-            from ..shared.redis_client import get_redis
-            redis_client = get_redis()
-            redis_info = redis_client.info()
+            redis_info = await get_async_redis().info(section="server")
         except Exception:
             redis_info = {"status": "disconnected"}
         
@@ -128,436 +252,360 @@ async def get_stats():
             "redis": redis_info,
             "system": {
                 "timestamp": int(time.time()),
-                "version": "1.0.0",
+                "version": API_VERSION,
                 "enforcement_dry_run": settings.enforcement_dry_run
             }
         }
-    except Exception as e:
-        return {"error": str(e)}
+    except Exception:
+        logger.exception("get_stats failed")
+        return {"error": "STATS_FAILED"}
 
 @app.post("/tools/crawl/search_and_queue")
+@safe_endpoint("SEARCH_FAILED", "Search failed")
 async def tool_crawl_search_and_queue(request: CrawlRequest):
     """Search for content using keywords and queue for processing"""
-    try:
-        # Use the new crawler functionality
-        detection_ids = crawl_youtube_content(request.keywords, request.max_results)
-        
-        # Log AI activity
-        ai_activity = {
-            "action": "content_search",
-            "keywords": request.keywords,
-            "detections_created": len(detection_ids),
-            "timestamp": int(time.time())
-        }
-        
-        return APIResponse(
-            success=True,
-            data={
-                "detection_ids": detection_ids,
-                "ai_activity": ai_activity
-            },
-            message=f"Found {len(detection_ids)} potential content items"
-        )
+    # Use the new crawler functionality
+    detection_ids = await asyncio.to_thread(
+        crawl_youtube_content, request.keywords, request.max_results
+    )
     
-    except Exception as e:
-        return APIResponse(
-            success=False,
-            message=f"Search failed: {str(e)}"
-        )
+    # Log AI activity
+    ai_activity = {
+        "action": "content_search",
+        "keywords": request.keywords,
+        "detections_created": len(detection_ids),
+        "timestamp": int(time.time())
+    }
+    
+    return APIResponse(
+        success=True,
+        data={
+            "detection_ids": detection_ids,
+            "ai_activity": ai_activity
+        },
+        message=f"Found {len(detection_ids)} potential content items"
+    )
 
 @app.post("/tools/capture/fingerprint")
+@safe_endpoint("FINGERPRINT_FAILED", "Fingerprinting failed")
 async def tool_capture_fingerprint(request: FingerprintRequest):
     """Capture and fingerprint content"""
-    try:
-        # First create a detection
-        detection_id = insert_detection(
-            platform=request.platform or "unknown",
-            url=request.url,
-            title=request.title
-        )
-        
-        if not detection_id:
-            return APIResponse(
-                success=False,
-                message="Failed to create detection"
-            )
-        
-        # Capture and fingerprint content
-        evidence_id = capture_detection(detection_id)
-        
-        if not evidence_id:
-            return APIResponse(
-                success=False,
-                message="Failed to capture and fingerprint content"
-            )
-        
-        # Log AI activity
-        ai_activity = {
-            "action": "content_capture",
-            "url": request.url,
-            "detection_id": detection_id,
-            "evidence_id": evidence_id,
-            "timestamp": int(time.time())
-        }
-        
+    # First create a detection
+    detection_id = await asyncio.to_thread(
+        insert_detection,
+        platform=request.platform or "unknown",
+        url=request.url,
+        title=request.title
+    )
+    
+    if not detection_id:
         return APIResponse(
-            success=True,
-            data={
-                "detection_id": detection_id,
-                "evidence_id": evidence_id,
-                "ai_activity": ai_activity
-            },
-            message="Content captured and fingerprinted successfully"
+            success=False,
+            message="Failed to create detection"
         )
     
-    except Exception as e:
+    # Capture and fingerprint content
+    evidence_id = await capture_detection_async(detection_id)
+    
+    if not evidence_id:
         return APIResponse(
             success=False,
-            message=f"Fingerprinting failed: {str(e)}"
+            message="Failed to capture and fingerprint content"
         )
+    
+    # Log AI activity
+    ai_activity = {
+        "action": "content_capture",
+        "url": request.url,
+        "detection_id": detection_id,
+        "evidence_id": evidence_id,
+        "timestamp": int(time.time())
+    }
+    
+    return APIResponse(
+        success=True,
+        data={
+            "detection_id": detection_id,
+            "evidence_id": evidence_id,
+            "ai_activity": ai_activity
+        },
+        message="Content captured and fingerprinted successfully"
+    )
 
 @app.post("/tools/match/analyze")
-async def tool_match_analyze(request: Request):
+@safe_endpoint("ANALYSIS_FAILED", "Analysis failed")
+async def tool_match_analyze(request: MatchAnalyzeRequest):
     """Analyze content against reference fingerprints"""
-    try:
-        raw = await request.body()
-        data = json.loads(raw or "{}")
-        
-        # Use the matching engine to analyze
-        if data.get("detection_id"):
-            result = matching_engine.analyze_detection(data["detection_id"])
-            return APIResponse(
-                success=True,
-                data=result,
-                message="Content analysis completed"
-            )
-        else:
-            return APIResponse(
-                success=False,
-                message="detection_id is required"
-            )
-    
-    except Exception as e:
-        return APIResponse(
-            success=False,
-            message=f"Analysis failed: {str(e)}"
-        )
+    # Use the matching engine to analyze
+    result = await asyncio.to_thread(matching_engine.analyze_detection, request.detection_id)
+    return APIResponse(
+        success=True,
+        data=result,
+        message="Content analysis completed"
+    )
 
 @app.post("/tools/match/decide")
-async def tool_match_decide(request: Request):
+@safe_endpoint("DECISION_FAILED", "Decision update failed")
+async def tool_match_decide(request: MatchDecideRequest):
     """Make decision on content based on analysis"""
-    try:
-        raw = await request.body()
-        data = json.loads(raw or "{}")
-        
-        detection_id = data.get("detection_id")
-        decision = data.get("decision")
-        
-        if not detection_id or not decision:
-            return APIResponse(
-                success=False,
-                message="detection_id and decision are required"
-            )
-        
-        # Update detection decision
-        from ..shared.db import update_detection_decision
-        success = update_detection_decision(detection_id, decision)
-        
-        if success:
-            return APIResponse(
-                success=True,
-                data={"detection_id": detection_id, "decision": decision},
-                message=f"Decision updated to {decision}"
-            )
-        else:
-            return APIResponse(
-                success=False,
-                message="Failed to update decision"
-            )
+    detection_id = request.detection_id
+    decision = request.decision
     
-    except Exception as e:
+    # Update detection decision
+    from ..shared.db import update_detection_decision
+    success = await asyncio.to_thread(update_detection_decision, detection_id, decision)
+    
+    if success:
+        return APIResponse(
+            success=True,
+            data={"detection_id": detection_id, "decision": decision},
+            message=f"Decision updated to {decision}"
+        )
+    else:
         return APIResponse(
             success=False,
-            message=f"Decision update failed: {str(e)}"
+            message="Failed to update decision"
         )
 
 @app.post("/tools/llm/chat")
-async def tool_llm_chat(request: Request):
+@safe_endpoint("LLM_CHAT_FAILED", "LLM chat failed")
+async def tool_llm_chat(request: LLMChatRequest):
     """Chat with LLM for content analysis"""
-    try:
-        raw = await request.body()
-        data = json.loads(raw or "{}")
-        
-        prompt = data.get("prompt", "")
-        if not prompt:
-            return APIResponse(
-                success=False,
-                message="prompt is required"
-            )
-        
-        # Get LLM response
-        response = llm_client.generate(prompt)
-        
-        return APIResponse(
-            success=True,
-            data={
-                "response": response,
-                "prompt": prompt,
-                "timestamp": int(time.time())
-            },
-            message="LLM response generated successfully"
-        )
+    prompt = request.prompt
     
-    except Exception as e:
-        return APIResponse(
-            success=False,
-            message=f"LLM chat failed: {str(e)}"
-        )
+    # Get LLM response
+    response = await asyncio.to_thread(llm_client.generate, prompt)
+    
+    return APIResponse(
+        success=True,
+        data={
+            "response": response,
+            "prompt": prompt,
+            "timestamp": int(time.time())
+        },
+        message="LLM response generated successfully"
+    )
 
 @app.get("/detections")
+@safe_endpoint("DETECTIONS_FAILED", "Failed to get detections")
 async def get_detections_endpoint(limit: int = 100, offset: int = 0):
     """Get detections with pagination"""
-    try:
-        detections = get_detections(limit, offset)
-        return APIResponse(
+    detections, total = await asyncio.to_thread(get_detections, limit, offset)
+    # Hot path: hand the payload straight to orjson, skipping jsonable_encoder
+    return ORJSONResponse(
+        content=APIResponse(
             success=True,
-            data={"detections": detections, "total": len(detections)},
+            data={"detections": detections, "total": total, "limit": limit, "offset": offset},
             message="Detections retrieved successfully"
-        )
-    except Exception as e:
-        return APIResponse(
-            success=False,
-            message=f"Failed to get detections: {str(e)}"
-        )
+        ).model_dump(),
+        headers={"X-Total-Count": str(total)},
+    )
 
 @app.get("/detections/{detection_id}")
+@safe_endpoint("DETECTION_FAILED", "Failed to get detection")
 async def get_detection(detection_id: int):
     """Get specific detection by ID"""
-    try:
-        detection = get_detection_by_id(detection_id)
-        if detection:
-            return APIResponse(
-                success=True,
-                data=detection,
-                message="Detection retrieved successfully"
-            )
-        else:
-            return APIResponse(
-                success=False,
-                message="Detection not found"
-            )
-    except Exception as e:
+    detection = await asyncio.to_thread(get_detection_by_id, detection_id)
+    if detection:
+        return APIResponse(
+            success=True,
+            data=detection,
+            message="Detection retrieved successfully"
+        )
+    else:
         return APIResponse(
             success=False,
-            message=f"Failed to get detection: {str(e)}"
+            message="Detection not found"
         )
 
 @app.get("/matching/stats")
+@safe_endpoint("MATCHING_STATS_FAILED", "Failed to get matching stats")
+@redis_cached("matching", ttl=10)
 async def get_matching_stats():
     """Get matching engine statistics"""
-    try:
-        stats = matching_engine.get_matching_stats()
-        return APIResponse(
-            success=True,
-            data=stats,
-            message="Matching statistics retrieved successfully"
-        )
-    except Exception as e:
-        return APIResponse(
-            success=False,
-            message=f"Failed to get matching stats: {str(e)}"
-        )
+    stats = await asyncio.to_thread(matching_engine.get_matching_stats)
+    if "error" in stats:
+        raise RuntimeError(stats["error"])
+    return APIResponse(
+        success=True,
+        data=stats,
+        message="Matching statistics retrieved successfully"
+    )
 
 @app.post("/enforce/send_dmca")
-async def send_dmca_notice(request: Request):
+@safe_endpoint("DMCA_FAILED", "DMCA enforcement failed")
+async def send_dmca_notice(request: DMCARequest):
     """Send DMCA notice for a detection"""
-    try:
-        raw = await request.body()
-        data = json.loads(raw or "{}")
-        
-        detection_id = data.get("detection_id")
-        decision = data.get("decision", "match")
-        custom_message = data.get("custom_message")
-        
-        if not detection_id:
-            return APIResponse(
-                success=False,
-                message="detection_id is required"
-            )
-        
-        # Send DMCA notice
-        result = dmca_enforcer.send_dmca_notice(detection_id, decision, custom_message)
-        
-        return APIResponse(
-            success=result.get("success", False),
-            data=result,
-            message="DMCA notice sent successfully" if result.get("success") else "Failed to send DMCA notice"
-        )
+    # Send DMCA notice
+    result = await asyncio.to_thread(
+        dmca_enforcer.send_dmca_notice,
+        request.detection_id, request.decision, request.custom_message
+    )
     
-    except Exception as e:
-        return APIResponse(
-            success=False,
-            message=f"DMCA enforcement failed: {str(e)}"
-        )
+    return APIResponse(
+        success=result.get("success", False),
+        data=result,
+        message="DMCA notice sent successfully" if result.get("success") else "Failed to send DMCA notice"
+    )
+
+# Upper bound on detections processed at once by each pipeline stage
+PIPELINE_CONCURRENCY = 8
+
+async def _map_in_threads(func, items, *args):
+    """Run a blocking func over items concurrently on the threadpool, keeping order"""
+    semaphore = asyncio.Semaphore(PIPELINE_CONCURRENCY)
+    
+    async def run(item):
+        async with semaphore:
+            return await asyncio.to_thread(func, item, *args)
+    
+    return await asyncio.gather(*(run(item) for item in items))
 
 @app.post("/pipeline/run")
-async def run_pipeline(request: Request):
+@safe_endpoint("PIPELINE_FAILED", "Pipeline failed")
+async def run_pipeline(request: PipelineRequest):
     """Run the complete anti-piracy pipeline"""
-    try:
-        raw = await request.body()
-        data = json.loads(raw or "{}")
-        
-        keywords = data.get("keywords", [])
-        max_results = data.get("max_results", 10)
-        
-        if not keywords:
-            return APIResponse(
-                success=False,
-                message="keywords are required"
-            )
-        
-        # Step 1: Crawl
-        detection_ids = crawl_youtube_content(keywords, max_results)
-        
-        # Step 2: Capture and fingerprint
-        evidence_ids = []
-        for detection_id in detection_ids:
-            evidence_id = capture_detection(detection_id)
-            if evidence_id:
-                evidence_ids.append(evidence_id)
-        
-        # Step 3: Match
-        match_results = []
-        for detection_id in detection_ids:
-            result = matching_engine.analyze_detection(detection_id)
-            match_results.append(result)
-        
-        # Step 4: Enforcement (dry-run by default)
-        enforcement_results = []
-        for detection_id in detection_ids:
-            result = dmca_enforcer.send_dmca_notice(detection_id, "match")
-            enforcement_results.append(result)
-        
-        return APIResponse(
-            success=True,
-            data={
-                "detection_ids": detection_ids,
-                "evidence_ids": evidence_ids,
-                "match_results": match_results,
-                "enforcement_results": enforcement_results,
-                "pipeline_summary": {
-                    "detections_found": len(detection_ids),
-                    "evidence_captured": len(evidence_ids),
-                    "matches_found": sum(1 for r in match_results if r.get("matches")),
-                    "dmca_notices_sent": sum(1 for r in enforcement_results if r.get("success"))
-                }
-            },
-            message="Pipeline completed successfully"
-        )
+    # Step 1: Crawl
+    detection_ids = await asyncio.to_thread(
+        crawl_youtube_content, request.keywords, request.max_results
+    )
     
-    except Exception as e:
-        return APIResponse(
-            success=False,
-            message=f"Pipeline failed: {str(e)}"
-        )
+    # Step 2: Capture and fingerprint
+    evidence_ids = [
+        evidence_id
+        for evidence_id in await _map_in_threads(capture_detection, detection_ids)
+        if evidence_id
+    ]
+    
+    # Step 3: Match
+    match_results = await _map_in_threads(matching_engine.analyze_detection, detection_ids)
+    
+    # Step 4: Enforcement (dry-run by default)
+    enforcement_results = await _map_in_threads(
+        dmca_enforcer.send_dmca_notice, detection_ids, "match"
+    )
+    
+    return APIResponse(
+        success=True,
+        data={
+            "detection_ids": detection_ids,
+            "evidence_ids": evidence_ids,
+            "match_results": match_results,
+            "enforcement_results": enforcement_results,
+            "pipeline_summary": {
+                "detections_found": len(detection_ids),
+                "evidence_captured": len(evidence_ids),
+                "matches_found": sum(1 for r in match_results if r.get("matches")),
+                "dmca_notices_sent": sum(1 for r in enforcement_results if r.get("success"))
+            }
+        },
+        message="Pipeline completed successfully"
+    )
 
 @app.get("/detections/{detection_id}/evidence")
-async def get_detection_evidence(detection_id: int):
+@safe_endpoint("EVIDENCE_FAILED", "Failed to retrieve evidence")
+def get_detection_evidence(detection_id: int):
     """Get evidence for a specific detection"""
-    try:
-        with get_db_session() as session:
-            # Get the detection
-            detection = session.query(Detection).filter(Detection.id == detection_id).first()
-            if not detection:
-                return APIResponse(
-                    success=False,
-                    message="Detection not found"
-                )
-            
-            # Get evidence for this detection
-            evidence = session.query(Evidence).filter(Evidence.detection_id == detection_id).first()
-            
-            if not evidence:
-                return APIResponse(
-                    success=False,
-                    message="No evidence found for this detection"
-                )
-            
-            # Return evidence data
-            evidence_data = {
-                "id": evidence.id,
-                "detection_id": evidence.detection_id,
-                "video_fp": evidence.video_fp,
-                "audio_fp": evidence.audio_fp,
-                "duration_sec": evidence.duration_sec,
-                "created_at": evidence.created_at.isoformat(),
-                "s3_key_json": evidence.s3_key_json
-            }
-            
+    with get_db_session() as session:
+        # Get the detection and its evidence in one joined query
+        detection = session.scalars(
+            select(Detection)
+            .options(joinedload(Detection.evidence))
+            .where(Detection.id == detection_id)
+        ).first()
+        if not detection:
             return APIResponse(
-                success=True,
-                data=evidence_data,
-                message="Evidence retrieved successfully"
+                success=False,
+                message="Detection not found"
             )
-    
-    except Exception as e:
-        return APIResponse(
-            success=False,
-            message=f"Failed to retrieve evidence: {str(e)}"
-        )
-
-@app.post("/detections/{detection_id}/capture")
-async def capture_detection_evidence(detection_id: int):
-    """Capture evidence for an existing detection"""
-    try:
-        evidence_id = capture_detection(detection_id)
         
-        if not evidence_id:
+        evidence = detection.evidence
+        
+        if not evidence:
             return APIResponse(
                 success=False,
-                message="Failed to capture evidence for this detection"
+                message="No evidence found for this detection"
             )
         
+        # Return evidence data
+        evidence_data = {
+            "id": evidence.id,
+            "detection_id": evidence.detection_id,
+            "video_fp": evidence.video_fp,
+            "audio_fp": evidence.audio_fp,
+            "duration_sec": evidence.duration_sec,
+            "created_at": evidence.created_at.isoformat(),
+            "s3_key_json": evidence.s3_key_json
+        }
+        
         return APIResponse(
             success=True,
-            data={
-                "detection_id": detection_id,
-                "evidence_id": evidence_id
-            },
-            message="Evidence captured successfully"
+            data=evidence_data,
+            message="Evidence retrieved successfully"
         )
+
+@app.post("/detections/{detection_id}/capture")
+@safe_endpoint("CAPTURE_FAILED", "Failed to capture evidence")
+async def capture_detection_evidence(detection_id: int):
+    """Capture evidence for an existing detection"""
+    evidence_id = await capture_detection_async(detection_id)
     
-    except Exception as e:
+    if not evidence_id:
         return APIResponse(
             success=False,
-            message=f"Failed to capture evidence: {str(e)}"
+            message="Failed to capture evidence for this detection"
         )
+    
+    return APIResponse(
+        success=True,
+        data={
+            "detection_id": detection_id,
+            "evidence_id": evidence_id
+        },
+        message="Evidence captured successfully"
+    )
+
+LANGUAGES_PROCESSED = ("en", "bn")  # English and Bengali
+
+# Zeroed /tools/ai.stats payload returned when stats cannot be computed
+_EMPTY_AI_STATS = {
+    "total_scans": 0,
+    "active_scans": 0,
+    "detections_found": 0,
+    "decisions_made": 0,
+    "alerts_sent": 0,
+    "avg_confidence": 0,
+    "platforms_active": (),
+    "keywords_generated": 0,
+    "learning_sessions": 0,
+    "accuracy_improvement": 0,
+    "languages_processed": (),
+}
 
 @app.get("/tools/ai.stats")
+@redis_cached("ai_stats", ttl=15)
 async def get_ai_stats():
     """Get AI agent statistics"""
+    now = int(time.time())
     try:
-        # Get basic stats from detections
-        detections = get_detections(limit=1000, offset=0)
+        # Get basic stats from detections, aggregated in the database
+        aggregates = await asyncio.to_thread(get_detection_aggregates)
         
-        # Calculate AI stats
-        total_scans = len(detections)
-        active_scans = len([d for d in detections if d.get('status') == 'processing'])
-        detections_found = len([d for d in detections if d.get('decision') == 'match'])
-        decisions_made = len([d for d in detections if d.get('decision')])
-        alerts_sent = len([d for d in detections if d.get('enforcement_sent')])
+        total_scans = aggregates["total"]
+        active_scans = aggregates["active"]
+        detections_found = aggregates["matches"]
+        decisions_made = aggregates["decisions"]
+        alerts_sent = aggregates["alerts"]
         
         # Calculate average confidence (mock data for now)
         avg_confidence = 85.5
         
-        # Get platforms from detections
-        platforms_active = list(set([d.get('platform', 'unknown') for d in detections if d.get('platform')]))
+        platforms_active = aggregates["platforms"]
         
         # Mock additional stats
         keywords_generated = total_scans * 3  # Assume 3 keywords per scan
         learning_sessions = max(1, total_scans // 10)  # Learning session every 10 scans
         accuracy_improvement = 2.3  # Mock improvement percentage
-        languages_processed = ['en', 'bn']  # English and Bengali
         
         return {
             "total_scans": total_scans,
@@ -570,158 +618,147 @@ async def get_ai_stats():
             "keywords_generated": keywords_generated,
             "learning_sessions": learning_sessions,
             "accuracy_improvement": accuracy_improvement,
-            "languages_processed": languages_processed,
-            "timestamp": int(time.time())
+            "languages_processed": LANGUAGES_PROCESSED,
+            "timestamp": now
         }
     
-    except Exception as e:
-        return {
-            "error": str(e),
-            "total_scans": 0,
-            "active_scans": 0,
-            "detections_found": 0,
-            "decisions_made": 0,
-            "alerts_sent": 0,
-            "avg_confidence": 0,
-            "platforms_active": [],
-            "keywords_generated": 0,
-            "learning_sessions": 0,
-            "accuracy_improvement": 0,
-            "languages_processed": [],
-            "timestamp": int(time.time())
+    except Exception:
+        logger.exception("get_ai_stats failed")
+        return {"error": "AI_STATS_FAILED", **_EMPTY_AI_STATS, "timestamp": now}
+
+# Shown when there are no detections yet; timestamps are filled in per request
+_MOCK_ACTIVITY_AGES = (300, 180, 60)
+_MOCK_ACTIVITIES_TEMPLATE: tuple[dict, ...] = (
+    {
+        "id": "ai_activity_1",
+        "type": "scan",
+        "platform": "youtube",
+        "action": "Content scan on YouTube",
+        "details": "Scanning for potential copyright violations",
+        "status": "completed",
+        "confidence": 87.5,
+        "url": "https://youtube.com/watch?v=example",
+        "duration": 1200,
+        "keywords": ["tapmad", "cricket", "live"],
+        "language": "en",
+        "learning_data": {
+            "patterns": ["sports_content", "live_streaming"],
+            "improvements": ["accuracy_improved"],
+            "accuracy": 87.5
+        }
+    },
+    {
+        "id": "ai_activity_2",
+        "type": "detect",
+        "platform": "telegram",
+        "action": "Content detection on Telegram",
+        "details": "Detected potential copyright violation",
+        "status": "completed",
+        "confidence": 92.3,
+        "url": "https://t.me/example",
+        "duration": 800,
+        "keywords": ["tapmad", "cricket", "highlights"],
+        "language": "bn",
+        "learning_data": {
+            "patterns": ["bengali_content", "cricket_highlights"],
+            "improvements": ["language_detection_improved"],
+            "accuracy": 92.3
+        }
+    },
+    {
+        "id": "ai_activity_3",
+        "type": "decision",
+        "platform": "facebook",
+        "action": "AI decision making",
+        "details": "Made decision on content match",
+        "status": "completed",
+        "confidence": 89.1,
+        "url": "https://facebook.com/example",
+        "duration": 500,
+        "keywords": ["tapmad", "sports", "live"],
+        "language": "both",
+        "learning_data": {
+            "patterns": ["social_media_content", "multi_language"],
+            "improvements": ["decision_speed_improved"],
+            "accuracy": 89.1
+        }
+    },
+)
+
+# Activities encoded per chunk of the streamed /tools/ai.activities body
+ACTIVITY_BATCH_SIZE = 50
+
+def _activity_from_detection(detection: dict, i: int, now: int) -> dict:
+    """Create AI activity from detection"""
+    return {
+        "id": f"ai_activity_{detection.get('id', i)}",
+        "timestamp": str(now - (i * 60)),  # Spread over time
+        "type": "scan" if detection.get('status') == 'processing' else "detect",
+        "platform": detection.get('platform', 'unknown'),
+        "action": f"Content scan on {detection.get('platform', 'unknown')}",
+        "details": f"Analyzed content: {detection.get('title', 'Unknown title')}",
+        "status": "completed" if detection.get('decision') else "running",
+        "confidence": 85.5 + (i % 10),  # Mock confidence
+        "url": detection.get('url'),
+        "duration": 1500 + (i * 100),  # Mock duration
+        "keywords": [
+            "tapmad",
+            "cricket",
+            "sports",
+            "live",
+            "streaming"
+        ],
+        "language": "en" if i % 2 == 0 else "bn",
+        "learning_data": {
+            "patterns": ["content_pattern_1", "content_pattern_2"],
+            "improvements": ["accuracy_improved", "speed_optimized"],
+            "accuracy": 85.5 + (i % 5)
         }
+    }
+
+def _iter_activities_json():
+    """Yield the activities JSON document in batches as detections are read"""
+    now = int(time.time())
+    yield b'{"activities":['
+    
+    total = 0
+    batch = []
+    for i, detection in enumerate(iter_detections(limit=100, batch_size=ACTIVITY_BATCH_SIZE)):
+        batch.append(orjson.dumps(_activity_from_detection(detection, i, now)))
+        total += 1
+        if len(batch) == ACTIVITY_BATCH_SIZE:
+            yield (b"," if total > len(batch) else b"") + b",".join(batch)
+            batch = []
+    if batch:
+        yield (b"," if total > len(batch) else b"") + b",".join(batch)
+    
+    # Add some mock activities if no detections
+    if not total:
+        yield b",".join(
+            orjson.dumps({**activity, "timestamp": str(now - age)})
+            for activity, age in zip(_MOCK_ACTIVITIES_TEMPLATE, _MOCK_ACTIVITY_AGES)
+        )
+        total = len(_MOCK_ACTIVITIES_TEMPLATE)
+    
+    yield b'],"total":%d,"timestamp":%d}' % (total, now)
 
 @app.get("/tools/ai.activities")
+@redis_cached("ai_activities", ttl=5)
 async def get_ai_activities():
     """Get AI agent activities"""
-    try:
-        # Get detections and convert to AI activities
-        detections = get_detections(limit=100, offset=0)
-        
-        activities = []
-        for i, detection in enumerate(detections):
-            # Create AI activity from detection
-            activity = {
-                "id": f"ai_activity_{detection.get('id', i)}",
-                "timestamp": str(int(time.time()) - (i * 60)),  # Spread over time
-                "type": "scan" if detection.get('status') == 'processing' else "detect",
-                "platform": detection.get('platform', 'unknown'),
-                "action": f"Content scan on {detection.get('platform', 'unknown')}",
-                "details": f"Analyzed content: {detection.get('title', 'Unknown title')}",
-                "status": "completed" if detection.get('decision') else "running",
-                "confidence": 85.5 + (i % 10),  # Mock confidence
-                "url": detection.get('url'),
-                "duration": 1500 + (i * 100),  # Mock duration
-                "keywords": [
-                    "tapmad",
-                    "cricket",
-                    "sports",
-                    "live",
-                    "streaming"
-                ],
-                "language": "en" if i % 2 == 0 else "bn",
-                "learning_data": {
-                    "patterns": ["content_pattern_1", "content_pattern_2"],
-                    "improvements": ["accuracy_improved", "speed_optimized"],
-                    "accuracy": 85.5 + (i % 5)
-                }
-            }
-            activities.append(activity)
-        
-        # Add some mock activities if no detections
-        if not activities:
-            mock_activities = [
-                {
-                    "id": "ai_activity_1",
-                    "timestamp": str(int(time.time()) - 300),
-                    "type": "scan",
-                    "platform": "youtube",
-                    "action": "Content scan on YouTube",
-                    "details": "Scanning for potential copyright violations",
-                    "status": "completed",
-                    "confidence": 87.5,
-                    "url": "https://youtube.com/watch?v=example",
-                    "duration": 1200,
-                    "keywords": ["tapmad", "cricket", "live"],
-                    "language": "en",
-                    "learning_data": {
-                        "patterns": ["sports_content", "live_streaming"],
-                        "improvements": ["accuracy_improved"],
-                        "accuracy": 87.5
-                    }
-                },
-                {
-                    "id": "ai_activity_2",
-                    "timestamp": str(int(time.time()) - 180),
-                    "type": "detect",
-                    "platform": "telegram",
-                    "action": "Content detection on Telegram",
-                    "details": "Detected potential copyright violation",
-                    "status": "completed",
-                    "confidence": 92.3,
-                    "url": "https://t.me/example",
-                    "duration": 800,
-                    "keywords": ["tapmad", "cricket", "highlights"],
-                    "language": "bn",
-                    "learning_data": {
-                        "patterns": ["bengali_content", "cricket_highlights"],
-                        "improvements": ["language_detection_improved"],
-                        "accuracy": 92.3
-                    }
-                },
-                {
-                    "id": "ai_activity_3",
-                    "timestamp": str(int(time.time()) - 60),
-                    "type": "decision",
-                    "platform": "facebook",
-                    "action": "AI decision making",
-                    "details": "Made decision on content match",
-                    "status": "completed",
-                    "confidence": 89.1,
-                    "url": "https://facebook.com/example",
-                    "duration": 500,
-                    "keywords": ["tapmad", "sports", "live"],
-                    "language": "both",
-                    "learning_data": {
-                        "patterns": ["social_media_content", "multi_language"],
-                        "improvements": ["decision_speed_improved"],
-                        "accuracy": 89.1
-                    }
-                }
-            ]
-            activities = mock_activities
-        
-        return {
-            "activities": activities,
-            "total": len(activities),
-            "timestamp": int(time.time())
-        }
-    
-    except Exception as e:
-        return {
-            "error": str(e),
-            "activities": [],
-            "total": 0,
-            "timestamp": int(time.time())
-        }
+    # Sync generator: Starlette steps it in the threadpool, so DB reads stay off the loop
+    return StreamingResponse(_iter_activities_json(), media_type="application/json")
 
 @app.post("/agent/chat")
-async def agent_chat(request: Request):
+async def agent_chat(request: ChatRequest):
     """Chat with the AI agent"""
+    now = int(time.time())
     try:
-        raw = await request.body()
-        data = json.loads(raw or "{}")
-        
-        message = data.get("message", "")
-        if not message:
-            return {
-                "error": "message is required",
-                "reply": "Please provide a message to chat with the AI agent."
-            }
+        message = request.message
         
         # Use the LLM client to generate a response
         try:
-            response = llm_client.generate(message)
+            response = await asyncio.to_thread(llm_client.generate, message)
         except Exception as e:
             # Fallback response if LLM fails
             response = f"I'm the Tapmad Anti-Piracy AI Agent. I received your message: '{message}'. I'm here to help with content protection and anti-piracy operations. How can I assist you today?"
@@ -729,13 +766,28 @@ async def agent_chat(request: Request):
         return {
             "reply": response,
             "message": message,
-            "timestamp": int(time.time()),
+            "timestamp": now,
             "agent": "tapmad-anti-piracy-ai"
         }
     
-    except Exception as e:
+    except Exception:
+        logger.exception("agent_chat failed")
         return {
-            "error": str(e),
+            "error": "AGENT_CHAT_FAILED",
             "reply": "I'm sorry, I encountered an error processing your message. Please try again.",
-            "timestamp": int(time.time())
+            "timestamp": now
         }
+
+
+if __name__ == "__main__":
+    import os
+    import uvicorn
+    uvicorn.run(
+        "src.api.app:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count(),
+        backlog=2048,
+    )
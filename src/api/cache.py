@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import functools
+import logging
+from typing import Any, Awaitable, Callable
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response, StreamingResponse
+
+from ..shared.redis_client import get_async_redis, STATS_CACHE_INDEX_KEY
+
+logger = logging.getLogger(__name__)
+
+
+def _is_error_payload(payload: Any) -> bool:
+    """Failure bodies must not be replayed to later callers as cached successes"""
+    return isinstance(payload, dict) and ("error" in payload or payload.get("success") is False)
+
+
+def redis_cached(key: str, ttl: int) -> Callable:
+    """Serve a handler's successful JSON response from Redis for ttl seconds
+
+    Only 200 responses are cached, since hits are replayed as plain 200 JSON
+    without the original status or headers.
+    """
+    cache_key = f"ap:cache:stats:{key}"
+
+    def decorator(handler: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(handler)
+        async def wrapper(*args, **kwargs):
+            redis_client = get_async_redis()
+            try:
+                cached = await redis_client.get(cache_key)
+                if cached is not None:
+                    return Response(content=cached, media_type="application/json")
+            except Exception as e:
+                logger.warning(f"Cache read failed for {cache_key}: {e}")
+
+            async def store(body: bytes) -> None:
+                try:
+                    await (
+                        redis_client.pipeline(transaction=False)
+                        .setex(cache_key, ttl, body)
+                        .sadd(STATS_CACHE_INDEX_KEY, cache_key)
+                        .execute()
+                    )
+                except Exception as e:
+                    logger.warning(f"Cache write failed for {cache_key}: {e}")
+
+            result = await handler(*args, **kwargs)
+
+            if isinstance(result, Response) and result.status_code != 200:
+                return result
+
+            if isinstance(result, StreamingResponse):
+                # Keep streaming to the client and cache the body once it is complete
+                body_iterator = result.body_iterator
+
+                async def tee():
+                    chunks = []
+                    async for chunk in body_iterator:
+                        chunks.append(chunk)
+                        yield chunk
+                    await store(b"".join(chunks))
+
+                result.body_iterator = tee()
+                return result
+
+            if isinstance(result, Response):
+                body = result.body
+                await store(body)
+                return result
+
+            payload = jsonable_encoder(result)
+            body = orjson.dumps(payload)
+            if not _is_error_payload(payload):
+                await store(body)
+            return Response(content=body, media_type="application/json")
+
+        return wrapper
+
+    return decorator
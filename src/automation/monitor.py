@@ -1,71 +1,186 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
+import os
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Any, List
 import logging
 
+import httpx
+
 from ..llm.llm_client import LLMClient
 from ..shared.config import settings
-from ..shared.redis_client import get_redis
+from ..shared.redis_client import get_async_redis
 from ..shared.db import db_cursor
-from ..crawler.platforms.youtube import search_candidates
+from ..shared.database import insert_detection
+from ..capture.grab import capture_detection_async
+from ..crawler.platforms.youtube import search_candidates_async
+from ..crawler.platforms._common import Candidate
 from ..crawler.platforms.telegram import candidates_from_query
 from ..crawler.platforms.facebook import candidates_from_query as fb_candidates_from_query
 
+try:
+    import orjson
+    _dumps, _loads = orjson.dumps, orjson.loads
+except ImportError:
+    _dumps, _loads = json.dumps, json.loads
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+SEED_KEYWORDS = (
+    "tapmad live",
+    "tapmad sports",
+    "live cricket tapmad",
+    "free match stream",
+    "live match hd",
+    "ট্যাপম্যাড লাইভ",
+    "ফ্রি খেলা লাইভ",
+    "লাইভ ম্যাচ এইচডি",
+    "খেলা ফ্রি স্ট্রিম",
+)
+# Expanded keywords are reused across scan cycles for this long
+KEYWORD_CACHE_TTL = 6 * 3600
+
+# Scans in flight at once across all platforms
+SCAN_CONCURRENCY = 64
+# Request budget per platform, replacing the old fixed 1s sleep between scans
+PLATFORM_REQUESTS_PER_SECOND = 5
+# Connection pool of the shared HTTP client used by the platform searches
+HTTP_MAX_CONNECTIONS = 512
+HTTP_MAX_KEEPALIVE = 64
+
+
+# One expiring marker per queued URL, so repeated scans don't enqueue the same
+# candidate twice while old URLs age out instead of growing a set forever
+SEEN_URL_KEY_PREFIX = "ap:seen_url:"
+SEEN_URL_TTL = 7 * 86400
+
+# Candidates captured per batch, and how long a blocking queue read waits
+PROCESSING_BATCH_SIZE = 10
+PROCESSING_POLL_TIMEOUT = 120
+SCAN_CYCLE_INTERVAL = 1800  # 30 minutes
+
+# Concurrent captures; each one is CPU-heavy once the download finishes
+CAPTURE_WORKERS = max(4, (os.cpu_count() or 2) // 2)
+
+
+def _seen_url_key(url: str) -> str:
+    return SEEN_URL_KEY_PREFIX + hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+
+
+class RateLimiter:
+    """Space calls out so at most `rate` start per second"""
+    
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def __aenter__(self):
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    async def __aexit__(self, *exc_info):
+        return False
+
+
 class AntiPiracyMonitor:
     def __init__(self):
         self.llm_client = LLMClient()
-        self.redis = get_redis()
+        # Pooled asyncio client, shared by the concurrent scan coroutines
+        self.redis = get_async_redis()
         self.platforms = ["youtube", "telegram", "facebook", "twitter", "instagram", "google"]
         self.scan_interval = 300  # 5 minutes
         self.max_candidates_per_scan = 10
+        self.rate_limiters = {p: RateLimiter(PLATFORM_REQUESTS_PER_SECOND) for p in self.platforms}
+        # Separate from the default executor so captures can't starve scan threads
+        self._capture_pool = ThreadPoolExecutor(max_workers=CAPTURE_WORKERS)
+        self._http: httpx.AsyncClient | None = None
+    
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Shared HTTP client for platform searches, created on first use"""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                ),
+            )
+        return self._http
+    
+    async def close(self) -> None:
+        """Release the HTTP connection pool and capture threads"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        self._capture_pool.shutdown(wait=False)
         
     async def get_keywords(self) -> List[str]:
-        """Get expanded keywords from LLM"""
+        """Get expanded keywords from LLM, cached per seed list and day"""
+        seed_key = "\0".join((*SEED_KEYWORDS, time.strftime("%Y-%m-%d")))
+        cache_key = "ap:kw:" + hashlib.blake2b(seed_key.encode(), digest_size=16).hexdigest()
         try:
-            expanded = self.llm_client.expand_keywords({"seeds": [
-                "tapmad live",
-                "tapmad sports", 
-                "live cricket tapmad",
-                "free match stream",
-                "live match hd",
-                "ট্যাপম্যাড লাইভ",
-                "ফ্রি খেলা লাইভ",
-                "লাইভ ম্যাচ এইচডি",
-                "খেলা ফ্রি স্ট্রিম"
-            ], "date": "today"})
-            return expanded[:20]  # Limit to 20 keywords
+            cached = await self.redis.get(cache_key)
+            if cached is not None:
+                return _loads(cached)
+        except Exception as e:
+            logger.warning(f"Keyword cache read failed: {e}")
+        
+        try:
+            expanded = await asyncio.to_thread(
+                self.llm_client.expand_keywords, {"seeds": list(SEED_KEYWORDS), "date": "today"}
+            )
+            keywords = expanded[:20]  # Limit to 20 keywords
         except Exception as e:
             logger.error(f"Failed to get keywords: {e}")
             return ["tapmad live", "live cricket", "sports streaming"]
+        
+        try:
+            await self.redis.set(cache_key, _dumps(keywords), ex=KEYWORD_CACHE_TTL)
+        except Exception as e:
+            logger.warning(f"Keyword cache write failed: {e}")
+        return keywords
     
-    async def scan_platform(self, platform: str, keyword: str) -> List[dict]:
+    async def scan_platform(self, platform: str, keyword: str) -> List[Candidate]:
         """Scan a specific platform for candidates"""
         try:
             if platform == "youtube":
-                candidates = search_candidates(keyword, max_results=3)
-            elif platform == "telegram":
-                candidates = candidates_from_query(keyword)
-            elif platform == "facebook":
-                candidates = fb_candidates_from_query(keyword)
-            elif platform == "twitter":
-                from ..crawler.platforms.twitter import search_candidates
-                candidates = search_candidates(keyword, max_results=3)
-            elif platform == "instagram":
-                from ..crawler.platforms.instagram import search_candidates
-                candidates = search_candidates(keyword, max_results=3)
-            elif platform == "google":
-                from ..crawler.platforms.google import search_candidates
-                candidates = search_candidates(keyword, max_results=3)
+                # The only crawler doing real HTTP; it runs on the loop over the shared client
+                async with self.rate_limiters[platform]:
+                    results = await search_candidates_async(self.http, [keyword], max_results=3)
+                candidates = [r.candidate() for r in results]
             else:
-                return []
+                if platform == "telegram":
+                    search = partial(candidates_from_query, keyword)
+                elif platform == "facebook":
+                    search = partial(fb_candidates_from_query, keyword)
+                elif platform == "twitter":
+                    from ..crawler.platforms.twitter import search_candidates as twitter_search
+                    search = partial(twitter_search, keyword, max_results=3)
+                elif platform == "instagram":
+                    from ..crawler.platforms.instagram import search_candidates as instagram_search
+                    search = partial(instagram_search, keyword, max_results=3)
+                elif platform == "google":
+                    from ..crawler.platforms.google import search_candidates as google_search
+                    search = partial(google_search, keyword, max_results=3)
+                else:
+                    return []
+                
+                # These only build search URLs locally, so a thread hop would cost more than the call
+                async with self.rate_limiters[platform]:
+                    candidates = search()
             
             logger.info(f"Found {len(candidates)} candidates on {platform} for '{keyword}'")
             return candidates
@@ -74,62 +189,136 @@ class AntiPiracyMonitor:
             logger.error(f"Failed to scan {platform}: {e}")
             return []
     
-    async def queue_candidates(self, candidates: List[dict]) -> int:
+    async def queue_candidates(self, candidates: List[Candidate]) -> int:
         """Queue candidates for processing"""
-        queued_count = 0
+        now = int(time.time())
+        entries = []
         for candidate in candidates:
             try:
-                cid = self.redis.incr("ap:candidates:id_seq")
-                data = {
-                    "id": cid,
-                    "url": candidate["url"],
-                    "title": candidate["title"],
-                    "platform": candidate["platform"],
+                entries.append({
+                    "url": candidate.url,
+                    "title": candidate.title,
+                    "platform": candidate.platform,
                     "status": "queued",
-                    "queued_at": int(time.time())
-                }
-                self.redis.set(f"ap:candidate:{cid}", json.dumps(data))
-                self.redis.rpush("ap:candidates", cid)
-                queued_count += 1
-                
+                    "queued_at": now
+                })
             except Exception as e:
                 logger.error(f"Failed to queue candidate: {e}")
         
-        return queued_count
+        if not entries:
+            return 0
+        
+        try:
+            # Skip URLs an earlier scan already queued (SET NX returns None for existing keys)
+            pipe = self.redis.pipeline(transaction=False)
+            for data in entries:
+                pipe.set(_seen_url_key(data["url"]), 1, nx=True, ex=SEEN_URL_TTL)
+            added = await pipe.execute()
+            entries = [data for data, is_new in zip(entries, added) if is_new]
+        except Exception as e:
+            logger.error(f"Failed to check seen URLs: {e}")
+            return 0
+        
+        if not entries:
+            return 0
+        
+        try:
+            # Reserve the whole ID range at once, then write everything in one round-trip
+            last_id = await self.redis.incrby("ap:candidates:id_seq", len(entries))
+            ids = range(last_id - len(entries) + 1, last_id + 1)
+            
+            pipe = self.redis.pipeline(transaction=False)
+            for cid, data in zip(ids, entries):
+                data["id"] = cid
+                pipe.set(f"ap:candidate:{cid}", _dumps(data))
+            pipe.rpush("ap:candidates", *ids)
+            await pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to queue {len(entries)} candidates: {e}")
+            # Let the next scan pick these URLs up again
+            try:
+                await self.redis.delete(*(_seen_url_key(data["url"]) for data in entries))
+            except Exception:
+                pass
+            return 0
+        
+        return len(entries)
     
     async def process_pending_candidates(self) -> int:
         """Process candidates that are queued but not yet fingerprinted"""
+        # Pop the next batch off the queue (LPOP count needs Redis 6.2+)
+        candidate_ids = await self.redis.lpop("ap:candidates", PROCESSING_BATCH_SIZE) or []
+        return await self._process_candidates(candidate_ids)
+    
+    async def _capture_candidate(self, data: dict) -> dict:
+        """Create a detection for a queued candidate and capture its evidence"""
+        # Captures are long and blocking (download, decode, FP); they run on the capture
+        # pool, while retry backoff waits on the loop rather than holding a pool thread
+        loop = asyncio.get_running_loop()
+        detection_id = await loop.run_in_executor(
+            self._capture_pool,
+            partial(insert_detection, platform=data["platform"], url=data["url"], title=data.get("title")),
+        )
+        if not detection_id:
+            return {"status": "failed"}
+        
+        evidence_id = await capture_detection_async(detection_id, self._capture_pool)
+        return {
+            "status": "processed" if evidence_id else "failed",
+            "detection_id": detection_id,
+            "evidence_id": evidence_id,
+        }
+    
+    async def _process_candidates(self, candidate_ids: List[Any]) -> int:
+        """Capture a batch of popped candidate IDs and record the outcome"""
         processed_count = 0
+        if not candidate_ids:
+            return 0
         
-        # Get queued candidates
-        candidate_ids = self.redis.lrange("ap:candidates", 0, 9)  # Process 10 at a time
+        keys = [f"ap:candidate:{int(cid)}" for cid in candidate_ids]
+        raws = await self.redis.mget(keys)
         
-        for cid in candidate_ids:
+        pending = []
+        for key, raw in zip(keys, raws):
             try:
-                cid = int(cid)
-                raw = self.redis.get(f"ap:candidate:{cid}")
                 if not raw:
                     continue
                     
-                data = json.loads(raw)
+                data = _loads(raw)
                 if data.get("status") != "queued":
                     continue
-                
-                # Mark as processing
-                data["status"] = "processing"
-                self.redis.set(f"ap:candidate:{cid}", json.dumps(data))
-                
-                # Here we would call the fingerprint and match tools
-                # For now, just mark as processed
-                data["status"] = "processed"
-                data["processed_at"] = int(time.time())
-                self.redis.set(f"ap:candidate:{cid}", json.dumps(data))
-                
-                processed_count += 1
-                logger.info(f"Processed candidate {cid}: {data['title']}")
+                pending.append((key, data))
                 
             except Exception as e:
-                logger.error(f"Failed to process candidate {cid}: {e}")
+                logger.error(f"Failed to process {key}: {e}")
+        
+        if not pending:
+            return 0
+        
+        results = await asyncio.gather(
+            *(self._capture_candidate(data) for _, data in pending),
+            return_exceptions=True,
+        )
+        
+        pipe = self.redis.pipeline(transaction=False)
+        now = int(time.time())
+        for (key, data), result in zip(pending, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to process {key}: {result}")
+                data["status"] = "failed"
+            else:
+                data.update(result)
+            data["processed_at"] = now
+            pipe.set(key, _dumps(data))
+            if data["status"] == "failed":
+                # Let a later scan queue the URL again
+                pipe.delete(_seen_url_key(data["url"]))
+            
+            if data["status"] == "processed":
+                processed_count += 1
+                logger.info(f"Processed candidate {data.get('id')}: {data['title']}")
+        
+        await pipe.execute()
         
         return processed_count
     
@@ -141,30 +330,27 @@ class AntiPiracyMonitor:
             "components": {}
         }
         
-        try:
-            # Check Redis
-            self.redis.ping()
-            health["components"]["redis"] = "healthy"
-        except Exception as e:
-            health["components"]["redis"] = f"unhealthy: {e}"
-            health["status"] = "degraded"
-        
-        try:
-            # Check Database
+        def check_database() -> None:
             with db_cursor() as cur:
                 cur.execute("SELECT 1")
-            health["components"]["database"] = "healthy"
-        except Exception as e:
-            health["components"]["database"] = f"unhealthy: {e}"
-            health["status"] = "degraded"
         
-        try:
-            # Check LLM
-            self.llm_client.expand_keywords({"seeds": ["test"], "date": "today"})
-            health["components"]["llm"] = "healthy"
-        except Exception as e:
-            health["components"]["llm"] = f"unhealthy: {e}"
-            health["status"] = "degraded"
+        # The probes are independent, so the health check costs the slowest one, not the sum
+        redis_ok, database_ok, llm_ok = await asyncio.gather(
+            self.redis.ping(),
+            asyncio.to_thread(check_database),
+            asyncio.to_thread(self.llm_client.ping),
+            return_exceptions=True,
+        )
+        
+        for component, result in (("redis", redis_ok), ("database", database_ok), ("llm", llm_ok)):
+            if isinstance(result, BaseException):
+                health["components"][component] = f"unhealthy: {result}"
+                health["status"] = "degraded"
+            elif component == "llm" and not result:
+                # Keyword expansion falls back locally when the LLM endpoint is down
+                health["components"][component] = "fallback"
+            else:
+                health["components"][component] = "healthy"
         
         return health
     
@@ -177,18 +363,26 @@ class AntiPiracyMonitor:
             keywords = await self.get_keywords()
             logger.info(f"Got {len(keywords)} keywords")
             
-            total_queued = 0
+            # Scan every platform/keyword pair concurrently
+            semaphore = asyncio.Semaphore(SCAN_CONCURRENCY)
             
-            # Scan each platform
-            for platform in self.platforms:
-                for keyword in keywords[:5]:  # Limit keywords per platform
-                    candidates = await self.scan_platform(platform, keyword)
-                    if candidates:
-                        queued = await self.queue_candidates(candidates)
-                        total_queued += queued
-                    
-                    # Small delay between requests
-                    await asyncio.sleep(1)
+            async def bounded_scan(platform: str, keyword: str) -> List[Candidate]:
+                async with semaphore:
+                    return await self.scan_platform(platform, keyword)
+            
+            results = await asyncio.gather(
+                *(bounded_scan(platform, keyword)
+                  for platform in self.platforms
+                  for keyword in keywords[:5]),  # Limit keywords per platform
+                return_exceptions=True,
+            )
+            candidates = [
+                candidate
+                for result in results if not isinstance(result, BaseException)
+                for candidate in result
+            ]
+            
+            total_queued = await self.queue_candidates(candidates) if candidates else 0
             
             logger.info(f"Scan cycle complete: queued {total_queued} candidates")
             
@@ -213,31 +407,49 @@ class AntiPiracyMonitor:
             logger.info(f"Health check: {health['status']}")
             
             # Store health status in Redis
-            self.redis.set("ap:health", json.dumps(health), ex=300)  # 5 min expiry
+            await self.redis.set("ap:health", _dumps(health), ex=300)  # 5 min expiry
             
         except Exception as e:
             logger.error(f"Health check failed: {e}")
     
-    async def run_continuous_monitoring(self):
-        """Main monitoring loop"""
-        logger.info("Starting continuous monitoring")
-        
+    async def run_processing_loop(self):
+        """Consume the candidate queue as soon as items arrive"""
         while True:
             try:
-                # Run health check every 5 minutes
-                await self.run_health_check()
-                
-                # Run scan cycle every 30 minutes
-                await self.run_scan_cycle()
+                item = await self.redis.blpop("ap:candidates", timeout=PROCESSING_POLL_TIMEOUT)
+                if not item:
+                    continue
                 
-                # Run processing cycle every 2 minutes
-                for _ in range(15):  # 15 * 2 = 30 minutes
-                    await self.run_processing_cycle()
-                    await asyncio.sleep(120)  # 2 minutes
+                # Drain whatever else is already waiting so captures run in batches
+                rest = await self.redis.lpop("ap:candidates", PROCESSING_BATCH_SIZE - 1) or []
+                processed = await self._process_candidates([item[1], *rest])
+                logger.info(f"Processing cycle complete: processed {processed} candidates")
                 
             except Exception as e:
-                logger.error(f"Monitoring loop error: {e}")
-                await asyncio.sleep(60)  # Wait 1 minute before retrying
+                logger.error(f"Processing loop error: {e}")
+                await asyncio.sleep(5)
+    
+    async def run_continuous_monitoring(self):
+        """Main monitoring loop"""
+        logger.info("Starting continuous monitoring")
+        
+        # Candidates are processed as they're queued, independent of the scan schedule
+        processing = asyncio.create_task(self.run_processing_loop())
+        try:
+            while True:
+                try:
+                    await self.run_health_check()
+                    
+                    # Run scan cycle every 30 minutes
+                    await self.run_scan_cycle()
+                    await asyncio.sleep(SCAN_CYCLE_INTERVAL)
+                    
+                except Exception as e:
+                    logger.error(f"Monitoring loop error: {e}")
+                    await asyncio.sleep(60)  # Wait 1 minute before retrying
+        finally:
+            processing.cancel()
+            await self.close()
 
 async def main():
     monitor = AntiPiracyMonitor()
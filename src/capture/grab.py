@@ -1,26 +1,46 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import time
 import random
+import re
 import logging
 import tempfile
 import subprocess
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
 from pathlib import Path
 
 import yt_dlp
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import AsyncRetrying, Retrying, stop_after_attempt, wait_exponential
 
-from ..shared.s3 import put_json, put_bytes
+from ..shared.s3 import put_json, put_file
 from ..shared.database import insert_evidence, update_detection_status
-from ..fp.video import compute_videohash, VideoHashResult
+from ..fp.video import compute_videohash, VideoHashResult, frame_gray_image, frame_hash_grids, batch_frame_hashes
 from ..fp.audio import compute_audio_fingerprint
 
+try:
+    import orjson
+
+    def _canonical_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def _canonical_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode()
+
 logger = logging.getLogger(__name__)
 
+# 16 bytes keeps fingerprint keys the same width as the old MD5 digests
+FINGERPRINT_DIGEST_SIZE = 16
+
+
+def _fingerprint_digest(obj: Any) -> str:
+    """Stable hex digest of a fingerprint structure"""
+    return hashlib.blake2b(_canonical_bytes(obj), digest_size=FINGERPRINT_DIGEST_SIZE).hexdigest()
+
 
 @dataclass(frozen=True)
 class CaptureResult:
@@ -30,93 +50,152 @@ class CaptureResult:
     metadata: dict
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=4, max=10)
-)
-def capture_and_fingerprint(url: str, evidence_prefix: str) -> CaptureResult:
-    """Capture and fingerprint content - real implementation"""
+# Backoff between capture attempts; a failed download is retried before falling back
+CAPTURE_ATTEMPTS = 3
+_capture_stop = stop_after_attempt(CAPTURE_ATTEMPTS)
+_capture_wait = wait_exponential(multiplier=1, min=4, max=10)
+
+
+def _capture_once(url: str, evidence_prefix: str) -> CaptureResult:
+    """Download, fingerprint and upload one URL; raises so the caller can retry"""
     
     logger.info(f"Capturing content from: {url}")
     
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
         
-        try:
-            # Download video segment using yt-dlp
-            video_file, audio_file, metadata = _download_content(url, temp_path)
-            
-            # Compute video fingerprint
-            video_fp = None
-            if video_file and video_file.exists():
-                video_fp = _compute_video_fingerprint(video_file)
-            
-            # Compute audio fingerprint
-            audio_fp = None
-            if audio_file and audio_file.exists():
-                audio_fp = _compute_audio_fingerprint(audio_file)
-            
-            # Store artifacts in S3
-            s3_keys = _upload_artifacts(evidence_prefix, video_file, audio_file, metadata)
-            
-            # Create result
-            result = CaptureResult(
-                video_hash=video_fp.get('hash', '') if video_fp else '',
-                audio_fp=audio_fp.get('hash', '') if audio_fp else '',
-                evidence_key=evidence_prefix,
-                metadata=metadata
+        # Download video segment using yt-dlp
+        video_file, audio_file, metadata = _download_content(url, temp_path)
+        
+        # Fingerprint and upload side by side; the freshly written files are
+        # still in the page cache, so the parallel reads don't hit disk again
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            video_future = (
+                pool.submit(_compute_video_fingerprint, video_file)
+                if video_file and video_file.exists() else None
+            )
+            audio_future = (
+                pool.submit(_compute_audio_fingerprint, audio_file)
+                if audio_file and audio_file.exists() else None
+            )
+            upload_future = pool.submit(
+                _upload_artifacts, evidence_prefix, video_file, audio_file, metadata
             )
             
-            logger.info(f"Successfully captured and fingerprinted: {url}")
-            return result
-            
-        except Exception as e:
-            logger.error(f"Failed to capture content from {url}: {e}")
-            # Fallback to mock implementation
-            return _capture_fallback(url, evidence_prefix)
+            video_fp = video_future.result() if video_future else None
+            audio_fp = audio_future.result() if audio_future else None
+            upload_future.result()
+        
+        # Create result
+        result = CaptureResult(
+            video_hash=video_fp.get('hash', '') if video_fp else '',
+            audio_fp=audio_fp.get('hash', '') if audio_fp else '',
+            evidence_key=evidence_prefix,
+            metadata=metadata
+        )
+        
+        logger.info(f"Successfully captured and fingerprinted: {url}")
+        return result
+
+
+def capture_and_fingerprint(url: str, evidence_prefix: str) -> CaptureResult:
+    """Capture and fingerprint content - real implementation"""
+    try:
+        for attempt in Retrying(stop=_capture_stop, wait=_capture_wait, reraise=True):
+            with attempt:
+                return _capture_once(url, evidence_prefix)
+    except Exception as e:
+        logger.error(f"Failed to capture content from {url}: {e}")
+    # Fallback to mock implementation
+    return _capture_fallback(url, evidence_prefix)
+
+
+async def capture_and_fingerprint_async(url: str, evidence_prefix: str,
+                                        executor: Optional[Executor] = None) -> CaptureResult:
+    """Like capture_and_fingerprint, but backs off on the event loop instead of a worker thread"""
+    loop = asyncio.get_running_loop()
+    try:
+        async for attempt in AsyncRetrying(stop=_capture_stop, wait=_capture_wait, reraise=True):
+            with attempt:
+                return await loop.run_in_executor(executor, _capture_once, url, evidence_prefix)
+    except Exception as e:
+        logger.error(f"Failed to capture content from {url}: {e}")
+    return await loop.run_in_executor(executor, _capture_fallback, url, evidence_prefix)
+
+
+def _begin_capture(detection_id: int) -> Optional[tuple[str, str]]:
+    """Look up a detection and mark it captured; returns (url, evidence_prefix)"""
+    from ..shared.database import get_detection_by_id
+    
+    # Get detection details
+    detection = get_detection_by_id(detection_id)
+    if not detection:
+        logger.error(f"Detection {detection_id} not found")
+        return None
+    
+    url = detection['url']
+    evidence_prefix = f"evidence/detection_{detection_id}_{int(time.time())}"
+    
+    # Update status to captured
+    update_detection_status(detection_id, "captured")
+    return url, evidence_prefix
+
+
+def _store_capture(detection_id: int, evidence_prefix: str, result: CaptureResult) -> Optional[int]:
+    """Store the evidence row for a capture and mark the detection fingerprinted"""
+    evidence_id = insert_evidence(
+        detection_id=detection_id,
+        s3_key_json={
+            "video_file": f"{evidence_prefix}/video.mp4",
+            "audio_file": f"{evidence_prefix}/audio.wav",
+            "metadata": f"{evidence_prefix}/metadata.json"
+        },
+        video_fp=result.metadata.get('video_fp'),
+        audio_fp=result.metadata.get('audio_fp'),
+        duration_sec=result.metadata.get('duration', 0)
+    )
+    
+    if evidence_id:
+        # Update status to fingerprinted
+        update_detection_status(detection_id, "fingerprinted")
+        logger.info(f"Evidence {evidence_id} created for detection {detection_id}")
+        return evidence_id
+    else:
+        logger.error(f"Failed to store evidence for detection {detection_id}")
+        return None
 
 
 def capture_detection(detection_id: int) -> Optional[int]:
     """Capture content for a detection and store evidence"""
     try:
-        from ..shared.database import get_detection_by_id
-        
-        # Get detection details
-        detection = get_detection_by_id(detection_id)
-        if not detection:
-            logger.error(f"Detection {detection_id} not found")
+        started = _begin_capture(detection_id)
+        if not started:
             return None
-        
-        url = detection['url']
-        evidence_prefix = f"evidence/detection_{detection_id}_{int(time.time())}"
-        
-        # Update status to captured
-        update_detection_status(detection_id, "captured")
+        url, evidence_prefix = started
         
         # Capture and fingerprint
         result = capture_and_fingerprint(url, evidence_prefix)
+        return _store_capture(detection_id, evidence_prefix, result)
+            
+    except Exception as e:
+        logger.error(f"Error capturing detection {detection_id}: {e}")
+        return None
+
+
+async def capture_detection_async(detection_id: int,
+                                  executor: Optional[Executor] = None) -> Optional[int]:
+    """capture_detection for the event loop; blocking steps run on `executor`"""
+    loop = asyncio.get_running_loop()
+    try:
+        started = await loop.run_in_executor(executor, _begin_capture, detection_id)
+        if not started:
+            return None
+        url, evidence_prefix = started
         
-        # Store evidence in database
-        evidence_id = insert_evidence(
-            detection_id=detection_id,
-            s3_key_json={
-                "video_file": f"{evidence_prefix}/video.mp4",
-                "audio_file": f"{evidence_prefix}/audio.wav",
-                "metadata": f"{evidence_prefix}/metadata.json"
-            },
-            video_fp=result.metadata.get('video_fp'),
-            audio_fp=result.metadata.get('audio_fp'),
-            duration_sec=result.metadata.get('duration', 0)
+        result = await capture_and_fingerprint_async(url, evidence_prefix, executor)
+        return await loop.run_in_executor(
+            executor, _store_capture, detection_id, evidence_prefix, result
         )
-        
-        if evidence_id:
-            # Update status to fingerprinted
-            update_detection_status(detection_id, "fingerprinted")
-            logger.info(f"Evidence {evidence_id} created for detection {detection_id}")
-            return evidence_id
-        else:
-            logger.error(f"Failed to store evidence for detection {detection_id}")
-            return None
             
     except Exception as e:
         logger.error(f"Error capturing detection {detection_id}: {e}")
@@ -140,11 +219,8 @@ def _download_content(url: str, temp_dir: Path) -> tuple[Optional[Path], Optiona
     }
     
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        # Extract info first
-        info = ydl.extract_info(url, download=False)
-        
-        # Download video
-        ydl.download([url])
+        # Extract info and download in one pass (download() would re-extract)
+        info = ydl.extract_info(url, download=True)
         
         # Find downloaded files
         video_file = None
@@ -174,50 +250,91 @@ def _download_content(url: str, temp_dir: Path) -> tuple[Optional[Path], Optiona
         return video_file, audio_file, metadata
 
 
+# Fingerprint one frame out of every FRAME_SAMPLE_STEP (roughly 1 second at 30fps)
+FRAME_SAMPLE_STEP = 30
+
+
+def _cuda_decode_available(cv2) -> bool:
+    """True when OpenCV was built with NVDEC support and a GPU is present"""
+    try:
+        return hasattr(cv2, "cudacodec") and cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except Exception:
+        return False
+
+
+def _iter_sampled_frames(cv2, cap, total_frames: int):
+    """Yield (index, frame) for sampled frames, seeking past the rest"""
+    if total_frames > 0:
+        for index in range(0, total_frames, FRAME_SAMPLE_STEP):
+            cap.set(cv2.CAP_PROP_POS_FRAMES, index)
+            ret, frame = cap.read()
+            if not ret:
+                break
+            yield index, frame
+        return
+    
+    # Unknown length (e.g. some live captures): grab() skips the colour conversion of unused frames
+    index = 0
+    while cap.grab():
+        if index % FRAME_SAMPLE_STEP == 0:
+            ret, frame = cap.retrieve()
+            if not ret:
+                break
+            yield index, frame
+        index += 1
+
+
+def _iter_sampled_frames_cuda(cv2, video_file: Path):
+    """Decode on the GPU and only download sampled frames to host memory"""
+    reader = cv2.cudacodec.createVideoReader(str(video_file))
+    index = 0
+    while True:
+        ret, gpu_frame = reader.nextFrame()
+        if not ret:
+            break
+        if index % FRAME_SAMPLE_STEP == 0:
+            yield index, gpu_frame.download()
+        index += 1
+
+
 def _compute_video_fingerprint(video_file: Path) -> Dict[str, Any]:
-    """Compute video fingerprint using OpenCV and imagehash"""
+    """Compute video fingerprint from pHash/dHash of sampled frames"""
     try:
         import cv2
-        import imagehash
-        from PIL import Image
         
-        cap = cv2.VideoCapture(str(video_file))
-        frame_hashes = []
+        cap = cv2.VideoCapture(str(video_file), cv2.CAP_FFMPEG)
         frame_timestamps = []
         
         fps = cap.get(cv2.CAP_PROP_FPS)
-        frame_count = 0
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
         
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
-            
-            # Sample every 30 frames (roughly 1 second at 30fps)
-            if frame_count % 30 == 0:
-                # Convert BGR to RGB
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                pil_image = Image.fromarray(frame_rgb)
-                
-                # Compute perceptual hash
-                phash = imagehash.phash(pil_image)
-                dhash = imagehash.dhash(pil_image)
-                
-                frame_hashes.append({
-                    "phash": str(phash),
-                    "dhash": str(dhash)
-                })
-                frame_timestamps.append(frame_count / fps)
-            
-            frame_count += 1
+        if _cuda_decode_available(cv2):
+            cap.release()
+            frames = _iter_sampled_frames_cuda(cv2, video_file)
+        else:
+            frames = _iter_sampled_frames(cv2, cap, total_frames)
+        
+        # Keep only the small hash grids per frame; hashes are computed in one batch below
+        phash_grids = []
+        dhash_grids = []
+        last_index = -1
+        for index, frame in frames:
+            # One BGR(A) -> gray conversion feeds both hash grids
+            phash_grid, dhash_grid = frame_hash_grids(frame_gray_image(frame))
+            phash_grids.append(phash_grid)
+            dhash_grids.append(dhash_grid)
+            frame_timestamps.append(index / fps)
+            last_index = index
         
         cap.release()
         
+        frame_hashes = batch_frame_hashes(phash_grids, dhash_grids)
+        
         return {
-            "hash": hashlib.md5(str(frame_hashes).encode()).hexdigest(),
+            "hash": _fingerprint_digest(frame_hashes),
             "frame_hashes": frame_hashes,
             "frame_timestamps": frame_timestamps,
-            "total_frames": frame_count,
+            "total_frames": total_frames or last_index + 1,
             "fps": fps
         }
         
@@ -235,15 +352,20 @@ def _compute_audio_fingerprint(audio_file: Path) -> Dict[str, Any]:
         # Load audio file
         y, sr = librosa.load(str(audio_file), sr=22050, duration=30)  # 30 seconds max
         
+        # One STFT shared by every feature below (each would otherwise recompute it)
+        magnitude = np.abs(librosa.stft(y, n_fft=2048, hop_length=512))
+        power = magnitude ** 2
+        
         # Compute MFCC features
-        mfccs = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13)
+        mel = librosa.feature.melspectrogram(S=power, sr=sr)
+        mfccs = librosa.feature.mfcc(S=librosa.power_to_db(mel), n_mfcc=13)
         
         # Compute chroma features
-        chroma = librosa.feature.chroma_stft(y=y, sr=sr)
+        chroma = librosa.feature.chroma_stft(S=power, sr=sr)
         
         # Compute spectral features
-        spectral_centroids = librosa.feature.spectral_centroid(y=y, sr=sr)
-        spectral_rolloff = librosa.feature.spectral_rolloff(y=y, sr=sr)
+        spectral_centroids = librosa.feature.spectral_centroid(S=magnitude, sr=sr)
+        spectral_rolloff = librosa.feature.spectral_rolloff(S=magnitude, sr=sr)
         
         # Create fingerprint
         fingerprint = {
@@ -256,8 +378,7 @@ def _compute_audio_fingerprint(audio_file: Path) -> Dict[str, Any]:
         }
         
         # Create hash from fingerprint
-        fingerprint_str = json.dumps(fingerprint, sort_keys=True)
-        fingerprint_hash = hashlib.md5(fingerprint_str.encode()).hexdigest()
+        fingerprint_hash = _fingerprint_digest(fingerprint)
         
         return {
             "hash": fingerprint_hash,
@@ -272,34 +393,28 @@ def _compute_audio_fingerprint(audio_file: Path) -> Dict[str, Any]:
 
 def _upload_artifacts(evidence_prefix: str, video_file: Optional[Path], 
                      audio_file: Optional[Path], metadata: Dict[str, Any]) -> Dict[str, str]:
-    """Upload artifacts to S3"""
+    """Upload artifacts to S3, all at once"""
     s3_keys = {}
     
-    try:
-        # Upload metadata
-        metadata_key = f"{evidence_prefix}/metadata.json"
-        put_json(metadata_key, metadata)
-        s3_keys["metadata"] = metadata_key
-        
-        # Upload video file
-        if video_file and video_file.exists():
-            video_key = f"{evidence_prefix}/video.mp4"
-            with open(video_file, 'rb') as f:
-                put_bytes(video_key, f.read())
-            s3_keys["video"] = video_key
-        
-        # Upload audio file
-        if audio_file and audio_file.exists():
-            audio_key = f"{evidence_prefix}/audio.wav"
-            with open(audio_file, 'rb') as f:
-                put_bytes(audio_key, f.read())
-            s3_keys["audio"] = audio_key
-        
-        return s3_keys
-        
-    except Exception as e:
-        logger.error(f"Error uploading artifacts: {e}")
-        return s3_keys
+    uploads = {"metadata": (f"{evidence_prefix}/metadata.json", put_json, metadata)}
+    if video_file and video_file.exists():
+        uploads["video"] = (f"{evidence_prefix}/video.mp4", put_file, video_file)
+    if audio_file and audio_file.exists():
+        uploads["audio"] = (f"{evidence_prefix}/audio.wav", put_file, audio_file)
+    
+    with ThreadPoolExecutor(max_workers=len(uploads)) as pool:
+        futures = {
+            name: pool.submit(upload, key, source)
+            for name, (key, upload, source) in uploads.items()
+        }
+        for name, future in futures.items():
+            try:
+                future.result()
+                s3_keys[name] = uploads[name][0]
+            except Exception as e:
+                logger.error(f"Error uploading {name} artifact: {e}")
+    
+    return s3_keys
 
 
 def _capture_fallback(url: str, evidence_prefix: str) -> CaptureResult:
@@ -346,31 +461,45 @@ def _capture_fallback(url: str, evidence_prefix: str) -> CaptureResult:
     )
 
 
+# Platform markers in one alternation; the group name is the platform
+_PLATFORM_RE = re.compile(
+    r"(?P<youtube>youtube\.com|youtu\.be)"
+    r"|(?P<telegram>t\.me|telegram)"
+    r"|(?P<facebook>facebook\.com|fb\.com)"
+    r"|(?P<twitter>twitter\.com|x\.com)"
+    r"|(?P<instagram>instagram\.com)"
+    r"|(?P<google>google\.com)",
+    re.IGNORECASE,
+)
+_BENGALI_RE = re.compile(r"[\u0980-\u09FF]")
+_ENGLISH_SPORTS_RE = re.compile(r"cricket|football|sports", re.IGNORECASE)
+
+# First matching sport wins; the remaining keywords all apply
+_SPORT_TAGS = (
+    ("cricket", ("cricket", "sports", "live", "streaming")),
+    ("football", ("football", "soccer", "sports", "live")),
+)
+_KEYWORD_TAGS = (
+    ("live", ("live",)),
+    ("stream", ("streaming",)),
+    ("hd", ("hd",)),
+    ("1080", ("hd",)),
+    ("tapmad", ("tapmad", "official", "copyrighted")),
+)
+
+
 def _detect_platform(url: str) -> str:
     """Detect platform from URL"""
-    url_lower = url.lower()
-    if "youtube.com" in url_lower or "youtu.be" in url_lower:
-        return "youtube"
-    elif "t.me" in url_lower or "telegram" in url_lower:
-        return "telegram"
-    elif "facebook.com" in url_lower or "fb.com" in url_lower:
-        return "facebook"
-    elif "twitter.com" in url_lower or "x.com" in url_lower:
-        return "twitter"
-    elif "instagram.com" in url_lower:
-        return "instagram"
-    elif "google.com" in url_lower:
-        return "google"
-    else:
-        return "unknown"
+    match = _PLATFORM_RE.search(url)
+    return match.lastgroup if match else "unknown"
 
 
 def _detect_language(url: str) -> str:
     """Detect language from URL or content"""
     # Simple language detection based on URL patterns
-    if any(char in url for char in "ট্যাপম্যাডখেলাম্যাচ"):
+    if _BENGALI_RE.search(url):
         return "bengali"
-    elif any(word in url.lower() for word in ["cricket", "football", "sports"]):
+    elif _ENGLISH_SPORTS_RE.search(url):
         return "english"
     else:
         return "mixed"
@@ -378,32 +507,19 @@ def _detect_language(url: str) -> str:
 
 def _generate_tags(url: str) -> list[str]:
     """Generate relevant tags for content"""
-    tags = []
     url_lower = url.lower()
+    tags = {_detect_platform(url)}
     
-    # Sports tags
-    if "cricket" in url_lower:
-        tags.extend(["cricket", "sports", "live", "streaming"])
-    elif "football" in url_lower:
-        tags.extend(["football", "soccer", "sports", "live"])
-    
-    # Platform tags
-    platform = _detect_platform(url)
-    tags.append(platform)
-    
-    # Content type tags
-    if "live" in url_lower:
-        tags.append("live")
-    if "stream" in url_lower:
-        tags.append("streaming")
-    if "hd" in url_lower or "1080" in url_lower:
-        tags.append("hd")
+    for keyword, keyword_tags in _SPORT_TAGS:
+        if keyword in url_lower:
+            tags.update(keyword_tags)
+            break
     
-    # Tapmad specific tags
-    if "tapmad" in url_lower:
-        tags.extend(["tapmad", "official", "copyrighted"])
+    for keyword, keyword_tags in _KEYWORD_TAGS:
+        if keyword in url_lower:
+            tags.update(keyword_tags)
     
-    return list(set(tags))  # Remove duplicates
+    return list(tags)
 
 
 def capture_screenshot(url: str, evidence_prefix: str) -> str:
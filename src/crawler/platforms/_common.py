@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import functools
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Callable, Iterable, Mapping, NamedTuple, ParamSpec, Union
+
+try:
+    # google-re2 scans in linear time whatever the input; the URL scan falls back to re
+    import re2 as _url_re
+except ImportError:
+    _url_re = re
+
+
+class Candidate(NamedTuple):
+    """A URL a platform search turned up, to be queued for capture"""
+    platform: str
+    url: str
+    title: str
+
+
+_P = ParamSpec("_P")
+
+
+def cached_candidates(build: Callable[_P, tuple[Candidate, ...]]) -> Callable[_P, list[Candidate]]:
+    """
+    Memoize a platform search. The same query always builds the same
+    candidates and Candidate is immutable, so the built tuple is cached and
+    each caller gets its own list copy.
+    """
+    cached = lru_cache(maxsize=1024)(build)
+
+    @functools.wraps(build)
+    def search(*args: _P.args, **kwargs: _P.kwargs) -> list[Candidate]:
+        return list(cached(*args, **kwargs))
+
+    return search
+
+
+def candidates_by_name(names: Iterable[str],
+                       make: Callable[[str], Candidate]) -> tuple[tuple[str, Candidate], ...]:
+    """
+    Build candidates that don't depend on the query once, each paired with
+    its lower-cased name for the query pattern to search.
+    """
+    return tuple((name.lower(), make(name)) for name in names)
+
+
+def nfc(text: str) -> str:
+    """
+    Bring text to Unicode NFC, the form keyword patterns are compiled in.
+    Bengali can spell the same word with precomposed or combining
+    characters; text that is already NFC comes back as the same object
+    after a quick check, without being copied.
+    """
+    return unicodedata.normalize("NFC", text)
+
+
+def keyword_needles(keywords: Iterable[str]) -> tuple[str, ...]:
+    """
+    Prepare keywords for contains_any: NFC-normalized and casefolded once.
+    Keywords that contain another keyword are dropped, since the shorter
+    one already matches wherever they would.
+    """
+    unique = list(dict.fromkeys(nfc(k).casefold() for k in keywords))
+    return tuple(k for k in unique if not any(other != k and other in k for other in unique))
+
+
+def contains_any(text: str, needles: tuple[str, ...]) -> bool:
+    """
+    Check whether the text contains any of the keyword_needles, ignoring case.
+    Each needle is found with str's C substring search, which skips through
+    a page several times faster than an alternation regex walks it.
+    """
+    folded = nfc(text).casefold()
+    return any(needle in folded for needle in needles)
+
+
+@lru_cache(maxsize=1024)
+def query_pattern(query: str) -> re.Pattern[str]:
+    """Compile the query and its words into one alternation so each name is scanned once"""
+    terms = sorted({query, *query.split()}, key=len, reverse=True)
+    return re.compile("|".join(re.escape(term) for term in terms))
+
+
+# Start of an http(s) URL up to the end of its host; video hosts are then picked by dict lookup
+_URL_RE = _url_re.compile(r"(?i)https?://([\w.\-]+)")
+
+
+def video_url_tails(
+    tails: Mapping[str, Union[str, tuple[str, ...]]], bare_hosts: Iterable[str] = ()
+) -> dict[str, tuple[re.Pattern[str], ...]]:
+    """
+    Compile per-host path patterns for find_video_urls; a host may have
+    several. Each host also answers with a "www." prefix unless it is
+    listed in bare_hosts.
+    """
+    bare = frozenset(bare_hosts)
+    compiled = {}
+    for host, host_tails in tails.items():
+        if isinstance(host_tails, str):
+            host_tails = (host_tails,)
+        patterns = tuple(re.compile(tail, re.IGNORECASE) for tail in host_tails)
+        compiled[host] = patterns
+        if host not in bare:
+            compiled["www." + host] = patterns
+    return compiled
+
+
+def find_video_urls(text: str, tails: Mapping[str, tuple[re.Pattern[str], ...]]) -> list[str]:
+    """
+    Extract video URLs in one pass: every URL start is found once, then
+    only the path patterns of its host are tried there, instead of every
+    host's pattern at every "http" in the text. Starts are visited even
+    inside another URL, so redirect links such as
+    google.com/url?q=https://youtu.be/... still yield the nested video URL.
+    Like a separate findall per pattern, a pattern never matches again
+    inside text it already matched.
+    """
+    urls = []
+    matched_until = {}
+    pos = 0
+    while True:
+        match = _URL_RE.search(text, pos)
+        if match is None:
+            break
+        start = pos = match.start()
+        pos += 1
+        host = match.group(1).lower()
+        patterns = tails.get(host)
+        if patterns is None:
+            continue
+        host = host.removeprefix("www.")
+        for i, tail in enumerate(patterns):
+            if start < matched_until.get((host, i), 0):
+                continue
+            path = tail.match(text, match.end())
+            if path:
+                urls.append(text[start:path.end()])
+                matched_until[host, i] = path.end()
+    return urls
+
+
+# Keywords every platform's sports check uses; modules add their own on top
+SPORTS_KEYWORDS = (
+    'live', 'stream', 'match', 'game', 'cricket', 'football', 'soccer',
+    'sports', 'highlight', 'score', 'commentary', 'broadcast',
+    'খেলা', 'লাইভ', 'ম্যাচ', 'স্পোর্টস', 'হাইলাইট',
+)
+SPORTS_NEEDLES = keyword_needles(SPORTS_KEYWORDS)
+
+LIVE_INDICATORS = (
+    'live', 'streaming', 'live now', 'watch live', 'live match',
+    'live score', 'live commentary', 'live broadcast',
+    'লাইভ', 'স্ট্রিমিং', 'লাইভ এখন', 'লাইভ ম্যাচ',
+    'লাইভ স্কোর', 'লাইভ কমেন্টারি', 'লাইভ সম্প্রচার',
+)
+LIVE_NEEDLES = keyword_needles(LIVE_INDICATORS)
+
+# Path patterns of the video hosts shared on social platforms, keyed by host
+SOCIAL_VIDEO_PATHS = {
+    "youtube.com": r'/watch\?v=[\w-]+',
+    "youtu.be": r'/[\w-]+',
+    "facebook.com": r'/.*?/videos/[\d]+',
+    "t.me": r'/[\w]+/\d+',
+    "instagram.com": (r'/p/[\w-]+', r'/reel/[\w-]+'),
+}
+SOCIAL_VIDEO_TAILS = video_url_tails(SOCIAL_VIDEO_PATHS)
+
+
+class TextSignals(NamedTuple):
+    """Everything the platform checks read off one piece of crawled text"""
+    sports: bool
+    live: bool
+    video_urls: list[str]
+
+
+def classify_text(
+    text: str, sports_needles: tuple[str, ...], tails: Mapping[str, tuple[re.Pattern[str], ...]]
+) -> TextSignals:
+    """
+    Run the sports, live and video-URL checks together. The text is
+    normalized and casefolded once for both keyword checks, instead of
+    once per predicate, so callers that need several answers about the
+    same page should use this.
+    """
+    folded = nfc(text).casefold()
+    return TextSignals(
+        sports=any(needle in folded for needle in sports_needles),
+        live=any(needle in folded for needle in LIVE_NEEDLES),
+        video_urls=find_video_urls(text, tails),
+    )
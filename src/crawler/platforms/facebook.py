@@ -1,39 +1,43 @@
 from __future__ import annotations
 
+from ._common import Candidate, cached_candidates, candidates_by_name, query_pattern
 
-def candidates_from_query(query: str) -> list[dict[str, str]]:
+# Common Facebook pages that might have sports content
+PAGES = (
+    "tapmad.bd",
+    "sports.bangladesh",
+    "cricket.live.bd",
+    "football.streams.bd",
+    "live.sports.bangla",
+)
+_PAGE_CANDIDATES = candidates_by_name(
+    PAGES, lambda page: Candidate("facebook", f"https://www.facebook.com/{page}", f"Facebook Page: {page}")
+)
+_VIDEO_SEARCH_URL = "https://www.facebook.com/search/videos/?q="
+
+
+@cached_candidates
+def candidates_from_query(query: str) -> tuple[Candidate, ...]:
     """
     Search for Facebook videos and pages related to the query.
     Returns actual video URLs and page URLs when possible.
     """
-    # Common Facebook pages that might have sports content
-    pages = [
-        "tapmad.bd",
-        "sports.bangladesh", 
-        "cricket.live.bd",
-        "football.streams.bd",
-        "live.sports.bangla"
-    ]
-    
     results = []
+    pattern = query_pattern(query.lower())
     
     # Add page URLs
-    for page in pages:
-        if query.lower() in page.lower() or any(word in page.lower() for word in query.lower().split()):
-            results.append({
-                "platform": "facebook",
-                "url": f"https://www.facebook.com/{page}",
-                "title": f"Facebook Page: {page}"
-            })
+    for page_lower, candidate in _PAGE_CANDIDATES:
+        if pattern.search(page_lower):
+            results.append(candidate)
     
     # Add video search results
-    search_url = f"https://www.facebook.com/search/videos/?q={query.replace(' ', '+')}"
-    results.append({
-        "platform": "facebook",
-        "url": search_url,
-        "title": f"Facebook Video Search: {query}"
-    })
+    search_url = _VIDEO_SEARCH_URL + query.replace(' ', '+')
+    results.append(Candidate(
+        platform="facebook",
+        url=search_url,
+        title=f"Facebook Video Search: {query}",
+    ))
     
-    return results[:5]  # Limit to 5 results
+    return tuple(results[:5])  # Limit to 5 results
 
 
@@ -1,87 +1,123 @@
 from __future__ import annotations
 
-import re
-from typing import List, Dict
+from itertools import islice
+from typing import Iterator, List, Tuple
 from urllib.parse import quote_plus
 
+from ._common import (
+    LIVE_NEEDLES,
+    SOCIAL_VIDEO_PATHS,
+    SPORTS_KEYWORDS,
+    Candidate,
+    TextSignals,
+    cached_candidates,
+    classify_text,
+    contains_any,
+    find_video_urls,
+    keyword_needles,
+    video_url_tails,
+)
 
-def search_candidates(query: str, max_results: int = 5) -> List[Dict[str, str]]:
+
+# Search strategies appended to the quoted query, English first, then Bengali
+_EN_QUERY_SUFFIXES = (
+    " live stream",
+    " watch online",
+    " free streaming",
+    " live match",
+    " highlights",
+    " full match",
+    " replay",
+    " live score",
+    " commentary",
+    " broadcast",
+)
+_BN_QUERY_SUFFIXES = (
+    " লাইভ স্ট্রিম",
+    " অনলাইন দেখুন",
+    " ফ্রি স্ট্রিমিং",
+    " লাইভ ম্যাচ",
+    " হাইলাইটস",
+    " সম্পূর্ণ ম্যাচ",
+    " রিপ্লে",
+    " লাইভ স্কোর",
+    " কমেন্টারি",
+    " সম্প্রচার",
+)
+_QUERY_SUFFIXES = _EN_QUERY_SUFFIXES + _BN_QUERY_SUFFIXES
+# quote_plus encodes character by character, so the constant halves are encoded once here
+_ENCODED_QUERY_SUFFIXES = tuple((suffix, quote_plus(suffix)) for suffix in _QUERY_SUFFIXES)
+
+# Video hosting sites for site-specific searches
+VIDEO_SITES = (
+    "youtube.com",
+    "dailymotion.com",
+    "vimeo.com",
+    "facebook.com/videos",
+    "twitter.com",
+    "instagram.com",
+    "tiktok.com",
+    "reddit.com/r/soccerstreams",
+    "reddit.com/r/footballhighlights",
+    "streamable.com",
+    "clippituser.tv",
+    "v.redd.it",
+)
+# (title prefix, encoded query suffix) per site, so a search only appends the query
+_SITE_SEARCHES = tuple(
+    (f"Google Search on {site}: ", quote_plus(f" site:{site}")) for site in VIDEO_SITES
+)
+_SEARCH_URL = "https://www.google.com/search?q="
+_VIDEO_SEARCH_TITLE = "Google Video Search: "
+
+
+def _iter_video_searches(quoted: str, encoded_quoted: str) -> Iterator[Candidate]:
+    """Yield video-search candidates one strategy at a time, English first."""
+    for suffix, encoded_suffix in _ENCODED_QUERY_SUFFIXES:
+        yield Candidate(
+            platform="google",
+            url=_SEARCH_URL + encoded_quoted + encoded_suffix + "&tbm=vid",
+            title=_VIDEO_SEARCH_TITLE + quoted + suffix,
+        )
+
+
+@cached_candidates
+def search_candidates(query: str, max_results: int = 5) -> Tuple[Candidate, ...]:
     """
     Search for Google results related to the query.
     Returns search URLs and potential video hosting sites.
     """
-    results = []
-    
-    # Create Google search URLs with different search strategies
-    search_queries = [
-        f'"{query}" live stream',
-        f'"{query}" watch online',
-        f'"{query}" free streaming',
-        f'"{query}" live match',
-        f'"{query}" highlights',
-        f'"{query}" full match',
-        f'"{query}" replay',
-        f'"{query}" live score',
-        f'"{query}" commentary',
-        f'"{query}" broadcast'
-    ]
+    quoted = f'"{query}"'
+    encoded_quoted = quote_plus(quoted)
     
-    # Add Bengali language searches
-    bengali_queries = [
-        f'"{query}" লাইভ স্ট্রিম',
-        f'"{query}" অনলাইন দেখুন',
-        f'"{query}" ফ্রি স্ট্রিমিং',
-        f'"{query}" লাইভ ম্যাচ',
-        f'"{query}" হাইলাইটস',
-        f'"{query}" সম্পূর্ণ ম্যাচ',
-        f'"{query}" রিপ্লে',
-        f'"{query}" লাইভ স্কোর',
-        f'"{query}" কমেন্টারি',
-        f'"{query}" সম্প্রচার'
-    ]
-    
-    # Combine English and Bengali queries
-    all_queries = search_queries + bengali_queries
-    
-    for search_query in all_queries[:max_results]:
-        # Create Google search URL
-        encoded_query = quote_plus(search_query)
-        search_url = f"https://www.google.com/search?q={encoded_query}&tbm=vid"
-        
-        results.append({
-            "platform": "google",
-            "url": search_url,
-            "title": f"Google Video Search: {search_query}"
-        })
+    # Create Google search URLs with different search strategies; only the
+    # strategies that fit in max_results are ever built
+    results = list(islice(_iter_video_searches(quoted, encoded_quoted), max_results))
     
     # Add specific video hosting site searches
-    video_sites = [
-        "youtube.com",
-        "dailymotion.com", 
-        "vimeo.com",
-        "facebook.com/videos",
-        "twitter.com",
-        "instagram.com",
-        "tiktok.com",
-        "reddit.com/r/soccerstreams",
-        "reddit.com/r/footballhighlights",
-        "streamable.com",
-        "clippituser.tv",
-        "v.redd.it"
-    ]
-    
-    for site in video_sites[:3]:  # Limit to 3 site-specific searches
-        site_query = f'"{query}" site:{site}'
-        encoded_query = quote_plus(site_query)
-        search_url = f"https://www.google.com/search?q={encoded_query}"
+    for title_prefix, encoded_site in _SITE_SEARCHES[:3]:  # Limit to 3 site-specific searches
+        search_url = _SEARCH_URL + encoded_quoted + encoded_site
         
-        results.append({
-            "platform": "google",
-            "url": search_url,
-            "title": f"Google Search on {site}: {query}"
-        })
+        results.append(Candidate(
+            platform="google",
+            url=search_url,
+            title=title_prefix + query,
+        ))
     
-    return results[:max_results]
+    return tuple(results[:max_results])
+
+
+# Path patterns of common video hosts, keyed by host
+_VIDEO_TAILS = video_url_tails({
+    **SOCIAL_VIDEO_PATHS,
+    "dailymotion.com": r'/video/[\w-]+',
+    "vimeo.com": r'/\d+',
+    "tiktok.com": r'/@[\w]+/video/[\d]+',
+    "reddit.com": r'/r/[\w]+/comments/[\w]+',
+    "streamable.com": r'/[\w]+',
+    "clippituser.tv": r'/c/[\w]+',
+    "v.redd.it": r'/[\w]+',
+}, bare_hosts=("v.redd.it",))
 
 
 def extract_video_urls(search_results: str) -> List[str]:
@@ -89,91 +125,66 @@ def extract_video_urls(search_results: str) -> List[str]:
     Extract potential video URLs from Google search results.
     This is a simplified version - in production you'd use Google Search API.
     """
-    # Look for common video hosting patterns
-    video_patterns = [
-        r'https?://(?:www\.)?youtube\.com/watch\?v=[\w-]+',
-        r'https?://(?:www\.)?youtu\.be/[\w-]+',
-        r'https?://(?:www\.)?dailymotion\.com/video/[\w-]+',
-        r'https?://(?:www\.)?vimeo\.com/\d+',
-        r'https?://(?:www\.)?facebook\.com/.*?/videos/[\d]+',
-        r'https?://(?:www\.)?t\.me/[\w]+/\d+',
-        r'https?://(?:www\.)?instagram\.com/p/[\w-]+',
-        r'https?://(?:www\.)?instagram\.com/reel/[\w-]+',
-        r'https?://(?:www\.)?tiktok\.com/@[\w]+/video/[\d]+',
-        r'https?://(?:www\.)?reddit\.com/r/[\w]+/comments/[\w]+',
-        r'https?://(?:www\.)?streamable\.com/[\w]+',
-        r'https?://(?:www\.)?clippituser\.tv/c/[\w]+',
-        r'https?://v\.redd\.it/[\w]+'
-    ]
-    
-    urls = []
-    for pattern in video_patterns:
-        matches = re.findall(pattern, search_results, re.IGNORECASE)
-        urls.extend(matches)
-    
-    return urls
+    return find_video_urls(search_results, _VIDEO_TAILS)
+
+
+# Search results also name competitions, so tournament words count as sports too
+_SPORTS_NEEDLES = keyword_needles(SPORTS_KEYWORDS + (
+    'tournament', 'league', 'championship', 'cup', 'final',
+    'টুর্নামেন্ট', 'লিগ', 'চ্যাম্পিয়নশিপ', 'কাপ', 'ফাইনাল',
+))
 
 
 def is_sports_related(search_text: str) -> bool:
     """
     Check if search text is sports-related.
     """
-    sports_keywords = [
-        'live', 'stream', 'match', 'game', 'cricket', 'football', 'soccer',
-        'sports', 'highlight', 'score', 'commentary', 'broadcast',
-        'tournament', 'league', 'championship', 'cup', 'final',
-        'খেলা', 'লাইভ', 'ম্যাচ', 'স্পোর্টস', 'হাইলাইট', 'টুর্নামেন্ট',
-        'লিগ', 'চ্যাম্পিয়নশিপ', 'কাপ', 'ফাইনাল'
-    ]
-    
-    text_lower = search_text.lower()
-    return any(keyword in text_lower for keyword in sports_keywords)
+    return contains_any(search_text, _SPORTS_NEEDLES)
 
 
 def is_live_content(search_text: str) -> bool:
     """
     Check if search text indicates live content.
     """
-    live_indicators = [
-        'live', 'streaming', 'live now', 'watch live', 'live match',
-        'live score', 'live commentary', 'live broadcast',
-        'লাইভ', 'স্ট্রিমিং', 'লাইভ এখন', 'লাইভ ম্যাচ',
-        'লাইভ স্কোর', 'লাইভ কমেন্টারি', 'লাইভ সম্প্রচার'
-    ]
-    
-    text_lower = search_text.lower()
-    return any(indicator in text_lower for indicator in live_indicators)
+    return contains_any(search_text, LIVE_NEEDLES)
 
 
-def get_search_suggestions(query: str) -> List[str]:
+def classify_search_text(search_text: str) -> TextSignals:
+    """
+    Check sports, live and video URLs of search text in one go.
+    """
+    return classify_text(search_text, _SPORTS_NEEDLES, _VIDEO_TAILS)
+
+
+# Suggestion suffixes, English then Bengali
+_SUGGESTION_SUFFIXES = (
+    " live",
+    " stream",
+    " watch",
+    " online",
+    " free",
+    " highlights",
+    " full match",
+    " replay",
+    " commentary",
+    " broadcast",
+    " লাইভ",
+    " স্ট্রিম",
+    " দেখুন",
+    " অনলাইন",
+    " ফ্রি",
+    " হাইলাইটস",
+    " সম্পূর্ণ ম্যাচ",
+    " রিপ্লে",
+    " কমেন্টারি",
+    " সম্প্রচার",
+)
+
+
+def get_search_suggestions(query: str) -> Iterator[str]:
     """
     Get search suggestions for better coverage.
+    Suggestions are yielded lazily; use itertools.islice to take only a few.
     """
-    base_suggestions = [
-        f"{query} live",
-        f"{query} stream",
-        f"{query} watch",
-        f"{query} online",
-        f"{query} free",
-        f"{query} highlights",
-        f"{query} full match",
-        f"{query} replay",
-        f"{query} commentary",
-        f"{query} broadcast"
-    ]
-    
-    # Add Bengali suggestions
-    bengali_suggestions = [
-        f"{query} লাইভ",
-        f"{query} স্ট্রিম",
-        f"{query} দেখুন",
-        f"{query} অনলাইন",
-        f"{query} ফ্রি",
-        f"{query} হাইলাইটস",
-        f"{query} সম্পূর্ণ ম্যাচ",
-        f"{query} রিপ্লে",
-        f"{query} কমেন্টারি",
-        f"{query} সম্প্রচার"
-    ]
-    
-    return base_suggestions + bengali_suggestions
+    for suffix in _SUGGESTION_SUFFIXES:
+        yield query + suffix
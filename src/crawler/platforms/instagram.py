@@ -1,118 +1,132 @@
 from __future__ import annotations
 
 import re
-from typing import List, Dict
+from typing import List, Tuple
 
+from ._common import (
+    LIVE_NEEDLES,
+    SOCIAL_VIDEO_TAILS,
+    SPORTS_KEYWORDS,
+    Candidate,
+    TextSignals,
+    cached_candidates,
+    candidates_by_name,
+    classify_text,
+    contains_any,
+    find_video_urls,
+    keyword_needles,
+    query_pattern,
+)
 
-def search_candidates(query: str, max_results: int = 5) -> List[Dict[str, str]]:
+
+# Common Instagram accounts that might have sports content
+ACCOUNTS = (
+    "tapmad.bd",
+    "sports.bangladesh",
+    "cricket.live.bd",
+    "football.streams",
+    "live.sports.bd",
+    "bpl.live",
+    "cricket.world.cup.bd",
+    "sports.news.bd",
+)
+
+# Sports venues for location-based searches
+SPORTS_LOCATIONS = (
+    "sher-e-bangla-national-cricket-stadium",
+    "bangabandhu-national-stadium",
+    "mirpur-sher-e-bangla-cricket-stadium",
+)
+
+_ACCOUNT_CANDIDATES = candidates_by_name(
+    ACCOUNTS, lambda account: Candidate(
+        "instagram", f"https://www.instagram.com/{account}/", f"Instagram Account: @{account}"
+    )
+)
+_LOCATION_CANDIDATES = candidates_by_name(
+    SPORTS_LOCATIONS, lambda location: Candidate(
+        "instagram",
+        f"https://www.instagram.com/explore/locations/{location}/",
+        f"Instagram Location: {location.replace('-', ' ').title()}",
+    )
+)
+_TAGS_URL = "https://www.instagram.com/explore/tags/"
+
+
+@cached_candidates
+def search_candidates(query: str, max_results: int = 5) -> Tuple[Candidate, ...]:
     """
     Search for Instagram posts and stories related to the query.
     Returns actual post URLs and user URLs when possible.
     """
-    # Common Instagram accounts that might have sports content
-    accounts = [
-        "tapmad.bd",
-        "sports.bangladesh", 
-        "cricket.live.bd",
-        "football.streams",
-        "live.sports.bd",
-        "bpl.live",
-        "cricket.world.cup.bd",
-        "sports.news.bd"
-    ]
-    
     results = []
+    pattern = query_pattern(query.lower())
     
     # Add account URLs
-    for account in accounts:
-        if query.lower() in account.lower() or any(word in account.lower() for word in query.lower().split()):
-            results.append({
-                "platform": "instagram",
-                "url": f"https://www.instagram.com/{account}/",
-                "title": f"Instagram Account: @{account}"
-            })
+    for account_lower, candidate in _ACCOUNT_CANDIDATES:
+        if pattern.search(account_lower):
+            results.append(candidate)
     
     # Add search results
-    search_query = query.replace(' ', '+')
-    search_url = f"https://www.instagram.com/explore/tags/{search_query}/"
-    results.append({
-        "platform": "instagram",
-        "url": search_url,
-        "title": f"Instagram Hashtag: #{query.replace(' ', '')}"
-    })
+    search_url = _TAGS_URL + query.replace(' ', '+') + "/"
+    results.append(Candidate(
+        platform="instagram",
+        url=search_url,
+        title=f"Instagram Hashtag: #{query.replace(' ', '')}",
+    ))
     
     # Add location-based searches for sports venues
-    sports_locations = [
-        "sher-e-bangla-national-cricket-stadium",
-        "bangabandhu-national-stadium",
-        "mirpur-sher-e-bangla-cricket-stadium"
-    ]
-    
-    for location in sports_locations:
-        if any(word in location for word in query.lower().split()):
-            results.append({
-                "platform": "instagram",
-                "url": f"https://www.instagram.com/explore/locations/{location}/",
-                "title": f"Instagram Location: {location.replace('-', ' ').title()}"
-            })
+    has_words = bool(query.split())
+    for location, candidate in _LOCATION_CANDIDATES:
+        if has_words and pattern.search(location):
+            results.append(candidate)
     
-    return results[:max_results]
+    return tuple(results[:max_results])
 
 
 def extract_video_urls(post_text: str) -> List[str]:
     """
     Extract potential video URLs from Instagram post text.
     """
-    # Look for common video hosting patterns
-    video_patterns = [
-        r'https?://(?:www\.)?youtube\.com/watch\?v=[\w-]+',
-        r'https?://(?:www\.)?youtu\.be/[\w-]+',
-        r'https?://(?:www\.)?facebook\.com/.*?/videos/[\d]+',
-        r'https?://(?:www\.)?t\.me/[\w]+/\d+',
-        r'https?://(?:www\.)?instagram\.com/p/[\w-]+',
-        r'https?://(?:www\.)?instagram\.com/reel/[\w-]+',
-    ]
-    
-    urls = []
-    for pattern in video_patterns:
-        matches = re.findall(pattern, post_text, re.IGNORECASE)
-        urls.extend(matches)
-    
-    return urls
+    return find_video_urls(post_text, SOCIAL_VIDEO_TAILS)
+
+
+# Posts are often from the venue, so ground and team words count as sports too
+_SPORTS_NEEDLES = keyword_needles(SPORTS_KEYWORDS + (
+    'stadium', 'ground', 'field', 'pitch', 'team', 'player', 'স্টেডিয়াম',
+))
 
 
 def is_sports_related(post_text: str) -> bool:
     """
     Check if Instagram post text is sports-related.
     """
-    sports_keywords = [
-        'live', 'stream', 'match', 'game', 'cricket', 'football', 'soccer',
-        'sports', 'highlight', 'score', 'commentary', 'broadcast',
-        'stadium', 'ground', 'field', 'pitch', 'team', 'player',
-        'খেলা', 'লাইভ', 'ম্যাচ', 'স্পোর্টস', 'হাইলাইট', 'স্টেডিয়াম'
-    ]
-    
-    post_lower = post_text.lower()
-    return any(keyword in post_lower for keyword in sports_keywords)
+    return contains_any(post_text, _SPORTS_NEEDLES)
+
+
+_HASHTAG_RE = re.compile(r'#(\w+)')
 
 
 def extract_hashtags(post_text: str) -> List[str]:
     """
     Extract hashtags from Instagram post text.
     """
-    hashtag_pattern = r'#(\w+)'
-    hashtags = re.findall(hashtag_pattern, post_text)
-    return hashtags
+    # Most captions carry no tag at all; a C substring check settles those
+    # without starting the regex engine
+    if "#" not in post_text:
+        return []
+    return _HASHTAG_RE.findall(post_text)
 
 
 def is_live_content(post_text: str) -> bool:
     """
     Check if post indicates live content.
     """
-    live_indicators = [
-        'live', 'streaming', 'live now', 'watch live', 'live match',
-        'লাইভ', 'স্ট্রিমিং', 'লাইভ এখন', 'লাইভ ম্যাচ'
-    ]
-    
-    post_lower = post_text.lower()
-    return any(indicator in post_lower for indicator in live_indicators)
+    return contains_any(post_text, LIVE_NEEDLES)
+
+
+def classify_post(post_text: str) -> TextSignals:
+    """
+    Check sports, live and video URLs of an Instagram post in one go.
+    """
+    return classify_text(post_text, _SPORTS_NEEDLES, SOCIAL_VIDEO_TAILS)
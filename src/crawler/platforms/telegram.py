@@ -1,41 +1,46 @@
 from __future__ import annotations
 
+from ._common import Candidate, cached_candidates, candidates_by_name, query_pattern
 
-def candidates_from_query(query: str) -> list[dict[str, str]]:
+
+# Common Telegram channels that might have sports content
+CHANNELS = (
+    "sports_bangla",
+    "cricket_live_bd",
+    "football_streams",
+    "live_sports_bd",
+    "tapmad_sports",
+    "bpl_live",
+    "cricket_world_cup_bd",
+)
+_CHANNEL_CANDIDATES = candidates_by_name(
+    CHANNELS, lambda channel: Candidate("telegram", f"https://t.me/{channel}", f"Telegram Channel: {channel}")
+)
+_SEARCH_URL = "https://t.me/s/"
+
+
+@cached_candidates
+def candidates_from_query(query: str) -> tuple[Candidate, ...]:
     """
     Search for Telegram channels and posts related to the query.
     Returns actual channel URLs and post URLs when possible.
     """
-    # Common Telegram channels that might have sports content
-    channels = [
-        "sports_bangla",
-        "cricket_live_bd", 
-        "football_streams",
-        "live_sports_bd",
-        "tapmad_sports",
-        "bpl_live",
-        "cricket_world_cup_bd"
-    ]
-    
     results = []
+    pattern = query_pattern(query.lower())
     
     # Add channel URLs
-    for channel in channels:
-        if query.lower() in channel.lower() or any(word in channel.lower() for word in query.lower().split()):
-            results.append({
-                "platform": "telegram",
-                "url": f"https://t.me/{channel}",
-                "title": f"Telegram Channel: {channel}"
-            })
+    for channel_lower, candidate in _CHANNEL_CANDIDATES:
+        if pattern.search(channel_lower):
+            results.append(candidate)
     
     # Add search results
-    search_url = f"https://t.me/s/{query.replace(' ', '_')}"
-    results.append({
-        "platform": "telegram", 
-        "url": search_url,
-        "title": f"Telegram Search: {query}"
-    })
+    search_url = _SEARCH_URL + query.replace(' ', '_')
+    results.append(Candidate(
+        platform="telegram",
+        url=search_url,
+        title=f"Telegram Search: {query}",
+    ))
     
-    return results[:5]  # Limit to 5 results
+    return tuple(results[:5])  # Limit to 5 results
 
 
@@ -1,56 +1,75 @@
 from __future__ import annotations
 
-import re
-from typing import List, Dict
+from typing import List, Tuple
 
+from ._common import (
+    SOCIAL_VIDEO_PATHS,
+    SPORTS_NEEDLES,
+    Candidate,
+    cached_candidates,
+    candidates_by_name,
+    contains_any,
+    find_video_urls,
+    query_pattern,
+    video_url_tails,
+)
 
-def search_candidates(query: str, max_results: int = 5) -> List[Dict[str, str]]:
+
+# Common Twitter accounts that might have sports content
+ACCOUNTS = (
+    "tapmad_bd",
+    "sports_bangla",
+    "cricket_live_bd",
+    "football_streams",
+    "live_sports_bd",
+    "bpl_live",
+    "cricket_world_cup_bd",
+    "sports_news_bd",
+)
+_ACCOUNT_CANDIDATES = candidates_by_name(
+    ACCOUNTS, lambda account: Candidate("twitter", f"https://x.com/{account}", f"Twitter Account: @{account}")
+)
+_SEARCH_URL = "https://x.com/search?q="
+_SEARCH_SUFFIX = "&src=typed_query&f=live"
+_HASHTAG_SUFFIX = "&src=hashtag_click&f=live"
+
+
+@cached_candidates
+def search_candidates(query: str, max_results: int = 5) -> Tuple[Candidate, ...]:
     """
     Search for Twitter/X posts related to the query.
     Returns actual post URLs and user URLs when possible.
     """
-    # Common Twitter accounts that might have sports content
-    accounts = [
-        "tapmad_bd",
-        "sports_bangla", 
-        "cricket_live_bd",
-        "football_streams",
-        "live_sports_bd",
-        "bpl_live",
-        "cricket_world_cup_bd",
-        "sports_news_bd"
-    ]
-    
     results = []
+    pattern = query_pattern(query.lower())
     
     # Add account URLs
-    for account in accounts:
-        if query.lower() in account.lower() or any(word in account.lower() for word in query.lower().split()):
-            results.append({
-                "platform": "twitter",
-                "url": f"https://x.com/{account}",
-                "title": f"Twitter Account: @{account}"
-            })
+    for account_lower, candidate in _ACCOUNT_CANDIDATES:
+        if pattern.search(account_lower):
+            results.append(candidate)
     
     # Add search results
-    search_query = query.replace(' ', '+')
-    search_url = f"https://x.com/search?q={search_query}&src=typed_query&f=live"
-    results.append({
-        "platform": "twitter",
-        "url": search_url,
-        "title": f"Twitter Search: {query}"
-    })
+    search_url = _SEARCH_URL + query.replace(' ', '+') + _SEARCH_SUFFIX
+    results.append(Candidate(
+        platform="twitter",
+        url=search_url,
+        title=f"Twitter Search: {query}",
+    ))
     
     # Add hashtag searches
-    hashtag_query = f"%23{query.replace(' ', '')}"
-    hashtag_url = f"https://x.com/search?q={hashtag_query}&src=hashtag_click&f=live"
-    results.append({
-        "platform": "twitter",
-        "url": hashtag_url,
-        "title": f"Twitter Hashtag: #{query.replace(' ', '')}"
-    })
+    hashtag = query.replace(' ', '')
+    hashtag_url = _SEARCH_URL + "%23" + hashtag + _HASHTAG_SUFFIX
+    results.append(Candidate(
+        platform="twitter",
+        url=hashtag_url,
+        title=f"Twitter Hashtag: #{hashtag}",
+    ))
     
-    return results[:max_results]
+    return tuple(results[:max_results])
+
+
+# Shared video hosts, but only Instagram posts (not reels)
+_VIDEO_TAILS = video_url_tails({**SOCIAL_VIDEO_PATHS, "instagram.com": r'/p/[\w-]+'})
 
 
 def extract_video_urls(tweet_text: str) -> List[str]:
@@ -58,34 +77,13 @@ def extract_video_urls(tweet_text: str) -> List[str]:
     Extract potential video URLs from tweet text.
     This is a simplified version - in production you'd use Twitter API.
     """
-    # Look for common video hosting patterns
-    video_patterns = [
-        r'https?://(?:www\.)?youtube\.com/watch\?v=[\w-]+',
-        r'https?://(?:www\.)?youtu\.be/[\w-]+',
-        r'https?://(?:www\.)?facebook\.com/.*?/videos/[\d]+',
-        r'https?://(?:www\.)?t\.me/[\w]+/\d+',
-        r'https?://(?:www\.)?instagram\.com/p/[\w-]+',
-    ]
-    
-    urls = []
-    for pattern in video_patterns:
-        matches = re.findall(pattern, tweet_text, re.IGNORECASE)
-        urls.extend(matches)
-    
-    return urls
+    return find_video_urls(tweet_text, _VIDEO_TAILS)
 
 
 def is_sports_related(tweet_text: str) -> bool:
     """
     Check if tweet text is sports-related.
     """
-    sports_keywords = [
-        'live', 'stream', 'match', 'game', 'cricket', 'football', 'soccer',
-        'sports', 'highlight', 'score', 'commentary', 'broadcast',
-        'খেলা', 'লাইভ', 'ম্যাচ', 'স্পোর্টস', 'হাইলাইট'
-    ]
-    
-    tweet_lower = tweet_text.lower()
-    return any(keyword in tweet_lower for keyword in sports_keywords)
+    return contains_any(tweet_text, SPORTS_NEEDLES)
 
 
@@ -1,23 +1,57 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
-import random
+import re
+import threading
 import time
 import logging
-from typing import Any, Iterator, Optional, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Iterator, Optional, List
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+import httpx
+import numpy as np
 import requests
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from requests.adapters import HTTPAdapter
+from tenacity import AsyncRetrying, retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from ...shared.config import settings
-from ...shared.database import insert_detection
+from ...shared.database import insert_detections_bulk
+from ._common import Candidate, contains_any, keyword_needles
 
 logger = logging.getLogger(__name__)
 
+_SEARCH_API_URL = "https://www.googleapis.com/youtube/v3/search"
+_VIDEOS_API_URL = "https://www.googleapis.com/youtube/v3/videos"
 
-@dataclass(frozen=True)
+# YouTube API requests one async search keeps in flight, across all of its keywords
+YOUTUBE_API_CONCURRENCY = 8
+# videos.list accepts up to 50 comma-separated IDs per request
+VIDEOS_PER_REQUEST = 50
+# Details of a video the videos.list lookup did not return
+_MISSING_DETAILS = {'view_count': 0, 'duration': 'PT0S'}
+
+# Characters of a YouTube video ID, for simulated results
+_VIDEO_ID_CHARS = np.frombuffer(
+    b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_", dtype="S1"
+)
+
+# Keep-alive pool for the blocking API calls, so repeated searches skip the TCP/TLS handshake
+# (requests already asks for gzip/deflate responses by default)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Last videos.list answer per comma-joined ID list, as (ETag, parsed details). The same
+# live/trending videos come back run after run; with If-None-Match an unchanged answer is a 304
+_ETAG_CACHE: dict[str, tuple[str, dict[str, dict[str, Any]]]] = {}
+_ETAG_CACHE_SIZE = 1024
+_ETAG_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
 class SearchResult:
     url: str
     title: str
@@ -29,6 +63,10 @@ class SearchResult:
     thumbnail: str
     channel: str
     confidence: float
+    
+    def candidate(self) -> Candidate:
+        """The platform, URL and title other platforms' searches also return"""
+        return Candidate(self.platform, self.url, self.title)
 
 
 def search_candidates(keywords: list[str], max_results: int = 20) -> Iterator[SearchResult]:
@@ -42,41 +80,80 @@ def search_candidates(keywords: list[str], max_results: int = 20) -> Iterator[Se
         yield from _search_with_ytdlp(keywords, max_results)
 
 
+async def search_candidates_async(client: httpx.AsyncClient, keywords: list[str],
+                                  max_results: int = 20) -> List[SearchResult]:
+    """search_candidates for the event loop; API requests share the caller's `client`"""
+    if settings.youtube_api_key and not settings.youtube_api_key.startswith("YOUR_"):
+        try:
+            return await _search_youtube_api_async(client, keywords, max_results)
+        except Exception as e:
+            logger.warning(f"YouTube API search failed: {e}")
+    
+    # yt-dlp has no async interface; keep it off the event loop
+    return await asyncio.to_thread(lambda: list(_search_with_ytdlp(keywords, max_results)))
+
+
+class _Pacer:
+    """Space calls out so at most `rate` start per second, across threads"""
+    
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+# yt-dlp scrapes YouTube's own pages: at most one search every 2s per process
+_YTDLP_PACER = _Pacer(0.5)
+
+
 def crawl_youtube_content(keywords: list[str], max_results: int = None) -> List[int]:
     """Crawl YouTube content and store detections in database"""
     if max_results is None:
         max_results = settings.crawl_max_per_run
     
-    detection_ids = []
     logger.info(f"Starting YouTube crawl with {len(keywords)} keywords, max {max_results} results")
     
-    for keyword in keywords:
-        try:
-            results = list(search_candidates([keyword], min(max_results, 50)))
-            logger.info(f"Found {len(results)} results for keyword: {keyword}")
-            
-            for result in results:
-                detection_id = insert_detection(
-                    platform=result.platform,
-                    url=result.url,
-                    title=result.title,
-                    decision="review"
-                )
-                if detection_id:
-                    detection_ids.append(detection_id)
-                    logger.debug(f"Stored detection {detection_id} for {result.url}")
-            
-            # Rate limiting between keywords
-            time.sleep(1)
-            
-        except Exception as e:
-            logger.error(f"Error crawling keyword '{keyword}': {e}")
-            continue
+    # Keywords are independent I/O; search them side by side, paced rather than
+    # stalled for a fixed second between each
+    pacer = _Pacer(settings.crawl_keywords_per_second)
+    workers = max(1, min(settings.crawl_concurrency, len(keywords)))
+    detection_ids = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_crawl_keyword, keyword, max_results, pacer): keyword
+            for keyword in keywords
+        }
+        for future in as_completed(futures):
+            try:
+                detection_ids.extend(future.result())
+            except Exception as e:
+                logger.error(f"Error crawling keyword '{futures[future]}': {e}")
     
     logger.info(f"Completed YouTube crawl: {len(detection_ids)} detections stored")
     return detection_ids
 
 
+def _crawl_keyword(keyword: str, max_results: int, pacer: _Pacer) -> List[int]:
+    """Search one keyword and store its results as detections"""
+    pacer.wait()
+    results = list(search_candidates([keyword], min(max_results, 50)))
+    logger.info(f"Found {len(results)} results for keyword: {keyword}")
+    
+    # One multi-row INSERT per keyword; URLs already stored are skipped
+    return insert_detections_bulk([
+        {"platform": r.platform, "url": r.url, "title": r.title, "decision": "review"}
+        for r in results
+    ])
+
+
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=1, min=4, max=10),
@@ -86,8 +163,6 @@ def _search_youtube_api(keywords: list[str], max_results: int) -> Iterator[Searc
     """Real YouTube API search with retry logic"""
     try:
         # YouTube Data API v3 search
-        base_url = "https://www.googleapis.com/youtube/v3/search"
-        
         for keyword in keywords:
             params = {
                 'part': 'snippet',
@@ -98,17 +173,19 @@ def _search_youtube_api(keywords: list[str], max_results: int) -> Iterator[Searc
                 'order': 'relevance'
             }
             
-            response = requests.get(base_url, params=params, timeout=30)
+            response = _SESSION.get(_SEARCH_API_URL, params=params, timeout=30)
             response.raise_for_status()
             
             data = response.json()
+            items = data.get('items', [])
             
-            for item in data.get('items', []):
+            # Get additional video details for the whole page in one request
+            details = _get_video_details_bulk([item['id']['videoId'] for item in items])
+            
+            for item in items:
                 snippet = item['snippet']
                 video_id = item['id']['videoId']
-                
-                # Get additional video details
-                video_details = _get_video_details(video_id)
+                video_details = details.get(video_id, _MISSING_DETAILS)
                 
                 yield SearchResult(
                     url=f"https://www.youtube.com/watch?v={video_id}",
@@ -132,24 +209,91 @@ def _search_youtube_api(keywords: list[str], max_results: int) -> Iterator[Searc
         yield from _search_with_ytdlp(keywords, max_results)
 
 
+async def _search_youtube_api_async(client: httpx.AsyncClient, keywords: list[str],
+                                    max_results: int) -> List[SearchResult]:
+    """YouTube Data API search over a shared async client, with the same retry policy"""
+    # One semaphore bounds every request of this search, searches and detail lookups alike
+    limit = asyncio.Semaphore(YOUTUBE_API_CONCURRENCY)
+    pages = await asyncio.gather(
+        *(_search_keyword_async(client, limit, keyword, max_results) for keyword in keywords)
+    )
+    return [result for page in pages for result in page]
+
+
+async def _search_keyword_async(client: httpx.AsyncClient, limit: asyncio.Semaphore,
+                                keyword: str, max_results: int) -> List[SearchResult]:
+    """Search one keyword and look up the details of every video it returns"""
+    params = {
+        'part': 'snippet',
+        'q': keyword,
+        'type': 'video',
+        'maxResults': min(max_results, 50),  # API limit
+        'key': settings.youtube_api_key,
+        'order': 'relevance'
+    }
+    
+    async for attempt in AsyncRetrying(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+        retry=retry_if_exception_type((httpx.HTTPError, ConnectionError)),
+        reraise=True,
+    ):
+        with attempt:
+            # Backoff waits happen outside the semaphore, so they hold no request slot
+            async with limit:
+                response = await client.get(_SEARCH_API_URL, params=params, timeout=30)
+            response.raise_for_status()
+    
+    items = response.json().get('items', [])
+    
+    # Get additional video details for the whole page in one request
+    details = await _get_video_details_bulk_async(
+        client, [item['id']['videoId'] for item in items], limit
+    )
+    
+    results = []
+    for item in items:
+        snippet = item['snippet']
+        video_id = item['id']['videoId']
+        video_details = details.get(video_id, _MISSING_DETAILS)
+        results.append(SearchResult(
+            url=f"https://www.youtube.com/watch?v={video_id}",
+            title=snippet['title'],
+            description=snippet['description'],
+            platform="youtube",
+            published_at=snippet['publishedAt'],
+            view_count=video_details.get('view_count', 0),
+            duration=video_details.get('duration', 'PT0S'),
+            thumbnail=snippet['thumbnails']['high']['url'],
+            channel=snippet['channelTitle'],
+            confidence=_calculate_confidence(snippet, video_details)
+        ))
+    return results
+
+
 def _search_with_ytdlp(keywords: list[str], max_results: int) -> Iterator[SearchResult]:
     """Search using yt-dlp as fallback"""
     try:
         import yt_dlp
         
-        for keyword in keywords:
-            # Use yt-dlp to search YouTube
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                'extract_flat': True,
-                'max_downloads': min(max_results, 50),
-            }
-            
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        # Flat search entries already carry title, channel and view count; with
+        # process=False yt-dlp pages through them lazily instead of resolving each video
+        ydl_opts = {
+            'quiet': True,
+            'no_warnings': True,
+            'extract_flat': 'in_playlist',
+            'skip_download': True,
+            'ignoreerrors': True,
+        }
+        
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            for keyword in keywords:
+                # Rate limiting between searches, shared by concurrent crawls
+                _YTDLP_PACER.wait()
+                
                 # Search for videos
                 search_query = f"ytsearch{min(max_results, 50)}:{keyword}"
-                results = ydl.extract_info(search_query, download=False)
+                results = ydl.extract_info(search_query, download=False, process=False)
                 
                 if results and 'entries' in results:
                     for entry in results['entries']:
@@ -167,41 +311,106 @@ def _search_with_ytdlp(keywords: list[str], max_results: int) -> Iterator[Search
                                 confidence=_calculate_ytdlp_confidence(entry)
                             )
             
-            # Rate limiting between searches
-            time.sleep(2)
-            
     except Exception as e:
         logger.warning(f"yt-dlp search failed: {e}")
         # Final fallback to simulated results
         yield from _search_simulated(keywords, max_results)
 
 
-def _get_video_details(video_id: str) -> dict[str, Any]:
-    """Get detailed video information"""
-    try:
-        import requests
-        
-        url = "https://www.googleapis.com/youtube/v3/videos"
+def _parse_video_details(data: dict) -> dict[str, dict[str, Any]]:
+    """Map each video ID of a videos.list response to its view count and duration"""
+    return {
+        item['id']: {
+            'view_count': int(item['statistics'].get('viewCount', 0)),
+            'duration': item['contentDetails']['duration']
+        }
+        for item in data.get('items', [])
+    }
+
+
+def _video_id_batches(video_ids: list[str]) -> Iterator[str]:
+    """Comma-joined ID lists of at most VIDEOS_PER_REQUEST, as videos.list takes them"""
+    for start in range(0, len(video_ids), VIDEOS_PER_REQUEST):
+        yield ','.join(video_ids[start:start + VIDEOS_PER_REQUEST])
+
+
+def _conditional_headers(ids: str) -> dict[str, str]:
+    """If-None-Match for an ID list whose answer is cached, so the API can reply 304"""
+    cached = _ETAG_CACHE.get(ids)
+    return {"If-None-Match": cached[0]} if cached else {}
+
+
+def _details_from_response(ids: str, status_code: int, etag: Optional[str],
+                           body: Callable[[], dict]) -> dict[str, dict[str, Any]]:
+    """Details from a videos.list response; `body()` is only called when it carries any"""
+    if status_code == 304:
+        cached = _ETAG_CACHE.get(ids)
+        if cached:
+            return cached[1]
+    details = _parse_video_details(body())
+    if etag:
+        with _ETAG_LOCK:
+            if ids not in _ETAG_CACHE and len(_ETAG_CACHE) >= _ETAG_CACHE_SIZE:
+                # Dicts keep insertion order: drop the oldest answer
+                del _ETAG_CACHE[next(iter(_ETAG_CACHE))]
+            _ETAG_CACHE[ids] = (etag, details)
+    return details
+
+
+def _get_video_details_bulk(video_ids: list[str]) -> dict[str, dict[str, Any]]:
+    """Get detailed video information for many videos, one request per 50 IDs"""
+    details = {}
+    for ids in _video_id_batches(video_ids):
         params = {
             'part': 'statistics,contentDetails',
-            'id': video_id,
+            'id': ids,
             'key': settings.youtube_api_key
         }
-        
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        if data.get('items'):
-            item = data['items'][0]
-            return {
-                'view_count': int(item['statistics'].get('viewCount', 0)),
-                'duration': item['contentDetails']['duration']
-            }
-    except Exception as e:
-        print(f"Warning: Could not get video details: {e}")
+        try:
+            response = _SESSION.get(_VIDEOS_API_URL, params=params,
+                                    headers=_conditional_headers(ids), timeout=30)
+            response.raise_for_status()
+            details.update(_details_from_response(
+                ids, response.status_code, response.headers.get("ETag"), response.json
+            ))
+        except Exception as e:
+            logger.warning(f"Could not get video details: {e}")
+    return details
+
+
+async def _get_video_details_bulk_async(client: httpx.AsyncClient, video_ids: list[str],
+                                        limit: asyncio.Semaphore) -> dict[str, dict[str, Any]]:
+    """_get_video_details_bulk over a shared async client"""
+    async def fetch(ids: str) -> dict[str, dict[str, Any]]:
+        params = {
+            'part': 'statistics,contentDetails',
+            'id': ids,
+            'key': settings.youtube_api_key
+        }
+        try:
+            async with limit:
+                response = await client.get(_VIDEOS_API_URL, params=params,
+                                            headers=_conditional_headers(ids), timeout=30)
+            # Unlike requests, httpx treats a 304 as an error status
+            if response.status_code != 304:
+                response.raise_for_status()
+            return _details_from_response(
+                ids, response.status_code, response.headers.get("ETag"), response.json
+            )
+        except Exception as e:
+            logger.warning(f"Could not get video details: {e}")
+            return {}
     
-    return {'view_count': 0, 'duration': 'PT0S'}
+    details = {}
+    for batch in await asyncio.gather(*(fetch(ids) for ids in _video_id_batches(video_ids))):
+        details.update(batch)
+    return details
+
+
+# Confidence scoring keywords, prepared once rather than rebuilt per result
+_RELEVANT_TITLE_NEEDLES = keyword_needles(('live', 'stream', 'match', 'cricket', 'football'))
+_OFFICIAL_CHANNEL_TITLES = frozenset(('official', 'verified'))
+_OFFICIAL_UPLOADER_NEEDLES = keyword_needles(('official', 'verified'))
 
 
 def _calculate_confidence(snippet: dict, video_details: dict) -> float:
@@ -209,8 +418,7 @@ def _calculate_confidence(snippet: dict, video_details: dict) -> float:
     score = 0.5  # Base score
     
     # Title relevance
-    title = snippet['title'].lower()
-    if any(word in title for word in ['live', 'stream', 'match', 'cricket', 'football']):
+    if contains_any(snippet['title'], _RELEVANT_TITLE_NEEDLES):
         score += 0.2
     
     # View count (higher views = higher confidence)
@@ -221,7 +429,7 @@ def _calculate_confidence(snippet: dict, video_details: dict) -> float:
         score += 0.05
     
     # Channel verification
-    if snippet.get('channelTitle', '').lower() in ['official', 'verified']:
+    if snippet.get('channelTitle', '').lower() in _OFFICIAL_CHANNEL_TITLES:
         score += 0.1
     
     return min(score, 0.9)  # Cap at 0.9
@@ -232,8 +440,7 @@ def _calculate_ytdlp_confidence(entry: dict) -> float:
     score = 0.5  # Base score
     
     # Title relevance
-    title = entry.get('title', '').lower()
-    if any(word in title for word in ['live', 'stream', 'match', 'cricket', 'football']):
+    if contains_any(entry.get('title', ''), _RELEVANT_TITLE_NEEDLES):
         score += 0.2
     
     # View count (higher views = higher confidence)
@@ -244,160 +451,137 @@ def _calculate_ytdlp_confidence(entry: dict) -> float:
         score += 0.05
     
     # Channel verification
-    uploader = entry.get('uploader', '').lower()
-    if any(word in uploader for word in ['official', 'verified']):
+    if contains_any(entry.get('uploader', ''), _OFFICIAL_UPLOADER_NEEDLES):
         score += 0.1
     
     return min(score, 0.9)  # Cap at 0.9
 
 
-def _search_simulated(keywords: list[str], max_results: int) -> Iterator[SearchResult]:
-    """Simulated search results for development"""
-    
-    base_urls = [
-        "https://www.youtube.com/watch?v=",
-        "https://youtu.be/",
-        "https://www.youtube.com/embed/"
-    ]
-    
-    # Generate video IDs
-    video_ids = []
-    for i in range(max_results):
-        # Create deterministic but varied video IDs
-        seed = hash(f"{'_'.join(keywords)}_{i}")
-        random.seed(seed)
-        
-        # Generate 11-character video ID (YouTube format)
-        chars = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_"
-        video_id = ''.join(random.choice(chars) for _ in range(11))
-        video_ids.append(video_id)
-    
-    # Generate search results
-    for i, video_id in enumerate(video_ids):
-        # Create deterministic content based on seed
-        seed = hash(f"{video_id}_{i}")
-        random.seed(seed)
-        
-        # Generate title based on keywords
-        title = _generate_title(keywords, seed)
-        
-        # Generate description
-        description = _generate_description(keywords, seed)
-        
-        # Generate metadata
-        published_at = _generate_date(seed)
-        view_count = random.randint(100, 1000000)
-        duration = _generate_duration(seed)
-        thumbnail = f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
-        channel = _generate_channel_name(seed)
-        confidence = random.uniform(0.3, 0.9)
-        
-        # Randomly select URL format
-        url_format = random.choice(base_urls)
-        if url_format == "https://youtu.be/":
-            url = f"{url_format}{video_id}"
-        else:
-            url = f"{url_format}{video_id}"
-        
-        yield SearchResult(
-            url=url,
-            title=title,
-            description=description,
-            platform="youtube",
-            published_at=published_at,
-            view_count=view_count,
-            duration=duration,
-            thumbnail=thumbnail,
-            channel=channel,
-            confidence=confidence
-        )
+def _stable_seed(key: str, person: bytes = b"") -> int:
+    """64-bit seed for a string that is the same in every process, unlike the randomized hash()"""
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8, person=person).digest(), "big")
 
 
-def _generate_title(keywords: list[str], seed: int) -> str:
-    """Generate realistic title based on keywords"""
-    random.seed(seed)
-    
-    templates = [
-        "{sport} {type} {quality}",
-        "{sport} {event} {year}",
-        "Live {sport} {type}",
-        "{sport} {type} Full Match",
-        "{sport} {event} Highlights"
-    ]
-    
-    sport_keywords = ["Cricket", "Football", "Tennis", "Basketball", "Hockey"]
-    type_keywords = ["Match", "Game", "Tournament", "Championship", "League"]
-    quality_keywords = ["HD", "Full HD", "4K", "Live", "Stream"]
-    event_keywords = ["World Cup", "Championship", "Final", "Semi Final", "Quarter Final"]
-    
-    template = random.choice(templates)
-    
-    return template.format(
-        sport=random.choice(sport_keywords),
-        type=random.choice(type_keywords),
-        quality=random.choice(quality_keywords),
-        event=random.choice(event_keywords),
-        year=random.randint(2020, 2025)
-    )
+def _draw_video_ids(rng: np.random.Generator, count: int) -> List[str]:
+    """Draw `count` 11-character video IDs (YouTube format) in one batch"""
+    picks = _VIDEO_ID_CHARS[rng.integers(0, len(_VIDEO_ID_CHARS), size=(count, 11))]
+    return [video_id.decode() for video_id in picks.view("S11").ravel()]
 
 
-def _generate_description(keywords: list[str], seed: int) -> str:
-    """Generate realistic description"""
-    random.seed(seed)
-    
-    descriptions = [
-        "Watch the full match highlights and key moments",
-        "Live streaming of the complete game",
-        "Full match coverage with commentary",
-        "Complete game highlights and analysis",
-        "Full match replay with expert analysis"
-    ]
-    
-    return random.choice(descriptions)
+# Pools the simulated metadata is drawn from
+_TITLE_TEMPLATES = (
+    "{sport} {type} {quality}",
+    "{sport} {event} {year}",
+    "Live {sport} {type}",
+    "{sport} {type} Full Match",
+    "{sport} {event} Highlights"
+)
+_SPORT_WORDS = ("Cricket", "Football", "Tennis", "Basketball", "Hockey")
+_TYPE_WORDS = ("Match", "Game", "Tournament", "Championship", "League")
+_QUALITY_WORDS = ("HD", "Full HD", "4K", "Live", "Stream")
+_EVENT_WORDS = ("World Cup", "Championship", "Final", "Semi Final", "Quarter Final")
+_DESCRIPTIONS = (
+    "Watch the full match highlights and key moments",
+    "Live streaming of the complete game",
+    "Full match coverage with commentary",
+    "Complete game highlights and analysis",
+    "Full match replay with expert analysis"
+)
+_CHANNEL_NAMES = (
+    "Sports Central",
+    "Live Sports HD",
+    "Match Highlights",
+    "Sports Network",
+    "Live Streaming",
+    "Sports Channel",
+    "Match Coverage",
+    "Live Sports"
+)
+_WATCH_URL = ("https://www.youtube.com/watch?v=",)
 
 
-def _generate_date(seed: int) -> str:
-    """Generate realistic date"""
-    random.seed(seed)
-    
-    # Generate date within last 6 months
-    days_ago = random.randint(1, 180)
-    timestamp = time.time() - (days_ago * 24 * 60 * 60)
-    
-    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(timestamp))
+def _pick(rng: np.random.Generator, pool: tuple, count: int) -> List[Any]:
+    """Draw `count` entries of `pool` in one batch"""
+    return [pool[i] for i in rng.integers(0, len(pool), size=count).tolist()]
 
 
-def _generate_duration(seed: int) -> str:
-    """Generate realistic duration"""
-    random.seed(seed)
-    
-    # Generate duration between 5 minutes and 3 hours
-    minutes = random.randint(5, 180)
-    hours = minutes // 60
-    remaining_minutes = minutes % 60
-    
+def _format_duration(minutes: int) -> str:
+    """ISO 8601 duration of a whole number of minutes"""
+    hours, remaining_minutes = divmod(minutes, 60)
     if hours > 0:
         return f"PT{hours}H{remaining_minutes}M"
-    else:
-        return f"PT{minutes}M"
+    return f"PT{minutes}M"
+
+
+def _simulated_metadata(rng: np.random.Generator,
+                        count: int) -> Iterator[tuple[str, str, str, str, str]]:
+    """
+    Realistic (title, description, published_at, duration, channel) for
+    `count` results; every choice is drawn for the whole batch up front.
+    """
+    titles = zip(
+        _pick(rng, _TITLE_TEMPLATES, count),
+        _pick(rng, _SPORT_WORDS, count),
+        _pick(rng, _TYPE_WORDS, count),
+        _pick(rng, _QUALITY_WORDS, count),
+        _pick(rng, _EVENT_WORDS, count),
+        rng.integers(2020, 2026, size=count).tolist(),
+    )
+    descriptions = _pick(rng, _DESCRIPTIONS, count)
+    # Published within the last 6 months, between 5 minutes and 3 hours long
+    days_ago = rng.integers(1, 181, size=count).tolist()
+    minutes = rng.integers(5, 181, size=count).tolist()
+    channels = _pick(rng, _CHANNEL_NAMES, count)
+    
+    now = time.time()
+    for i, (template, sport, type_, quality, event, year) in enumerate(titles):
+        yield (
+            template.format(sport=sport, type=type_, quality=quality, event=event, year=year),
+            descriptions[i],
+            time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now - days_ago[i] * 24 * 60 * 60)),
+            _format_duration(minutes[i]),
+            channels[i],
+        )
 
 
-def _generate_channel_name(seed: int) -> str:
-    """Generate realistic channel name"""
-    random.seed(seed)
+def _simulated_results(rng: np.random.Generator, count: int, base_urls: tuple[str, ...],
+                       views: tuple[int, int],
+                       confidence: tuple[float, float]) -> Iterator[SearchResult]:
+    """Simulated search results, all drawn from `rng` in batches"""
+    video_ids = _draw_video_ids(rng, count)
+    url_bases = _pick(rng, base_urls, count)
+    view_counts = rng.integers(views[0], views[1] + 1, size=count).tolist()
+    confidences = rng.uniform(confidence[0], confidence[1], size=count).tolist()
+    metadata = _simulated_metadata(rng, count)
     
-    channel_names = [
-        "Sports Central",
-        "Live Sports HD",
-        "Match Highlights",
-        "Sports Network",
-        "Live Streaming",
-        "Sports Channel",
-        "Match Coverage",
-        "Live Sports"
-    ]
+    for i, (title, description, published_at, duration, channel) in enumerate(metadata):
+        video_id = video_ids[i]
+        yield SearchResult(
+            url=url_bases[i] + video_id,
+            title=title,
+            description=description,
+            platform="youtube",
+            published_at=published_at,
+            view_count=view_counts[i],
+            duration=duration,
+            thumbnail=f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg",
+            channel=channel,
+            confidence=confidences[i]
+        )
+
+
+def _search_simulated(keywords: list[str], max_results: int) -> Iterator[SearchResult]:
+    """Simulated search results for development"""
+    
+    base_urls = (
+        "https://www.youtube.com/watch?v=",
+        "https://youtu.be/",
+        "https://www.youtube.com/embed/"
+    )
     
-    return random.choice(channel_names)
+    # Deterministic per keyword set: one generator draws every result at once
+    rng = np.random.default_rng(_stable_seed('_'.join(keywords)))
+    yield from _simulated_results(rng, max_results, base_urls, (100, 1000000), (0.3, 0.9))
 
 
 def get_video_metadata(url: str) -> dict[str, Any]:
@@ -410,20 +594,25 @@ def get_video_metadata(url: str) -> dict[str, Any]:
     video_id = _extract_video_id(url)
     
     # Generate deterministic metadata
-    seed = hash(video_id)
-    random.seed(seed)
+    rng = np.random.default_rng(_stable_seed(video_id))
+    title, description, published_at, duration, channel = next(_simulated_metadata(rng, 1))
+    view_count, like_count, comment_count = rng.integers(
+        (1000, 100, 10), (10000001, 100001, 10001)
+    ).tolist()
+    # 20-digit channel number: a leading 1-9, then 19 digits (too wide for one int64 draw)
+    channel_number = f"{rng.integers(1, 10)}{rng.integers(0, 10**19, dtype=np.uint64):019d}"
     
     return {
         "video_id": video_id,
-        "title": _generate_title(["sports"], seed),
-        "description": _generate_description(["sports"], seed),
-        "channel_id": f"UC{random.randint(10000000000000000000, 99999999999999999999)}",
-        "channel_title": _generate_channel_name(seed),
-        "published_at": _generate_date(seed),
-        "view_count": random.randint(1000, 10000000),
-        "like_count": random.randint(100, 100000),
-        "comment_count": random.randint(10, 10000),
-        "duration": _generate_duration(seed),
+        "title": title,
+        "description": description,
+        "channel_id": f"UC{channel_number}",
+        "channel_title": channel,
+        "published_at": published_at,
+        "view_count": view_count,
+        "like_count": like_count,
+        "comment_count": comment_count,
+        "duration": duration,
         "thumbnail_url": f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg",
         "tags": ["sports", "live", "streaming", "match", "highlights"],
         "category_id": "17",  # Sports
@@ -432,22 +621,17 @@ def get_video_metadata(url: str) -> dict[str, Any]:
     }
 
 
+# Video ID of a watch, short or embed URL
+_VIDEO_ID_RE = re.compile(r"(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([\w-]+)")
+
+
 def _extract_video_id(url: str) -> str:
     """Extract video ID from YouTube URL"""
-    
-    if "youtube.com/watch?v=" in url:
-        # Standard watch URL
-        return url.split("v=")[1].split("&")[0]
-    elif "youtu.be/" in url:
-        # Short URL
-        return url.split("youtu.be/")[1].split("?")[0]
-    elif "youtube.com/embed/" in url:
-        # Embed URL
-        return url.split("embed/")[1].split("?")[0]
-    else:
-        # Fallback: generate hash from URL
-        import hashlib
-        return hashlib.md5(url.encode()).hexdigest()[:11]
+    match = _VIDEO_ID_RE.search(url)
+    if match:
+        return match.group(1)
+    # Fallback: generate hash from URL
+    return hashlib.md5(url.encode()).hexdigest()[:11]
 
 
 def search_by_channel(channel_id: str, max_results: int = 20) -> Iterator[SearchResult]:
@@ -456,38 +640,8 @@ def search_by_channel(channel_id: str, max_results: int = 20) -> Iterator[Search
     # In production, this would use YouTube Data API
     # For development, generate simulated results
     
-    for i in range(max_results):
-        seed = hash(f"{channel_id}_{i}")
-        random.seed(seed)
-        
-        # Generate video ID
-        chars = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_"
-        video_id = ''.join(random.choice(chars) for _ in range(11))
-        
-        # Generate result
-        title = _generate_title(["sports"], seed)
-        description = _generate_description(["sports"], seed)
-        published_at = _generate_date(seed)
-        view_count = random.randint(100, 1000000)
-        duration = _generate_duration(seed)
-        thumbnail = f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
-        channel = _generate_channel_name(seed)
-        confidence = random.uniform(0.3, 0.9)
-        
-        url = f"https://www.youtube.com/watch?v={video_id}"
-        
-        yield SearchResult(
-            url=url,
-            title=title,
-            description=description,
-            platform="youtube",
-            published_at=published_at,
-            view_count=view_count,
-            duration=duration,
-            thumbnail=thumbnail,
-            channel=channel,
-            confidence=confidence
-        )
+    rng = np.random.default_rng(_stable_seed(channel_id))
+    yield from _simulated_results(rng, max_results, _WATCH_URL, (100, 1000000), (0.3, 0.9))
 
 
 def get_trending_videos(region: str = "US", max_results: int = 20) -> Iterator[SearchResult]:
@@ -496,37 +650,7 @@ def get_trending_videos(region: str = "US", max_results: int = 20) -> Iterator[S
     # In production, this would use YouTube Data API
     # For development, generate simulated trending results
     
-    for i in range(max_results):
-        seed = hash(f"trending_{region}_{i}")
-        random.seed(seed)
-        
-        # Generate video ID
-        chars = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_"
-        video_id = ''.join(random.choice(chars) for _ in range(11))
-        
-        # Generate result
-        title = _generate_title(["trending"], seed)
-        description = _generate_description(["trending"], seed)
-        published_at = _generate_date(seed)
-        view_count = random.randint(100000, 10000000)  # Trending videos have more views
-        duration = _generate_duration(seed)
-        thumbnail = f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
-        channel = _generate_channel_name(seed)
-        confidence = random.uniform(0.7, 1.0)  # Trending videos have higher confidence
-        
-        url = f"https://www.youtube.com/watch?v={video_id}"
-        
-        yield SearchResult(
-            url=url,
-            title=title,
-            description=description,
-            platform="youtube",
-            published_at=published_at,
-            view_count=view_count,
-            duration=duration,
-            thumbnail=thumbnail,
-            channel=channel,
-            confidence=confidence
-        )
-
-
+    # Trending videos have more views and higher confidence
+    # Keeps trending seeds apart from channel seeds when a region and a channel ID coincide
+    rng = np.random.default_rng(_stable_seed(region, person=b"trending"))
+    yield from _simulated_results(rng, max_results, _WATCH_URL, (100000, 10000000), (0.7, 1.0))
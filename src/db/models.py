@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional, Dict, Any, List
 from sqlalchemy import (
     Column, Integer, String, Text, Float, Boolean, DateTime, 
-    ForeignKey, JSON, Index, UniqueConstraint, CheckConstraint
+    ForeignKey, JSON, Index, UniqueConstraint, CheckConstraint, text
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -74,6 +74,12 @@ class Detection(Base):
         Index('idx_detections_detected_at', 'detected_at'),
         Index('idx_detections_url', 'url'),
         Index('idx_detections_confidence', 'confidence'),
+        Index(
+            'idx_detections_recent_approved',
+            text('detected_at DESC'),
+            postgresql_include=['confidence', 'platform', 'url', 'title', 'decision'],
+            postgresql_where=text("decision = 'approve'"),
+        ),
         UniqueConstraint('platform', 'url', name='uq_detections_platform_url'),
     )
 
@@ -61,9 +61,8 @@ def compute_videohash(video_path: str) -> VideoHashResult:
             
             # Sample frames
             if frame_count % sample_interval == 0:
-                # Convert BGR to RGB
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                pil_image = Image.fromarray(frame_rgb)
+                # Both hashes work on grayscale; convert once instead of BGR->RGB->L per hash
+                pil_image = frame_gray_image(frame)
                 
                 # Compute hashes
                 phash = imagehash.phash(pil_image)
@@ -103,6 +102,43 @@ def compute_videohash(video_path: str) -> VideoHashResult:
         return _compute_fallback_videohash(video_path)
 
 
+def frame_gray_image(frame: "np.ndarray") -> "Image.Image":
+    """Grayscale PIL image straight from an OpenCV BGR(A) frame, skipping the RGB copy"""
+    code = cv2.COLOR_BGRA2GRAY if frame.ndim == 3 and frame.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+    return Image.fromarray(cv2.cvtColor(frame, code))
+
+
+def frame_hash_grids(image: "Image.Image") -> tuple["np.ndarray", "np.ndarray"]:
+    """Downscale a frame to the pHash (32x32) and dHash (9x8) grids imagehash uses"""
+    gray = image if image.mode == "L" else image.convert("L")
+    return (
+        np.asarray(gray.resize((32, 32), Image.LANCZOS)),
+        np.asarray(gray.resize((9, 8), Image.LANCZOS)),
+    )
+
+
+def batch_frame_hashes(phash_grids: List["np.ndarray"], dhash_grids: List["np.ndarray"]) -> List[Dict[str, str]]:
+    """pHash/dHash many frames with one batched DCT; matches imagehash.phash/dhash output"""
+    if not phash_grids:
+        return []
+    import scipy.fft
+    
+    count = len(phash_grids)
+    dct = scipy.fft.dctn(np.stack(phash_grids).astype(np.float64), axes=(1, 2), workers=-1)
+    low = dct[:, :8, :8].reshape(count, -1)
+    phash_bits = low > np.median(low, axis=1, keepdims=True)
+    
+    wide = np.stack(dhash_grids)
+    dhash_bits = (wide[:, :, 1:] > wide[:, :, :-1]).reshape(count, -1)
+    
+    phashes = np.packbits(phash_bits, axis=1)
+    dhashes = np.packbits(dhash_bits, axis=1)
+    return [
+        {"phash": p.tobytes().hex(), "dhash": d.tobytes().hex()}
+        for p, d in zip(phashes, dhashes)
+    ]
+
+
 def hamming_distance(hash1: str, hash2: str) -> int:
     """Calculate Hamming distance between two hashes"""
     if not hash1 or not hash2:
@@ -262,9 +298,7 @@ def extract_key_frames(video_path: str, max_frames: int = 10) -> List[Dict[str,
                 break
             
             if frame_count in frame_indices:
-                # Convert to RGB
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                pil_image = Image.fromarray(frame_rgb)
+                pil_image = frame_gray_image(frame)
                 
                 # Compute hash
                 phash = imagehash.phash(pil_image)
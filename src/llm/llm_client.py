@@ -1,14 +1,29 @@
 from __future__ import annotations
 
 from typing import Any, Iterable
+import hashlib
 import random
 import json
+import re
 import requests
 
 from ..shared.config import settings
 from ..shared.redis_client import get_redis
 
 
+# Cached local AI replies live this long; prompts are normalized before hashing
+LLM_CACHE_TTL = 86400
+# Health probes should answer in one round trip; a slow endpoint counts as down
+PING_TIMEOUT = 2
+
+# Page-text markers for the local classifier; search() returns at the first hit
+_SPORTS_RE = re.compile(r"cricket|football|sports|match|game", re.IGNORECASE)
+_ENTERTAINMENT_RE = re.compile(r"movie|film|series|show", re.IGNORECASE)
+_NEWS_RE = re.compile(r"news|article|blog", re.IGNORECASE)
+_MEDIUM_RISK_RE = re.compile(r"free|download|stream|watch online", re.IGNORECASE)
+_HIGH_RISK_RE = re.compile(r"pirate|torrent|crack|hack", re.IGNORECASE)
+
+
 class LLMClient:
     def __init__(self, base_url: str | None = None) -> None:
         self.base_url = base_url or settings.local_ai_endpoint
@@ -16,32 +31,69 @@ class LLMClient:
         self.provider = settings.local_ai_provider
         self.local_ai_available = self._check_local_ai_available()
     
-    def _check_local_ai_available(self) -> bool:
+    def _check_local_ai_available(self, timeout: float = 5) -> bool:
         """Check if local AI model is available"""
         try:
             if self.provider == "ollama":
-                response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+                response = requests.get(f"{self.base_url}/api/tags", timeout=timeout)
                 return response.status_code == 200
             else:
                 # For other local providers, just check if endpoint is reachable
-                response = requests.get(f"{self.base_url}/health", timeout=5)
+                response = requests.get(f"{self.base_url}/health", timeout=timeout)
                 return response.status_code == 200
         except Exception:
             return False
     
+    def ping(self) -> bool:
+        """Cheap liveness probe for the local model endpoint; no generation"""
+        return self._check_local_ai_available(timeout=PING_TIMEOUT)
+    
     def generate(self, prompt: str) -> str:
         """Generate response using local AI model"""
         
-        # Try local AI first
+        # Try local AI first, answering repeated prompts from the cache
         if self.local_ai_available:
+            cache_key = self._cache_key(prompt)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
             try:
-                return self._generate_local_ai(prompt)
+                response = self._generate_local_ai(prompt)
+                self._cache_set(cache_key, response)
+                return response
             except Exception as e:
                 print(f"Local AI generation failed: {e}")
         
         # Fallback to local logic
         return self._generate_fallback(prompt)
     
+    def warmup(self) -> None:
+        """Run one throwaway generation so model loading happens before real traffic"""
+        if not self.local_ai_available:
+            return
+        try:
+            self._generate_local_ai("ping")
+        except Exception as e:
+            print(f"Local AI warmup failed: {e}")
+    
+    def _cache_key(self, prompt: str) -> str:
+        """Cache key for a prompt, ignoring whitespace differences only"""
+        normalized = " ".join(prompt.split())
+        digest = hashlib.sha256(f"{self.model}\0{normalized}".encode()).hexdigest()
+        return f"ap:llm:exact:{digest}"
+    
+    def _cache_get(self, key: str) -> str | None:
+        try:
+            return get_redis().get(key)
+        except Exception:
+            return None
+    
+    def _cache_set(self, key: str, response: str) -> None:
+        try:
+            get_redis().set(key, response, ex=LLM_CACHE_TTL)
+        except Exception:
+            pass
+    
     def _generate_local_ai(self, prompt: str) -> str:
         """Generate response using local AI model"""
         try:
@@ -228,24 +280,24 @@ class LLMClient:
     
     def _classify_page_local(self, content: str, url: str) -> dict[str, Any]:
         """Local content classification fallback"""
-        content_lower = content.lower()
         url_lower = url.lower()
         
-        # Content type detection
+        # Content type detection; the page text is matched in place rather than lower-cased
         content_type = "unknown"
-        if any(word in content_lower for word in ["cricket", "football", "sports", "match", "game"]):
+        if _SPORTS_RE.search(content):
             content_type = "sports"
-        elif any(word in content_lower for word in ["movie", "film", "series", "show"]):
+        elif _ENTERTAINMENT_RE.search(content):
             content_type = "entertainment"
-        elif any(word in content_lower for word in ["news", "article", "blog"]):
+        elif _NEWS_RE.search(content):
             content_type = "news"
         
-        # Piracy risk assessment
-        risk_level = "low"
-        if any(word in content_lower for word in ["free", "download", "stream", "watch online"]):
-            risk_level = "medium"
-        if any(word in content_lower for word in ["pirate", "torrent", "crack", "hack"]):
+        # Piracy risk assessment; the high-risk check decides alone when it hits
+        if _HIGH_RISK_RE.search(content):
             risk_level = "high"
+        elif _MEDIUM_RISK_RE.search(content):
+            risk_level = "medium"
+        else:
+            risk_level = "low"
         
         # Platform detection
         platform_type = "unknown"
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+import re
 import requests
 from typing import Any
 
@@ -68,6 +69,11 @@ def expand_keywords(data: dict[str, Any]) -> dict[str, list[str]]:
     return {"keywords": hardcoded_keywords}
 
 
+# Stream markers first: they decide most pages, and search() stops at the first hit
+_STREAM_RE = re.compile(r"live|stream|match|watch|খেলা|লাইভ", re.IGNORECASE)
+_COMMENTARY_RE = re.compile(r"commentary|radio|reaction|watchalong", re.IGNORECASE)
+
+
 @app.post("/classify_page")
 def classify_page(data: dict[str, Any]) -> dict[str, Any]:
     text = (data.get("text") or "").strip()
@@ -76,10 +82,9 @@ def classify_page(data: dict[str, Any]) -> dict[str, Any]:
         return {"label": "unrelated", "score": 0.0}
     
     # Use hardcoded classification for now
-    t = text.lower()
-    if any(k in t for k in ["live", "stream", "match", "watch", "খেলা", "লাইভ"]):
+    if _STREAM_RE.search(text):
         return {"label": "likely_stream", "score": 0.7}
-    if any(k in t for k in ["commentary", "radio", "reaction", "watchalong"]):
+    if _COMMENTARY_RE.search(text):
         return {"label": "commentary", "score": 0.6}
     return {"label": "unrelated", "score": 0.2}
 
@@ -1,17 +1,33 @@
 from __future__ import annotations
 
+import json
 import time
 import logging
 from typing import Any, Iterator, Optional, List, Dict
 from dataclasses import dataclass
 
+from sqlalchemy import text
+
 from ..shared.database import get_db_session, get_references, insert_match, update_detection_status
 from ..shared.config import settings
+from ..shared.redis_client import get_redis, get_reference_version, bump_reference_version
 from ..fp.video import hamming_distance, is_similar, compare_video_hashes
 from ..fp.audio import compare_audio_fingerprints, compare_audio_fingerprints_from_hashes
 
+try:
+    import orjson
+
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    _loads = orjson.loads
+except ImportError:
+    _dumps, _loads = json.dumps, json.loads
+
 logger = logging.getLogger(__name__)
 
+# Detection fingerprints don't change after capture, so analyses can live a day
+MATCH_CACHE_TTL = 86400
+
 
 @dataclass(frozen=True)
 class MatchResult:
@@ -30,6 +46,10 @@ class MatchingEngine:
         self.audio_threshold = settings.audio_threshold
         self.llm_threshold = settings.llm_min_score
 
+    def warmup(self) -> None:
+        """Touch the reference table so the first match doesn't pay connect/compile costs"""
+        get_references()
+
     def find_matches(self, detection_id: int, video_hash: str, audio_fp: str) -> List[MatchResult]:
         """Find matches for given fingerprints"""
         
@@ -151,6 +171,27 @@ class MatchingEngine:
             return 0.0
 
     def analyze_detection(self, detection_id: int) -> dict[str, Any]:
+        """Analyze a detection, reusing a cached result for the current reference set"""
+        
+        cache_key = f"match:{detection_id}:{get_reference_version()}"
+        try:
+            cached = get_redis().get(cache_key)
+            if cached is not None:
+                return _loads(cached)
+        except Exception as e:
+            logger.warning(f"Match cache read failed for detection {detection_id}: {e}")
+        
+        result = self._analyze_detection(detection_id)
+        
+        # Errors (e.g. evidence not captured yet) must not stick
+        if "error" not in result:
+            try:
+                get_redis().setex(cache_key, MATCH_CACHE_TTL, _dumps(result))
+            except Exception as e:
+                logger.warning(f"Match cache write failed for detection {detection_id}: {e}")
+        return result
+
+    def _analyze_detection(self, detection_id: int) -> dict[str, Any]:
         """Analyze a detection and find matches"""
         
         try:
@@ -352,26 +393,27 @@ class MatchingEngine:
         """Update reference fingerprints"""
         
         try:
-            with db_cursor() as cur:
+            with get_db_session() as session:
                 # Update or insert video fingerprint
                 if video_hash:
-                    cur.execute("""
+                    session.execute(text("""
                         INSERT INTO reference_fingerprints (content_id, kind, hash)
-                        VALUES (%s, 'video', %s)
+                        VALUES (:content_id, 'video', :hash)
                         ON CONFLICT (content_id, kind) 
                         DO UPDATE SET hash = EXCLUDED.hash
-                    """, (content_id, video_hash))
+                    """), {"content_id": content_id, "hash": video_hash})
                 
                 # Update or insert audio fingerprint
                 if audio_fp:
-                    cur.execute("""
+                    session.execute(text("""
                         INSERT INTO reference_fingerprints (content_id, kind, hash)
-                        VALUES (%s, 'audio', %s)
+                        VALUES (:content_id, 'audio', :hash)
                         ON CONFLICT (content_id, kind) 
                         DO UPDATE SET hash = EXCLUDED.hash
-                    """, (content_id, audio_fp))
+                    """), {"content_id": content_id, "hash": audio_fp})
                 
                 print(f"✅ Updated reference fingerprints for {content_id}")
+            bump_reference_version()
         
         except Exception as e:
             print(f"Error updating reference fingerprints: {e}")
@@ -380,22 +422,21 @@ class MatchingEngine:
         """Get matching engine statistics"""
         
         try:
-            with db_cursor() as cur:
+            with get_db_session() as session:
                 # Get total detections
-                cur.execute("SELECT COUNT(*) FROM detections")
-                total_detections = cur.fetchone()[0]
+                total_detections = session.execute(text("SELECT COUNT(*) FROM detections")).scalar()
                 
                 # Get detections by decision
-                cur.execute("""
+                decisions = dict(session.execute(text("""
                     SELECT decision, COUNT(*) 
                     FROM detections 
                     GROUP BY decision
-                """)
-                decisions = dict(cur.fetchall())
+                """)).all())
                 
                 # Get reference fingerprints count
-                cur.execute("SELECT COUNT(*) FROM reference_fingerprints")
-                total_references = cur.fetchone()[0]
+                total_references = session.execute(
+                    text("SELECT COUNT(*) FROM reference_fingerprints")
+                ).scalar()
                 
                 return {
                     "total_detections": total_detections,
@@ -4,11 +4,20 @@ from datetime import datetime
 from typing import Literal, Optional
 from pydantic import BaseModel, Field, validator, HttpUrl
 import re
+import sys
 from dataclasses import field
 
 Decision = Literal["approve", "review", "reject"]
 TakedownStatus = Literal["pending", "sent", "failed"]
 
+ALLOWED_PLATFORMS = ('youtube', 'telegram', 'facebook', 'twitter', 'instagram', 'google')
+
+
+def _platform_name(v: str) -> Optional[str]:
+    """Lower-case a platform name; known names come back as the shared interned string"""
+    name = v.lower()
+    return sys.intern(name) if name in ALLOWED_PLATFORMS else None
+
 class Detection(BaseModel):
     id: int = Field(..., gt=0, description="Unique detection identifier")
     platform: str = Field(..., min_length=1, max_length=50, description="Platform name")
@@ -25,10 +34,10 @@ class Detection(BaseModel):
 
     @validator('platform')
     def validate_platform(cls, v):
-        allowed_platforms = ['youtube', 'telegram', 'facebook', 'twitter', 'instagram', 'google']
-        if v.lower() not in allowed_platforms:
-            raise ValueError(f'Platform must be one of: {", ".join(allowed_platforms)}')
-        return v.lower()
+        name = _platform_name(v)
+        if name is None:
+            raise ValueError(f'Platform must be one of: {", ".join(ALLOWED_PLATFORMS)}')
+        return name
 
     @validator('url')
     def validate_url(cls, v):
@@ -56,10 +65,10 @@ class DetectionCreate(BaseModel):
 
     @validator('platform')
     def validate_platform(cls, v):
-        allowed_platforms = ['youtube', 'telegram', 'facebook', 'twitter', 'instagram', 'google']
-        if v.lower() not in allowed_platforms:
-            raise ValueError(f'Platform must be one of: {", ".join(allowed_platforms)}')
-        return v.lower()
+        name = _platform_name(v)
+        if name is None:
+            raise ValueError(f'Platform must be one of: {", ".join(ALLOWED_PLATFORMS)}')
+        return name
 
     @validator('url')
     def validate_url(cls, v):
@@ -78,11 +87,13 @@ class CrawlRequest(BaseModel):
 
     @validator('platforms')
     def validate_platforms(cls, v):
-        allowed_platforms = ['youtube', 'telegram', 'facebook', 'twitter', 'instagram', 'google']
+        names = []
         for platform in v:
-            if platform.lower() not in allowed_platforms:
+            name = _platform_name(platform)
+            if name is None:
                 raise ValueError(f'Invalid platform: {platform}')
-        return [p.lower() for p in v]
+            names.append(name)
+        return names
 
     @validator('keywords')
     def validate_keywords(cls, v):
@@ -145,11 +156,31 @@ class ChatRequest(BaseModel):
             raise ValueError('Message contains potentially dangerous content')
         return v.strip()
 
+class MatchAnalyzeRequest(BaseModel):
+    detection_id: int = Field(..., gt=0, description="Detection identifier")
+
+class MatchDecideRequest(BaseModel):
+    detection_id: int = Field(..., gt=0, description="Detection identifier")
+    decision: Decision = Field(..., description="Detection decision")
+
+class LLMChatRequest(BaseModel):
+    prompt: str = Field(..., min_length=1, description="Prompt for the LLM")
+
+class DMCARequest(BaseModel):
+    detection_id: int = Field(..., gt=0, description="Detection identifier")
+    decision: str = Field(default="match", description="Match decision backing the notice")
+    custom_message: Optional[str] = Field(default=None, description="Custom notice message")
+
+class PipelineRequest(BaseModel):
+    keywords: list[str] = Field(..., min_items=1, max_items=100, description="Search keywords")
+    max_results: int = Field(default=10, ge=1, le=100, description="Maximum results to return")
+
 # Response schemas
 class APIResponse(BaseModel):
     success: bool = Field(..., description="Operation success status")
     message: str = Field(..., description="Response message")
     data: Optional[dict] = Field(None, description="Response data")
+    code: Optional[str] = Field(None, description="Machine-readable error code")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Response timestamp")
 
 class ErrorResponse(BaseModel):
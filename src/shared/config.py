@@ -69,6 +69,8 @@ class Settings:
     # Enforcement configuration
     enforcement_dry_run: bool = os.getenv("ENFORCEMENT_DRY_RUN", "true").lower() in {"1","true","yes"}
     crawl_max_per_run: int = int(os.getenv("CRAWL_MAX_PER_RUN", "25"))
+    crawl_concurrency: int = int(os.getenv("CRAWL_CONCURRENCY", "8"))
+    crawl_keywords_per_second: float = float(os.getenv("CRAWL_KEYWORDS_PER_SECOND", "4"))
     
     # Scanning configuration
     max_candidates_per_scan: int = int(os.getenv("MAX_CANDIDATES_PER_SCAN", "50"))
@@ -78,9 +80,14 @@ class Settings:
     # Security configuration - Open for development
     cors_origins: list[str] = field(default_factory=lambda: ["*"])
     cors_credentials: bool = os.getenv("CORS_CREDENTIALS", "true").lower() in {"1","true","yes"}
+    allowed_hosts: list[str] = field(default_factory=lambda: [h.strip() for h in os.getenv("ALLOWED_HOSTS", "").split(",") if h.strip()])
     max_request_size: int = int(os.getenv("MAX_REQUEST_SIZE", "104857600"))  # 100MB default
     session_timeout: int = int(os.getenv("SESSION_TIMEOUT", "3600"))  # 1 hour default
     
+    # Logging configuration
+    log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    log_format: str = os.getenv("LOG_FORMAT", "text")
+    
     def __post_init__(self):
         """Development-friendly configuration"""
         if self.env == "production":
@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import logging
 from contextlib import contextmanager
-from typing import Generator, Optional, Dict, Any, List
-from sqlalchemy import create_engine, text
+from typing import Generator, Iterator, Optional, Dict, Any, List, Tuple
+from sqlalchemy import create_engine, text, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.pool import NullPool
 
 from .config import settings
+from .redis_client import publish_detection_event, publish_detection_events, invalidate_stats_cache, bump_reference_version
 from ..db.models import Base, Detection, Evidence, Match, Reference, Enforcement, PlatformAccount
 
 logger = logging.getLogger(__name__)
@@ -139,51 +141,157 @@ def insert_detection(
             
             detection_id = detection.id
             logger.info(f"✅ Detection inserted with ID: {detection_id}")
-            return detection_id
+        publish_detection_event(detection_id)
+        invalidate_stats_cache()
+        return detection_id
     except SQLAlchemyError as e:
         logger.error(f"Error inserting detection: {e}")
         return None
 
 
+def insert_detections_bulk(rows: List[Dict[str, Any]]) -> List[int]:
+    """
+    Insert many detections in one statement and return the IDs of the new ones.
+    Rows are dicts with platform, url, and optionally title and decision; rows
+    whose (platform, url) is already stored are skipped by the unique constraint.
+    """
+    if not rows:
+        return []
+    values = [
+        {
+            "platform": row["platform"],
+            "url": row["url"],
+            "title": row.get("title"),
+            "decision": row.get("decision", "review"),
+        }
+        for row in rows
+    ]
+    stmt = (
+        pg_insert(Detection)
+        .values(values)
+        # Untargeted, so schemas that predate the (platform, url) unique
+        # constraint (migrations/003) still accept the insert
+        .on_conflict_do_nothing()
+        .returning(Detection.id)
+    )
+    try:
+        with get_db_session() as session:
+            detection_ids = list(session.execute(stmt).scalars())
+            logger.info(f"✅ {len(detection_ids)} detections inserted")
+    except SQLAlchemyError as e:
+        logger.error(f"Error inserting detections: {e}")
+        return []
+    if detection_ids:
+        publish_detection_events(detection_ids)
+        invalidate_stats_cache()
+    return detection_ids
+
+
 def update_detection_status(detection_id: int, status: str) -> bool:
     """Update detection status"""
     try:
         with get_db_session() as session:
             detection = session.query(Detection).filter(Detection.id == detection_id).first()
-            if detection:
-                detection.decision = status
-                return True
-            return False
+            if not detection:
+                return False
+            detection.decision = status
+        publish_detection_event(detection_id)
+        invalidate_stats_cache()
+        return True
     except SQLAlchemyError as e:
         logger.error(f"Error updating detection status: {e}")
         return False
 
 
-def get_detections(limit: int = 100, offset: int = 0, status: Optional[str] = None) -> List[Dict[str, Any]]:
-    """Get detections with pagination"""
+def get_detections(limit: int = 100, offset: int = 0, status: Optional[str] = None) -> Tuple[List[Dict[str, Any]], int]:
+    """Get a page of detections plus the total matching count in one query"""
     try:
         with get_db_session() as session:
-            query = session.query(Detection)
+            query = session.query(Detection, func.count().over().label("full_count"))
             if status:
                 query = query.filter(Detection.decision == status)
             
-            detections = query.order_by(Detection.detected_at.desc()).offset(offset).limit(limit).all()
+            rows = query.order_by(Detection.detected_at.desc()).offset(offset).limit(limit).all()
+            if rows:
+                return [_detection_to_dict(d) for d, _ in rows], rows[0].full_count
             
-            return [
-                {
-                    "id": d.id,
-                    "platform": d.platform,
-                    "url": d.url,
-                    "title": d.title,
-                    "status": d.decision,
-                    "created_at": d.detected_at.isoformat() if d.detected_at else None,
-                    "detected_at": d.detected_at.isoformat() if d.detected_at else None,
-                }
-                for d in detections
-            ]
+            # Past the last page the window count has no row to ride on
+            if offset:
+                count_query = session.query(func.count(Detection.id))
+                if status:
+                    count_query = count_query.filter(Detection.decision == status)
+                return [], count_query.scalar() or 0
+            return [], 0
     except SQLAlchemyError as e:
         logger.error(f"Error getting detections: {e}")
-        return []
+        return [], 0
+
+
+def iter_detections(limit: int = 100, offset: int = 0, batch_size: int = 50) -> Iterator[Dict[str, Any]]:
+    """Stream detections newest first, fetching batch_size rows at a time"""
+    try:
+        with get_db_session() as session:
+            query = (
+                session.query(Detection)
+                .order_by(Detection.detected_at.desc())
+                .offset(offset)
+                .limit(limit)
+                .yield_per(batch_size)
+            )
+            for d in query:
+                yield _detection_to_dict(d)
+    except SQLAlchemyError as e:
+        logger.error(f"Error streaming detections: {e}")
+
+
+def _detection_to_dict(d: Detection) -> Dict[str, Any]:
+    """Convert a detection row to its API dict"""
+    detected_at = d.detected_at.isoformat() if d.detected_at else None
+    return {
+        "id": d.id,
+        "platform": d.platform,
+        "url": d.url,
+        "title": d.title,
+        "status": d.decision,
+        "created_at": detected_at,
+        "detected_at": detected_at,
+    }
+
+
+def get_detection_aggregates() -> Dict[str, Any]:
+    """Get detection counts and active platforms computed in the database"""
+    try:
+        with get_db_session() as session:
+            total, active, matches, decisions, alerts = session.query(
+                func.count(Detection.id),
+                func.count(Detection.id).filter(Detection.decision == 'processing'),
+                func.count(Detection.id).filter(Detection.decision == 'match'),
+                func.count(Detection.id).filter(Detection.decision.isnot(None)),
+                func.count(Detection.id).filter(Detection.takedown_status == 'sent'),
+            ).one()
+            
+            platforms = session.query(Detection.platform).filter(
+                Detection.platform.isnot(None)
+            ).distinct().all()
+            
+            return {
+                "total": total,
+                "active": active,
+                "matches": matches,
+                "decisions": decisions,
+                "alerts": alerts,
+                "platforms": [platform for (platform,) in platforms],
+            }
+    except SQLAlchemyError as e:
+        logger.error(f"Error getting detection aggregates: {e}")
+        return {
+            "total": 0,
+            "active": 0,
+            "matches": 0,
+            "decisions": 0,
+            "alerts": 0,
+            "platforms": [],
+        }
 
 
 def get_detection_by_id(detection_id: int) -> Optional[Dict[str, Any]]:
@@ -349,7 +457,8 @@ def insert_reference(
             
             reference_id = reference.id
             logger.info(f"✅ Reference inserted with ID: {reference_id}")
-            return reference_id
+        bump_reference_version()
+        return reference_id
     except SQLAlchemyError as e:
         logger.error(f"Error inserting reference: {e}")
         return None
@@ -2,11 +2,16 @@ from __future__ import annotations
 
 import sqlite3
 import os
+import threading
 from contextlib import contextmanager
 from typing import Iterator
 from pathlib import Path
 
 from .config import settings
+from .redis_client import invalidate_stats_cache, publish_detection_event
+
+# One reusable connection per thread instead of a fresh connect per cursor
+_local = threading.local()
 
 
 def get_db_path() -> str:
@@ -94,15 +99,25 @@ def _create_database():
         conn.close()
 
 
+def _get_thread_conn() -> sqlite3.Connection:
+    """Get this thread's cached database connection, opening it on first use"""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = get_conn()
+        _local.conn = conn
+    return conn
+
+
 @contextmanager
 def db_cursor() -> Iterator[sqlite3.Cursor]:
-    """Get database cursor with automatic connection management"""
-    conn = get_conn()
-    try:
-        with conn:
-            yield conn.cursor()
-    finally:
-        conn.close()
+    """Get database cursor with automatic transaction management"""
+    conn = _get_thread_conn()
+    with conn:
+        cur = conn.cursor()
+        try:
+            yield cur
+        finally:
+            cur.close()
 
 
 def test_connection() -> bool:
@@ -168,7 +183,9 @@ def insert_detection(platform: str, url: str, title: str = None, video_hash: str
             detection_id = cur.fetchone()[0]
             
             print(f"✅ Detection inserted with ID: {detection_id}")
-            return detection_id
+        
+        invalidate_stats_cache()
+        return detection_id
     
     except Exception as e:
         print(f"Error inserting detection: {e}")
@@ -184,8 +201,12 @@ def update_detection_decision(detection_id: int, decision: str) -> bool:
                 SET decision = ? 
                 WHERE id = ?
             """, (decision, detection_id))
-            
-            return cur.rowcount > 0
+            updated = cur.rowcount > 0
+        
+        if updated:
+            publish_detection_event(detection_id)
+            invalidate_stats_cache()
+        return updated
     
     except Exception as e:
         print(f"Error updating detection decision: {e}")
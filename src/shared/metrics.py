@@ -5,6 +5,7 @@ Provides Prometheus-style metrics and structured logging.
 
 from __future__ import annotations
 
+import json
 import time
 import logging
 from typing import Dict, Any, Optional
@@ -300,13 +301,32 @@ def get_structured_logger(name: str) -> StructuredLogger:
     return StructuredLogger(name)
 
 
+class JSONFormatter(logging.Formatter):
+    """Format records as one JSON object per line"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
 def setup_logging(level: str = "INFO", format_type: str = "text"):
     """Setup application logging"""
-    logging.basicConfig(
-        level=getattr(logging, level.upper()),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    handler = logging.StreamHandler()
+    if format_type == "json":
+        handler.setFormatter(JSONFormatter(datefmt='%Y-%m-%d %H:%M:%S'))
+    else:
+        handler.setFormatter(logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        ))
+    logging.basicConfig(level=getattr(logging, level.upper()), handlers=[handler], force=True)
     
     # Set specific loggers
     logging.getLogger("uvicorn").setLevel(logging.INFO)
@@ -1,19 +1,129 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Iterable, Optional
 
-from redis import Redis
+from redis import ConnectionPool, Redis
+from redis.asyncio import ConnectionPool as AsyncConnectionPool, Redis as AsyncRedis
 
 from .config import settings
 
 
+REDIS_MAX_CONNECTIONS = 64
+
+_pool: Optional[ConnectionPool] = None
+_bytes_pool: Optional[ConnectionPool] = None
 _client: Optional[Redis] = None
+_bytes_client: Optional[Redis] = None
+_async_client: Optional[AsyncRedis] = None
+
+# Pub/sub channel announcing new or re-decided detections
+DETECTION_EVENTS_CHANNEL = "ap:events:detection"
+
+# Set of cached stats response keys, dropped together whenever detections change
+STATS_CACHE_INDEX_KEY = "ap:cache:stats:keys"
+
+# Counter bumped whenever reference fingerprints change; part of match cache keys
+REFERENCE_VERSION_KEY = "ap:references:version"
+
+_INVALIDATE_STATS_LUA = """
+local keys = redis.call('SMEMBERS', KEYS[1])
+if #keys > 0 then
+    redis.call('DEL', KEYS[1], unpack(keys))
+end
+return #keys
+"""
+
+
+def get_redis_pool() -> ConnectionPool:
+    global _pool
+    if _pool is None:
+        _pool = ConnectionPool.from_url(
+            settings.redis_url, decode_responses=True, max_connections=REDIS_MAX_CONNECTIONS
+        )
+    return _pool
 
 
 def get_redis() -> Redis:
     global _client
     if _client is None:
-        _client = Redis.from_url(settings.redis_url, decode_responses=True)
+        _client = Redis(connection_pool=get_redis_pool())
     return _client
 
 
+def get_redis_bytes_pool() -> ConnectionPool:
+    """Like get_redis_pool, but connections return raw bytes"""
+    global _bytes_pool
+    if _bytes_pool is None:
+        _bytes_pool = ConnectionPool.from_url(
+            settings.redis_url, decode_responses=False, max_connections=REDIS_MAX_CONNECTIONS
+        )
+    return _bytes_pool
+
+
+def get_redis_bytes() -> Redis:
+    """Client that returns raw bytes, for binary values such as msgpack payloads"""
+    global _bytes_client
+    if _bytes_client is None:
+        _bytes_client = Redis(connection_pool=get_redis_bytes_pool())
+    return _bytes_client
+
+
+def get_async_redis() -> AsyncRedis:
+    """Pooled asyncio client returning raw bytes, for use on the API event loop"""
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncRedis(connection_pool=AsyncConnectionPool.from_url(
+            settings.redis_url, max_connections=REDIS_MAX_CONNECTIONS
+        ))
+    return _async_client
+
+
+async def close_async_redis() -> None:
+    """Drop the asyncio pool; it is bound to the event loop that created it"""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.connection_pool.disconnect()
+        _async_client = None
+
+
+def publish_detection_event(detection_id: int) -> None:
+    """Notify subscribers that a detection was written; never fails the caller"""
+    try:
+        get_redis().publish(DETECTION_EVENTS_CHANNEL, detection_id)
+    except Exception:
+        pass
+
+
+def publish_detection_events(detection_ids: Iterable[int]) -> None:
+    """Publish one event per detection in a single round trip; never fails the caller"""
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        for detection_id in detection_ids:
+            pipe.publish(DETECTION_EVENTS_CHANNEL, detection_id)
+        pipe.execute()
+    except Exception:
+        pass
+
+
+def invalidate_stats_cache() -> None:
+    """Drop cached stats responses after detections change; never fails the caller"""
+    try:
+        get_redis().eval(_INVALIDATE_STATS_LUA, 1, STATS_CACHE_INDEX_KEY)
+    except Exception:
+        pass
+
+
+def get_reference_version() -> int:
+    """Current reference set version, 0 when unset or Redis is unavailable"""
+    try:
+        return int(get_redis().get(REFERENCE_VERSION_KEY) or 0)
+    except Exception:
+        return 0
+
+
+def bump_reference_version() -> None:
+    """Invalidate cached match analyses after references change; never fails the caller"""
+    try:
+        get_redis().incr(REFERENCE_VERSION_KEY)
+    except Exception:
+        pass
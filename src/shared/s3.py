@@ -2,11 +2,21 @@ from __future__ import annotations
 
 import json
 import os
+import shutil
 from typing import Any
 from pathlib import Path
 
 from .config import settings
 
+try:
+    import orjson
+
+    def _json_bytes(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def _json_bytes(data: Any) -> bytes:
+        return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
 
 def _make_client(endpoint_url: str | None):
     """Create S3 client with fallback to local storage"""
@@ -32,19 +42,20 @@ def get_s3():
     return _make_client(settings.s3_endpoint)
 
 
-def put_json(key: str, data: dict[str, Any]) -> None:
-    """Store JSON data to S3 or local filesystem"""
+def put_json(key: str, data: dict[str, Any] | bytes) -> None:
+    """Store JSON data (a dict or already-encoded bytes) to S3 or local filesystem"""
+    body = data if isinstance(data, bytes) else _json_bytes(data)
     try:
         s3 = get_s3()
         if s3:
-            s3.put_object(Bucket=settings.s3_bucket, Key=key, Body=json.dumps(data).encode("utf-8"))
+            s3.put_object(Bucket=settings.s3_bucket, Key=key, Body=body)
             print(f"✅ Stored to S3: {key}")
         else:
             # Fallback to local storage
-            _store_local_json(key, data)
+            _store_local_json(key, body)
     except Exception as e:
         print(f"Warning: S3 storage failed, using local fallback: {e}")
-        _store_local_json(key, data)
+        _store_local_json(key, body)
 
 
 def put_bytes(key: str, data: bytes) -> None:
@@ -62,6 +73,34 @@ def put_bytes(key: str, data: bytes) -> None:
         _store_local_bytes(key, data)
 
 
+# Large evidence files go up as parallel 8MB parts, streamed from disk
+MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+MULTIPART_CONCURRENCY = 8
+
+
+def put_file(key: str, path: str | Path) -> None:
+    """Stream a file to S3 (multipart for large files) or local filesystem"""
+    try:
+        s3 = get_s3()
+        if s3:
+            from boto3.s3.transfer import TransferConfig
+            
+            s3.upload_file(
+                str(path), settings.s3_bucket, key,
+                Config=TransferConfig(
+                    multipart_chunksize=MULTIPART_CHUNK_SIZE,
+                    max_concurrency=MULTIPART_CONCURRENCY,
+                ),
+            )
+            print(f"✅ Stored to S3: {key}")
+        else:
+            # Fallback to local storage
+            _store_local_file(key, path)
+    except Exception as e:
+        print(f"Warning: S3 storage failed, using local fallback: {e}")
+        _store_local_file(key, path)
+
+
 def presign_get_url(key: str, expires_seconds: int = 300) -> str:
     """Generate presigned URL or local file path"""
     try:
@@ -82,13 +121,13 @@ def presign_get_url(key: str, expires_seconds: int = 300) -> str:
         return f"file://{local_path}"
 
 
-def _store_local_json(key: str, data: dict[str, Any]) -> None:
-    """Store JSON data to local filesystem"""
+def _store_local_json(key: str, body: bytes) -> None:
+    """Store encoded JSON data to local filesystem"""
     local_path = _get_local_path(key)
     local_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(local_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    with open(local_path, 'wb') as f:
+        f.write(body)
     
     print(f"✅ Stored locally: {local_path}")
 
@@ -104,6 +143,16 @@ def _store_local_bytes(key: str, data: bytes) -> None:
     print(f"✅ Stored locally: {local_path}")
 
 
+def _store_local_file(key: str, path: str | Path) -> None:
+    """Copy a file into local storage without reading it into memory"""
+    local_path = _get_local_path(key)
+    local_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    shutil.copyfile(path, local_path)
+    
+    print(f"✅ Stored locally: {local_path}")
+
+
 def _get_local_path(key: str) -> Path:
     """Get local file path for a given S3 key"""
     # Create local storage directory
@@ -0,0 +1,19 @@
+"""
+Shared fixtures.
+"""
+
+import fakeredis
+import pytest
+
+from src.shared import redis_client
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Point every shared Redis client at one in-memory server"""
+    server = fakeredis.FakeServer()
+    client = fakeredis.FakeRedis(server=server, decode_responses=True)
+    monkeypatch.setattr(redis_client, "_client", client)
+    monkeypatch.setattr(redis_client, "_bytes_client", fakeredis.FakeRedis(server=server))
+    monkeypatch.setattr(redis_client, "_async_client", fakeredis.FakeAsyncRedis(server=server))
+    return client
@@ -0,0 +1,77 @@
+"""
+Tests for alert storage and the detection watermark.
+"""
+
+import itertools
+
+import pytest
+
+from src.alerts import notifier as notifier_module
+from src.alerts.notifier import AlertNotifier, ALERT_INDEX_KEY, LAST_DETECTION_ID_KEY
+
+
+@pytest.fixture
+def notifier(fake_redis, monkeypatch):
+    # One second per alert, so the timestamp index has a strict order
+    clock = itertools.count(1_700_000_000)
+    monkeypatch.setattr(notifier_module.time, "time", lambda: next(clock))
+    return AlertNotifier()
+
+
+def test_recent_alerts_are_newest_first(notifier):
+    for i in range(12):
+        notifier.send_alert("test", f"alert {i}")
+
+    alerts = notifier.get_recent_alerts(limit=3)
+    assert [alert["message"] for alert in alerts] == ["alert 11", "alert 10", "alert 9"]
+    assert alerts[0]["data"] == {}
+
+
+def test_alert_index_is_trimmed_to_max_alerts(notifier, fake_redis, monkeypatch):
+    monkeypatch.setattr(notifier_module, "MAX_ALERTS", 5)
+    for i in range(8):
+        notifier.send_alert("test", f"alert {i}")
+
+    assert fake_redis.zcard(ALERT_INDEX_KEY) == 5
+    alerts = notifier.get_recent_alerts(limit=10)
+    assert [alert["message"] for alert in alerts] == [f"alert {i}" for i in range(7, 2, -1)]
+
+
+def test_alerts_past_retention_leave_the_index(notifier, fake_redis, monkeypatch):
+    notifier.send_alert("test", "old")
+    later = 1_700_000_000 + notifier_module.ALERT_RETENTION_SECONDS + 10
+    monkeypatch.setattr(notifier_module.time, "time", lambda: later)
+    notifier.send_alert("test", "new")
+
+    assert fake_redis.zcard(ALERT_INDEX_KEY) == 1
+    assert [alert["message"] for alert in notifier.get_recent_alerts()] == ["new"]
+
+
+def test_high_confidence_check_advances_watermark(notifier, fake_redis):
+    detections = [
+        (7, "youtube", "https://youtu.be/a", "A", 0.95, "approve"),
+        (9, "youtube", "https://youtu.be/b", "B", 0.97, "approve"),
+    ]
+    notifier.check_high_confidence_detections(detections)
+
+    assert fake_redis.get(LAST_DETECTION_ID_KEY) == "9"
+    assert len(notifier.get_recent_alerts()) == 2
+
+    # Nothing new keeps the watermark where it was
+    notifier.check_high_confidence_detections([])
+    assert fake_redis.get(LAST_DETECTION_ID_KEY) == "9"
+
+
+def test_high_confidence_check_fetches_after_watermark(notifier, fake_redis, monkeypatch):
+    fake_redis.set(LAST_DETECTION_ID_KEY, 9)
+    seen = []
+
+    def fetch(last_seen_id=None):
+        seen.append(last_seen_id)
+        return [(12, "telegram", "https://t.me/x/1", "X", 0.99, "approve")], []
+
+    monkeypatch.setattr(notifier, "_fetch_recent_activity", fetch)
+    notifier.check_high_confidence_detections()
+
+    assert seen == ["9"]
+    assert fake_redis.get(LAST_DETECTION_ID_KEY) == "12"
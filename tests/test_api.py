@@ -12,3 +12,10 @@ def test_health():
     assert r.json()["status"] == "healthy"
 
 
+
+
+def test_post_requires_json_content_type():
+    client = TestClient(app)
+    r = client.post("/tools/llm/chat", content=b"prompt", headers={"content-type": "text/plain"})
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Content-Type must be application/json"
@@ -0,0 +1,69 @@
+"""
+Tests for the Redis response cache used by the stats endpoints.
+"""
+
+import pytest
+from fastapi.responses import JSONResponse
+
+from src.api.cache import redis_cached
+from src.shared.redis_client import invalidate_stats_cache
+
+
+def counting_handler(payload):
+    calls = []
+
+    async def handler():
+        calls.append(1)
+        return payload
+
+    return handler, calls
+
+
+@pytest.mark.asyncio
+async def test_miss_then_hit(fake_redis):
+    handler, calls = counting_handler({"total": 3})
+    cached = redis_cached("test", ttl=60)(handler)
+
+    first = await cached()
+    second = await cached()
+
+    assert len(calls) == 1
+    assert first.body == second.body == b'{"total":3}'
+    assert second.status_code == 200
+    assert fake_redis.ttl("ap:cache:stats:test") > 0
+
+
+@pytest.mark.asyncio
+async def test_invalidation_drops_cached_response(fake_redis):
+    handler, calls = counting_handler({"total": 3})
+    cached = redis_cached("test", ttl=60)(handler)
+
+    await cached()
+    invalidate_stats_cache()
+    await cached()
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_error_payload_is_not_cached(fake_redis):
+    handler, calls = counting_handler({"error": "STATS_FAILED"})
+    cached = redis_cached("test", ttl=60)(handler)
+
+    await cached()
+    await cached()
+
+    assert len(calls) == 2
+    assert not fake_redis.exists("ap:cache:stats:test")
+
+
+@pytest.mark.asyncio
+async def test_non_200_response_is_not_cached(fake_redis):
+    handler, calls = counting_handler(JSONResponse({"detail": "busy"}, status_code=503))
+    cached = redis_cached("test", ttl=60)(handler)
+
+    response = await cached()
+    await cached()
+
+    assert response.status_code == 503
+    assert len(calls) == 2
@@ -0,0 +1,127 @@
+"""
+Tests for the Postgres queries; these need the Postgres database from settings.
+"""
+
+import uuid
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from src.alerts.notifier import AlertNotifier
+from src.db.models import Detection
+from src.shared import database
+from src.shared.config import settings
+from src.shared.database import get_db_session, insert_detections_bulk
+from src.shared.redis_client import DETECTION_EVENTS_CHANNEL
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[1] / "migrations"
+MIGRATIONS = sorted(MIGRATIONS_DIR.glob("*.sql"))
+UNIQUE_MIGRATION = MIGRATIONS_DIR / "003_detections_platform_url_unique.sql"
+
+
+@pytest.fixture
+def migrated_engine(fake_redis, monkeypatch):
+    """Sessions on a scratch schema built by migrations/*.sql, as compose and init_db.sh do"""
+    if not database.test_connection():
+        pytest.skip("Postgres is not reachable")
+    schema = f"test_{uuid.uuid4().hex}"
+    with database.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text(f'CREATE SCHEMA "{schema}"'))
+    engine = create_engine(
+        settings.database_url,
+        poolclass=NullPool,
+        connect_args={"options": f"-csearch_path={schema}"},
+    )
+    monkeypatch.setattr(database, "SessionLocal", sessionmaker(autocommit=False, autoflush=False, bind=engine))
+    yield engine
+    engine.dispose()
+    with database.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+
+
+def apply_migrations(engine, migrations):
+    # Autocommit: 002 builds its index CONCURRENTLY and 003 manages its own transaction
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for path in migrations:
+            conn.exec_driver_sql(path.read_text())
+
+
+@pytest.fixture
+def migrated(migrated_engine):
+    apply_migrations(migrated_engine, MIGRATIONS)
+    return migrated_engine
+
+
+def stored_titles():
+    with get_db_session() as session:
+        return sorted(title for (title,) in session.query(Detection.title))
+
+
+def test_bulk_insert_skips_existing_urls(migrated):
+    first = insert_detections_bulk([
+        {"platform": "youtube", "url": "https://youtu.be/a", "title": "A"},
+        {"platform": "youtube", "url": "https://youtu.be/b", "title": "B"},
+    ])
+    assert len(first) == 2
+
+    second = insert_detections_bulk([
+        {"platform": "youtube", "url": "https://youtu.be/b", "title": "B again"},
+        {"platform": "youtube", "url": "https://youtu.be/c", "title": "C"},
+    ])
+    assert len(second) == 1
+    assert second[0] not in first
+    assert stored_titles() == ["A", "B", "C"]
+
+
+def test_bulk_insert_publishes_one_event_per_new_detection(migrated, fake_redis):
+    pubsub = fake_redis.pubsub()
+    pubsub.subscribe(DETECTION_EVENTS_CHANNEL)
+    assert pubsub.get_message()["type"] == "subscribe"
+    ids = insert_detections_bulk([
+        {"platform": "youtube", "url": "https://youtu.be/a"},
+        {"platform": "youtube", "url": "https://youtu.be/b"},
+    ])
+
+    events = [pubsub.get_message() for _ in ids]
+    assert [int(event["data"]) for event in events] == ids
+
+
+def test_bulk_insert_stores_rows_before_unique_migration(migrated_engine):
+    apply_migrations(migrated_engine, [path for path in MIGRATIONS if path < UNIQUE_MIGRATION])
+    ids = insert_detections_bulk([{"platform": "youtube", "url": "https://youtu.be/a", "title": "A"}])
+    assert len(ids) == 1
+    assert stored_titles() == ["A"]
+
+
+def test_unique_migration_keeps_oldest_duplicate(migrated_engine):
+    apply_migrations(migrated_engine, [path for path in MIGRATIONS if path < UNIQUE_MIGRATION])
+    with get_db_session() as session:
+        for title in ("first", "second"):
+            session.execute(
+                text("INSERT INTO detections (platform, url, title) VALUES ('youtube', 'https://youtu.be/a', :title)"),
+                {"title": title},
+            )
+
+    apply_migrations(migrated_engine, [UNIQUE_MIGRATION])
+    assert stored_titles() == ["first"]
+    assert insert_detections_bulk([{"platform": "youtube", "url": "https://youtu.be/a"}]) == []
+
+
+def test_recent_activity_covers_last_hour_after_watermark(migrated):
+    with get_db_session() as session:
+        session.execute(text("""
+            INSERT INTO detections (id, platform, url, confidence, decision, detected_at) VALUES
+                (1, 'youtube', 'https://youtu.be/seen', 0.95, 'approve', NOW()),
+                (2, 'youtube', 'https://youtu.be/new', 0.95, 'approve', NOW()),
+                (3, 'youtube', 'https://youtu.be/low', 0.5, 'approve', NOW()),
+                (4, 'telegram', 'https://t.me/x/1', 0.95, 'approve', NOW() - INTERVAL '2 hours'),
+                (5, 'telegram', 'https://t.me/x/2', 0.95, 'review', NOW())
+        """))
+
+    detections, platform_activity = AlertNotifier()._fetch_recent_activity(last_seen_id=1)
+
+    assert [detection[:3] for detection in detections] == [(2, "youtube", "https://youtu.be/new")]
+    assert platform_activity == [("youtube", 3), ("telegram", 1)]
@@ -7,6 +7,7 @@ import tempfile
 import os
 from pathlib import Path
 
+from src.fp import video as video_fp
 from src.fp.video import compute_videohash, hamming_distance, is_similar
 from src.fp.audio import compute_audio_fingerprint, compare_audio_fingerprints_from_hashes
 
@@ -39,6 +40,24 @@ class TestVideoFingerprinting:
         # Test different hashes
         assert is_similar("abc123", "def456", threshold=1) == False
     
+    @pytest.mark.skipif(not video_fp.OPENCV_AVAILABLE, reason="OpenCV/imagehash not installed")
+    def test_batch_frame_hashes_match_imagehash(self):
+        """Batched hashes must equal imagehash's so stored fingerprints stay comparable"""
+        import imagehash
+        import numpy as np
+        from PIL import Image
+        
+        rng = np.random.default_rng(0)
+        images = [Image.fromarray(rng.integers(0, 255, (72, 128, 3), dtype=np.uint8)) for _ in range(5)]
+        grids = [video_fp.frame_hash_grids(image) for image in images]
+        
+        hashes = video_fp.batch_frame_hashes([g[0] for g in grids], [g[1] for g in grids])
+        
+        assert hashes == [
+            {"phash": str(imagehash.phash(image)), "dhash": str(imagehash.dhash(image))}
+            for image in images
+        ]
+    
     def test_compute_videohash_fallback(self):
         """Test video hash computation with fallback"""
         # Create a temporary file
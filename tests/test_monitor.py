@@ -0,0 +1,55 @@
+"""
+Tests for candidate queueing in the automation monitor.
+"""
+
+import json
+
+import fakeredis
+import pytest
+
+from src.automation.monitor import AntiPiracyMonitor
+from src.crawler.platforms._common import Candidate
+
+
+@pytest.fixture
+def monitor():
+    # Skip __init__: only the Redis client is needed to queue candidates
+    monitor = AntiPiracyMonitor.__new__(AntiPiracyMonitor)
+    monitor.redis = fakeredis.FakeAsyncRedis()
+    return monitor
+
+
+@pytest.mark.asyncio
+async def test_queue_candidates_skips_seen_urls(monitor):
+    first = [Candidate("youtube", "https://youtu.be/a", "A"), Candidate("youtube", "https://youtu.be/b", "B")]
+    assert await monitor.queue_candidates(first) == 2
+    assert await monitor.queue_candidates(first) == 0
+    assert await monitor.queue_candidates(first + [Candidate("telegram", "https://t.me/c", "C")]) == 1
+
+
+@pytest.mark.asyncio
+async def test_queue_candidates_reserves_consecutive_ids(monitor):
+    await monitor.queue_candidates([Candidate("youtube", "https://youtu.be/a", "A")])
+    await monitor.queue_candidates([
+        Candidate("youtube", "https://youtu.be/b", "B"),
+        Candidate("youtube", "https://youtu.be/c", "C"),
+    ])
+
+    assert await monitor.redis.lrange("ap:candidates", 0, -1) == [b"1", b"2", b"3"]
+    stored = json.loads(await monitor.redis.get("ap:candidate:3"))
+    assert stored["id"] == 3
+    assert stored["url"] == "https://youtu.be/c"
+    assert stored["status"] == "queued"
+
+
+@pytest.mark.asyncio
+async def test_failed_capture_lets_url_be_queued_again(monitor):
+    candidates = [Candidate("youtube", "https://youtu.be/a", "A")]
+    await monitor.queue_candidates(candidates)
+
+    async def fail(data):
+        return {"status": "failed"}
+
+    monitor._capture_candidate = fail
+    assert await monitor.process_pending_candidates() == 0
+    assert await monitor.queue_candidates(candidates) == 1
@@ -0,0 +1,141 @@
+"""
+Tests for the platform search helpers.
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.crawler.platforms import facebook, google, instagram, telegram, twitter, youtube
+from src.crawler.platforms._common import Candidate
+
+
+# Expected outputs are those of the original per-host findall patterns
+@pytest.mark.parametrize("text, expected", [
+    (
+        "Watch https://www.youtube.com/watch?v=abc123 and https://vimeo.com/55 now",
+        {
+            google: ["https://vimeo.com/55", "https://www.youtube.com/watch?v=abc123"],
+            instagram: ["https://www.youtube.com/watch?v=abc123"],
+            twitter: ["https://www.youtube.com/watch?v=abc123"],
+        },
+    ),
+    (
+        # A video URL nested in a Google redirect link
+        "https://www.google.com/url?q=https://www.youtube.com/watch?v=abc123&sa=U",
+        {
+            google: ["https://www.youtube.com/watch?v=abc123"],
+            instagram: ["https://www.youtube.com/watch?v=abc123"],
+            twitter: ["https://www.youtube.com/watch?v=abc123"],
+        },
+    ),
+    (
+        # Comma-joined URLs
+        "link:https://t.me/chan/12,https://youtu.be/q",
+        {
+            google: ["https://t.me/chan/12", "https://youtu.be/q"],
+            instagram: ["https://t.me/chan/12", "https://youtu.be/q"],
+            twitter: ["https://t.me/chan/12", "https://youtu.be/q"],
+        },
+    ),
+    (
+        '<a href="https://instagram.com/reel/R1">reel</a> https://www.instagram.com/p/Xy',
+        {
+            google: ["https://instagram.com/reel/R1", "https://www.instagram.com/p/Xy"],
+            instagram: ["https://instagram.com/reel/R1", "https://www.instagram.com/p/Xy"],
+            twitter: ["https://www.instagram.com/p/Xy"],
+        },
+    ),
+    (
+        "https://www.facebook.com/page/videos/99 https://v.redd.it/zz",
+        {
+            google: ["https://v.redd.it/zz", "https://www.facebook.com/page/videos/99"],
+            instagram: ["https://www.facebook.com/page/videos/99"],
+            twitter: ["https://www.facebook.com/page/videos/99"],
+        },
+    ),
+])
+def test_extract_video_urls_matches_original_patterns(text, expected):
+    for module, urls in expected.items():
+        assert sorted(module.extract_video_urls(text)) == urls
+
+
+def test_extract_video_urls_ignores_lookalike_hosts():
+    assert google.extract_video_urls("https://youtube.com.evil.org/watch?v=x") == []
+
+
+@pytest.mark.parametrize("search", [
+    google.search_candidates,
+    instagram.search_candidates,
+    twitter.search_candidates,
+    telegram.candidates_from_query,
+    facebook.candidates_from_query,
+])
+def test_searches_return_candidates(search):
+    results = search("tapmad live cricket")
+    assert isinstance(results, list)
+    assert results
+    for result in results:
+        assert isinstance(result, Candidate)
+        assert result.url.startswith("https://")
+
+
+def test_youtube_search_result_converts_to_candidate():
+    result = next(youtube._search_simulated(["cricket"], 1))
+    assert result.candidate() == Candidate(result.platform, result.url, result.title)
+
+
+@pytest.mark.asyncio
+async def test_video_details_reuse_cached_answer_on_304(monkeypatch):
+    monkeypatch.setattr(youtube, "_ETAG_CACHE", {})
+    requests_seen = []
+
+    def respond(request):
+        requests_seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, headers={"ETag": '"v1"'}, json={"items": [
+            {"id": "abc", "statistics": {"viewCount": "42"}, "contentDetails": {"duration": "PT5M"}},
+        ]})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(respond)) as client:
+        limit = asyncio.Semaphore(1)
+        first = await youtube._get_video_details_bulk_async(client, ["abc"], limit)
+        second = await youtube._get_video_details_bulk_async(client, ["abc"], limit)
+
+    assert requests_seen == [None, '"v1"']
+    assert first == second == {"abc": {"view_count": 42, "duration": "PT5M"}}
+
+
+def test_cached_search_returns_independent_lists():
+    first = telegram.candidates_from_query("cricket live")
+    first.clear()
+    second = telegram.candidates_from_query("cricket live")
+    assert second
+    assert second == telegram.candidates_from_query("cricket live")
+
+
+def test_simulated_results_are_stable_across_processes():
+    # str hashes are randomized per process; simulated results must not depend on them
+    script = (
+        "from src.crawler.platforms import youtube as y;"
+        "print(next(y._search_simulated(['cricket'], 1)).url,"
+        " y.get_video_metadata('https://youtu.be/abc')['title'],"
+        " next(y.search_by_channel('UC1', 1)).url,"
+        " next(y.get_trending_videos('US', 1)).url)"
+    )
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=Path(__file__).resolve().parents[1],
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True, text=True, check=True,
+        ).stdout.splitlines()[-1]
+        for seed in ("1", "2")
+    }
+    assert len(outputs) == 1